@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+폰트 빌드 벤치마크
+- 실제 GeoRound / SharpEdge / BubblePop 빌드와 대용량 합성 폰트(1k, 11,172, 60k 글리프)의
+  단계별 시간, 최대 RSS, 출력 크기를 측정해 JSON 으로 저장
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import create_fonts
+import create_unique_fonts
+import font_cache
+from glyph_path import GlyphPath, compile_paths
+
+DEFAULT_OUTPUT = os.path.join(ROOT, 'benchmarks', 'results', 'bench_build.json')
+
+REAL_CASES = {
+    'GeoRound': (create_fonts, 'create_geometric_font'),
+    'SharpEdge': (create_unique_fonts, 'create_sharp_font'),
+    'BubblePop': (create_unique_fonts, 'create_bubble_font'),
+}
+SYNTHETIC_SIZES = {
+    'synthetic-1k': 1000,
+    'synthetic-hangul': 11172,    # 현대 한글 완성형 음절 전체
+    'synthetic-60k': 60000,
+}
+ALL_CASES = list(REAL_CASES) + list(SYNTHETIC_SIZES)
+
+
+# ============================================
+# 합성 글리프 세트
+# ============================================
+
+def _base_glyphs():
+    """세 스타일의 모든 글리프를 변형 재료로 사용"""
+    bases = []
+    for module, generator in REAL_CASES.values():
+        for name, glyph in getattr(module, generator)().items():
+            if glyph.get('paths') and name != '.notdef':
+                bases.append(glyph)
+    return bases
+
+
+def create_synthetic_font(count):
+    """기존 글리프를 확대/기울임/이동해 count 개의 서로 다른 글리프 생성"""
+    bases = [(g['width'], compile_paths(g['paths'])) for g in _base_glyphs()]
+    glyphs = {'.notdef': create_fonts.create_notdef_glyph()}
+    for i in range(count):
+        width, base = bases[i % len(bases)]
+        variant = i // len(bases)
+        scale = 0.7 + (variant % 7) * 0.05
+        slant = ((variant // 7) % 5 - 2) * 0.05
+        dx = (variant // 35) % 40
+        xs = base.coords[0::2]
+        ys = base.coords[1::2]
+        coords = array('h', [0]) * len(base.coords)
+        coords[0::2] = array('h', [round(x * scale + y * slant) + dx
+                                   for x, y in zip(xs, ys)])
+        coords[1::2] = array('h', [round(y * scale) for y in ys])
+        glyphs[f'syn{i:05d}'] = {'width': round(width * scale) + dx,
+                                 'paths': GlyphPath(array('B', base.ops), coords)}
+    return glyphs
+
+
+def synthetic_cmap(glyphs):
+    """한글 음절 영역(또는 15번 평면 사용자 영역)에 순서대로 매핑"""
+    names = [n for n in glyphs if n != '.notdef']
+    start = 0xAC00 if len(names) <= 11172 else 0xF0000
+    return {start + i: name for i, name in enumerate(names)}
+
+
+# ============================================
+# 케이스 실행
+# ============================================
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 는 KB, macOS 는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(case, warm_cache=False):
+    """새 프로세스에서 케이스 하나를 실행 (최대 RSS 를 케이스별로 분리)
+
+    실제 build_font 를 호출하고 build_hooks 이벤트로 단계별 시간을 모은다.
+    글리프 캐시는 임시 디렉터리를 쓰며, warm_cache 이면 한 번 미리 빌드해 채운다.
+    """
+    started = time.perf_counter()
+    if case in REAL_CASES:
+        module, generator = REAL_CASES[case]
+        glyphs = getattr(module, generator)()
+        extra_cmap = None
+    else:
+        module = create_unique_fonts
+        glyphs = create_synthetic_font(SYNTHETIC_SIZES[case])
+        extra_cmap = synthetic_cmap(glyphs)
+    generate = time.perf_counter() - started
+
+    stages = {}
+
+    def collect(event):
+        if event['stage'] != 'total':
+            stages[event['stage']] = stages.get(event['stage'], 0.0) + event['seconds']
+
+    font_name = case.replace('-', '')
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        font_cache.CACHE_DIR = os.path.join(tmp, 'cache')
+        output_path = os.path.join(tmp, f'{case}.ttf')
+        if warm_cache:
+            module.build_font(glyphs, font_name, font_name, output_path,
+                              use_cache=False, extra_cmap=extra_cmap)
+        module.build_font(glyphs, font_name, font_name, output_path,
+                          use_cache=False, extra_cmap=extra_cmap, hook=collect)
+        output_bytes = os.path.getsize(output_path)
+
+    return {
+        'case': case,
+        'glyphs': len(glyphs),
+        'glyph_cache': 'warm' if warm_cache else 'cold',
+        'stages': dict({'generate': generate}, **stages),
+        'total': generate + sum(stages.values()),
+        'peak_rss_mb': _peak_rss_mb(),
+        'output_bytes': output_bytes,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """이전 결과와 케이스별 총 시간 비교"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {r['case']: r for r in json.load(f)['results']}
+    print()
+    print(f"📊 기준 결과 대비 ({baseline_path})")
+    for r in results:
+        old = baseline.get(r['case'])
+        if not old:
+            continue
+        change = (r['total'] - old['total']) / old['total'] * 100
+        mark = '⚠️ ' if change > 10 else '  '
+        print(f"  {mark}{r['case']:<18} {old['total']:8.3f}s → {r['total']:8.3f}s "
+              f"({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='폰트 빌드 단계별 벤치마크')
+    parser.add_argument('--cases', nargs='+', choices=ALL_CASES, default=ALL_CASES)
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='케이스별 반복 횟수 (가장 빠른 결과를 기록)')
+    parser.add_argument('--warm-cache', action='store_true',
+                        help='글리프 캐시를 미리 채운 상태에서 측정')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='결과 JSON 경로')
+    parser.add_argument('--compare', metavar='JSON', help='비교할 이전 결과 JSON')
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("  폰트 빌드 벤치마크")
+    print("=" * 78)
+
+    results = []
+    for case in args.cases:
+        runs = []
+        for _ in range(args.repeat):
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                runs.append(executor.submit(run_case, case, args.warm_cache).result())
+        best = min(runs, key=lambda r: r['total'])
+        results.append(best)
+        stages = '  '.join(f"{k}={v * 1000:.0f}ms" for k, v in best['stages'].items())
+        print(f"✅ {case:<18} {best['glyphs']:>6} glyphs  {best['total']:7.3f}s  "
+              f"RSS {best['peak_rss_mb']:6.1f}MB  {best['output_bytes']:>10,} bytes")
+        print(f"   {stages}")
+
+    report = {
+        'commit': _git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print()
+    print(f"📁 결과 저장: {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
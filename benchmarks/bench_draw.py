@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+글리프 그리기 마이크로 벤치마크
+- 기존 if/elif 문자열 비교 디스패치와 컴파일된 opcode 재생 엔진의 초당 글리프 처리량 비교
+- draw_paths 는 튜플 경로를 컴파일하지 않고 바로 그리므로 기존 디스패치와 같은 수준이어야 함
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fontTools.pens.basePen import NullPen
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+import create_fonts
+import create_unique_fonts
+from glyph_path import compile_paths, draw_paths, tt_glyph
+
+
+def legacy_draw_glyph(pen, paths):
+    """변경 전 draw_glyph (문자열 비교 if/elif 체인) - 기준선"""
+    for path in paths:
+        for item in path:
+            cmd = item[0]
+            if cmd == 'moveTo':
+                pen.moveTo(item[1])
+            elif cmd == 'lineTo':
+                pen.lineTo(item[1])
+            elif cmd == 'qCurveTo':
+                if len(item) == 3:
+                    pen.qCurveTo(item[1], item[2])
+            elif cmd == 'closePath':
+                pen.closePath()
+
+
+def load_all_paths():
+    """세 가지 스타일의 모든 글리프 경로"""
+    all_paths = []
+    for generator in (create_fonts.create_geometric_font,
+                      create_unique_fonts.create_sharp_font,
+                      create_unique_fonts.create_bubble_font):
+        # 한글 음절 등 합성 글리프는 그릴 윤곽선이 없으므로 제외
+        all_paths.extend(g.get('paths', []) for g in generator().values()
+                         if 'components' not in g)
+    return all_paths
+
+
+def run(label, build, items, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for item in items:
+            build(item)
+    elapsed = time.perf_counter() - started
+    rate = len(items) * rounds / elapsed
+    print(f"   {label:<36} {rate:>12,.0f} glyphs/sec")
+    return rate
+
+
+def legacy_tt_glyph(paths):
+    pen = TTGlyphPen(None)
+    legacy_draw_glyph(pen, paths)
+    return pen.glyph()
+
+
+def paths_tt_glyph(paths):
+    pen = TTGlyphPen(None)
+    draw_paths(pen, paths)
+    return pen.glyph()
+
+
+def replay_tt_glyph(glyph_path):
+    pen = TTGlyphPen(None)
+    glyph_path.draw(pen)
+    return pen.glyph()
+
+
+def null_draw(draw):
+    def build(item):
+        draw(NullPen(), item)
+    return build
+
+
+def main():
+    parser = argparse.ArgumentParser(description='글리프 그리기 처리량 벤치마크')
+    parser.add_argument('--rounds', type=int, default=200,
+                        help='전체 글리프 세트 반복 횟수')
+    args = parser.parse_args()
+
+    paths = load_all_paths()
+    compiled = [compile_paths(p) for p in paths]
+
+    print("=" * 64)
+    print(f"  글리프 그리기 벤치마크 - {len(paths)}개 글리프 x {args.rounds}회")
+    print("=" * 64)
+
+    print()
+    print("🖊️  NullPen (명령 디스패치만)")
+    run('if/elif 문자열 비교 (기존)', null_draw(legacy_draw_glyph), paths, args.rounds)
+    run('draw_paths (튜플 경로)', null_draw(draw_paths), paths, args.rounds)
+    run('opcode 테이블 재생 (GlyphPath.draw)', null_draw(lambda pen, gp: gp.draw(pen)), compiled, args.rounds)
+
+    print()
+    print("🔤 glyf 글리프 생성")
+    before = run('if/elif + TTGlyphPen (기존)', legacy_tt_glyph, paths, args.rounds)
+    run('draw_paths + TTGlyphPen (튜플 경로)', paths_tt_glyph, paths, args.rounds)
+    run('opcode 재생 + TTGlyphPen', replay_tt_glyph, compiled, args.rounds)
+    run('컴파일 + tt_glyph (빌더 경로)', lambda p: tt_glyph(compile_paths(p)),
+        paths, args.rounds)
+    after = run('tt_glyph (미리 컴파일)', tt_glyph, compiled, args.rounds)
+    print(f"   → 미리 컴파일한 경로: 기존 대비 {after / before:.2f}배")
+
+
+if __name__ == '__main__':
+    main()
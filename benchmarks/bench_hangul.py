@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+한글 출력 방식 벤치마크 - 완성형 합성 글리프(precomposed) vs 자모 조합(jamo)
+- GeoRound / SharpEdge 를 두 방식으로 빌드해 빌드 시간, 형식별 파일 크기,
+  글리프 수, 주요 테이블 크기를 비교하고 JSON 으로 저장
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fontTools.ttLib import TTFont
+
+import create_fonts
+import create_unique_fonts
+import font_cache
+import font_export
+import hangul
+
+DEFAULT_OUTPUT = os.path.join(ROOT, 'benchmarks', 'results', 'bench_hangul.json')
+
+CASES = {
+    'GeoRound': (create_fonts, 'create_geometric_font'),
+    'SharpEdge': (create_unique_fonts, 'create_sharp_font'),
+}
+FORMATS = ('ttf', 'woff2')
+# 두 방식에서 크기가 달라지는 테이블
+TABLES = ('glyf', 'loca', 'hmtx', 'cmap', 'post', 'GSUB')
+
+
+def run_case(case, mode):
+    """새 프로세스에서 한 스타일을 한 방식으로 빌드"""
+    module, generator = CASES[case]
+    glyphs = getattr(module, generator)()
+
+    stages = {}
+
+    def collect(event):
+        if event['stage'] != 'total':
+            stages[event['stage']] = stages.get(event['stage'], 0.0) + event['seconds']
+
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        font_cache.CACHE_DIR = os.path.join(tmp, 'cache')
+        output_path = os.path.join(tmp, f'{case}.ttf')
+        started = time.perf_counter()
+        module.build_font(glyphs, case, case, output_path, use_cache=False,
+                          hook=collect, formats=FORMATS, hangul_mode=mode)
+        seconds = time.perf_counter() - started
+
+        sizes = {fmt: os.path.getsize(path) for fmt, path in
+                 font_export.output_paths(output_path, FORMATS).items()}
+        font = TTFont(output_path)
+        tables = {tag: font.reader.tables[tag].length
+                  for tag in TABLES if tag in font.reader}
+        glyph_count = len(font.getGlyphOrder())
+        font.close()
+
+    return {
+        'case': case,
+        'mode': mode,
+        'glyphs': glyph_count,
+        'seconds': seconds,
+        'stages': stages,
+        'sizes': sizes,
+        'tables': tables,
+    }
+
+
+def print_comparison(results):
+    """스타일별로 precomposed 대비 jamo 의 변화율 출력"""
+    by_case = {}
+    for r in results:
+        by_case.setdefault(r['case'], {})[r['mode']] = r
+    print()
+    print("📊 precomposed → jamo")
+    for case, modes in by_case.items():
+        if len(modes) < 2:
+            continue
+        old, new = modes['precomposed'], modes['jamo']
+        parts = [f"build {old['seconds']:.2f}s → {new['seconds']:.2f}s"]
+        for fmt in FORMATS:
+            change = (new['sizes'][fmt] - old['sizes'][fmt]) / old['sizes'][fmt] * 100
+            parts.append(f"{fmt} {old['sizes'][fmt]:,}B → {new['sizes'][fmt]:,}B "
+                         f"({change:+.0f}%)")
+        print(f"  {case:<10} " + ', '.join(parts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='한글 출력 방식별 크기/빌드 시간 비교')
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    parser.add_argument('--modes', nargs='+', choices=hangul.HANGUL_MODES,
+                        default=list(hangul.HANGUL_MODES))
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='반복 횟수 (가장 빠른 결과를 기록)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='결과 JSON 경로')
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("  한글 출력 방식 벤치마크 (precomposed / jamo)")
+    print("=" * 78)
+
+    results = []
+    for case in args.cases:
+        for mode in args.modes:
+            runs = []
+            for _ in range(args.repeat):
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    runs.append(executor.submit(run_case, case, mode).result())
+            best = min(runs, key=lambda r: r['seconds'])
+            results.append(best)
+            sizes = '  '.join(f"{fmt} {size:>9,}B" for fmt, size in best['sizes'].items())
+            tables = '  '.join(f"{tag}={size:,}" for tag, size in best['tables'].items())
+            print(f"✅ {case:<10} {mode:<12} {best['glyphs']:>6} glyphs  "
+                  f"{best['seconds']:6.2f}s  {sizes}")
+            print(f"   {tables}")
+
+    print_comparison(results)
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print()
+    print(f"📁 결과 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+줄바꿈 / 크기 맞춤 처리량 벤치마크 (text_layout)
+- 한글 / 라틴 혼합 합성 캡션으로 폰트와 줄바꿈 방식별 준비(NumPy), 줄바꿈, 크기 맞춤
+  (이분 탐색) 시간과 분당 처리 캡션 수를 측정해 JSON 으로 저장 (단일 프로세스)
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import text_layout
+import text_metrics
+
+DEFAULT_OUTPUT = os.path.join(ROOT, 'benchmarks', 'results', 'bench_layout.json')
+FONT_DIR = os.path.join(ROOT, 'fonts')
+DEFAULT_FONTS = ['NanumGothic-Regular.ttf', 'NanumMyeongjo-Regular.ttf', 'GeoRound-Regular.ttf']
+
+_WORDS = ['오늘', '새로운', '한글', '폰트가', '출시되었습니다', '지금', '바로', '무료로',
+          '다운로드하세요', '가을', '맞이', '특별', '할인', '최대', '50%', 'SALE', 'New',
+          'Korean', 'fonts', 'for', 'the', 'web', '(한정판)', '이벤트!', '2024년']
+
+
+def make_captions(count, seed=0):
+    """단어 3~14개로 된 합성 캡션"""
+    rng = random.Random(seed)
+    return [' '.join(rng.choices(_WORDS, k=rng.randint(3, 14))) for _ in range(count)]
+
+
+def run_case(captions, font, word_break, width, height):
+    started = time.perf_counter()
+    prepared = text_layout.PreparedText(captions, font, word_break)
+    prepare = time.perf_counter() - started
+
+    started = time.perf_counter()
+    width_units = width * prepared.units_per_em / 24
+    lines = sum(len(prepared.lines(i, width_units)) for i in range(len(prepared)))
+    breaking = time.perf_counter() - started
+
+    started = time.perf_counter()
+    sizes = [prepared.fit_size(i, width, height) for i in range(len(prepared))]
+    fitting = time.perf_counter() - started
+
+    total = prepare + fitting
+    return {
+        'font': prepared.metrics.name,
+        'word_break': word_break,
+        'captions': len(captions),
+        'prepare_seconds': prepare,
+        'break_seconds': breaking,
+        'fit_seconds': fitting,
+        'lines_at_24px': lines,
+        'mean_fit_size': sum(sizes) / len(sizes),
+        'captions_per_minute': len(captions) / total * 60,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='줄바꿈 / 크기 맞춤 처리량')
+    parser.add_argument('--captions', type=int, default=100_000, help='합성 캡션 수')
+    parser.add_argument('--fonts', nargs='+', default=DEFAULT_FONTS)
+    parser.add_argument('--word-breaks', nargs='+', choices=text_layout.WORD_BREAKS,
+                        default=list(text_layout.WORD_BREAKS))
+    parser.add_argument('--width', type=float, default=320, help='상자 폭 (px)')
+    parser.add_argument('--height', type=float, default=120, help='상자 높이 (px)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='결과 JSON 경로')
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"  줄바꿈 / 크기 맞춤 벤치마크 - 캡션 {args.captions:,}개, "
+          f"{args.width:g}×{args.height:g}px")
+    print("=" * 78)
+
+    captions = make_captions(args.captions)
+    for font in args.fonts:
+        text_metrics.get_metrics(font, FONT_DIR)    # 메트릭 캐시 준비는 측정에서 제외
+
+    results = []
+    for font in args.fonts:
+        for word_break in args.word_breaks:
+            metrics = text_metrics.get_metrics(font, FONT_DIR)
+            r = run_case(captions, metrics, word_break, args.width, args.height)
+            results.append(r)
+            print(f"✅ {r['font']:<28} {word_break:<9} 준비 {r['prepare_seconds']:6.2f}s  "
+                  f"줄바꿈 {r['break_seconds']:6.2f}s  크기 맞춤 {r['fit_seconds']:6.2f}s  "
+                  f"→ {r['captions_per_minute']:>9,.0f}개/분")
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'box': [args.width, args.height],
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print()
+    print(f"📁 결과 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+윤곽선 형식 벤치마크 - glyf (윤곽선 중복 제거 전/후) vs CFF vs CFF2 (서브루틴화 전/후)
+- 실제 스타일을 윤곽선 형식별로 빌드해 빌드 시간(단계별), sfnt / woff2 크기,
+  윤곽선 테이블 크기를 나란히 비교하고 JSON 으로 저장
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fontTools.ttLib import TTFont
+
+import create_fonts
+import create_unique_fonts
+import font_cache
+import font_export
+
+DEFAULT_OUTPUT = os.path.join(ROOT, 'benchmarks', 'results', 'bench_outline.json')
+
+CASES = {
+    'GeoRound': (create_fonts, 'create_geometric_font'),
+    'SharpEdge': (create_unique_fonts, 'create_sharp_font'),
+    'BubblePop': (create_unique_fonts, 'create_bubble_font'),
+}
+# 변형 이름: (윤곽선 형식, 서브루틴화, 윤곽선 중복 제거)
+VARIANTS = {
+    'glyf': ('glyf', False, True),
+    'glyf-dup': ('glyf', False, False),
+    'cff': ('cff', False, False),
+    'cff+subr': ('cff', True, False),
+    'cff2+subr': ('cff2', True, False),
+}
+FORMATS = ('ttf', 'woff2')
+OUTLINE_TABLES = ('glyf', 'loca', 'CFF ', 'CFF2')
+
+
+def run_case(case, variant):
+    """새 프로세스에서 한 스타일을 한 윤곽선 형식으로 빌드"""
+    module, generator = CASES[case]
+    outline, subroutinize, dedupe = VARIANTS[variant]
+    glyphs = getattr(module, generator)()
+
+    stages = {}
+
+    def collect(event):
+        if event['stage'] != 'total':
+            stages[event['stage']] = stages.get(event['stage'], 0.0) + event['seconds']
+
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        font_cache.CACHE_DIR = os.path.join(tmp, 'cache')
+        output_path = os.path.join(tmp, f'{case}.ttf')
+        started = time.perf_counter()
+        module.build_font(glyphs, case, case, output_path, use_cache=False, hook=collect,
+                          formats=FORMATS, outline=outline, subroutinize=subroutinize,
+                          dedupe=dedupe)
+        seconds = time.perf_counter() - started
+
+        paths = font_export.output_paths(output_path,
+                                         font_export.sfnt_formats(FORMATS, outline))
+        sizes = {fmt: os.path.getsize(path) for fmt, path in paths.items()}
+        font = TTFont(next(iter(paths.values())))
+        outline_bytes = sum(font.reader.tables[tag].length
+                            for tag in OUTLINE_TABLES if tag in font.reader)
+        font.close()
+
+    return {
+        'case': case,
+        'variant': variant,
+        'glyphs': len(glyphs),
+        'seconds': seconds,
+        'stages': stages,
+        'sizes': sizes,
+        # sfnt 크기는 형식 이름(ttf/otf)과 관계없이 한 키로도 기록
+        'sfnt_bytes': next(iter(sizes.values())),
+        'outline_bytes': outline_bytes,
+    }
+
+
+def print_table(results):
+    """스타일별로 glyf 대비 변화율 표 출력"""
+    print()
+    print(f"  {'font':<10} {'variant':<10} {'build':>8} {'sfnt':>11} {'woff2':>9} "
+          f"{'outline tables':>15}")
+    base = {r['case']: r for r in results if r['variant'] == 'glyf'}
+    for r in results:
+        ref = base.get(r['case'])
+        change = ''
+        if ref and r is not ref:
+            change = (f"  (sfnt {(r['sfnt_bytes'] - ref['sfnt_bytes']) / ref['sfnt_bytes']:+.0%},"
+                      f" woff2 {(r['sizes']['woff2'] - ref['sizes']['woff2']) / ref['sizes']['woff2']:+.0%})")
+        print(f"  {r['case']:<10} {r['variant']:<10} {r['seconds']:7.2f}s "
+              f"{r['sfnt_bytes']:>10,}B {r['sizes']['woff2']:>8,}B "
+              f"{r['outline_bytes']:>14,}B{change}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='윤곽선 형식별 크기/빌드 시간 비교')
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    parser.add_argument('--variants', nargs='+', choices=list(VARIANTS),
+                        default=list(VARIANTS))
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='반복 횟수 (가장 빠른 결과를 기록)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='결과 JSON 경로')
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("  윤곽선 형식 벤치마크 (glyf / CFF / CFF2)")
+    print("=" * 78)
+
+    results = []
+    for case in args.cases:
+        for variant in args.variants:
+            runs = []
+            for _ in range(args.repeat):
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    runs.append(executor.submit(run_case, case, variant).result())
+            best = min(runs, key=lambda r: r['seconds'])
+            results.append(best)
+            stages = '  '.join(f"{k}={v * 1000:.0f}ms" for k, v in best['stages'].items())
+            print(f"✅ {case:<10} {variant:<10} {best['seconds']:7.2f}s")
+            print(f"   {stages}")
+
+    print_table(results)
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print()
+    print(f"📁 결과 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+글리프 비트맵 캐시 벤치마크 (glyph_raster_cache)
+- 합성 캡션을 (repeat 번 반복해) 캐시 없음 / 프로세스 안 LRU / 공유 메모리 캐시로 렌더링해
+  캡션당 시간, 적중률, 교체 횟수를 비교하고 JSON 으로 저장
+- 공유 메모리 캐시는 워커 여러 개가 한 캐시를 같이 쓰는 경우도 측정
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import font_render
+import glyph_raster_cache
+import text_metrics
+from bench_layout import make_captions
+from cli_options import positive_int
+
+DEFAULT_OUTPUT = os.path.join(ROOT, 'benchmarks', 'results', 'bench_raster_cache.json')
+FONT_DIR = os.path.join(ROOT, 'fonts')
+DEFAULT_FONTS = ['NanumGothic-Regular.ttf', 'GeoRound-Regular.ttf']
+
+WIDTH, HEIGHT = 480, 120
+
+
+def render_captions(path, captions, cache):
+    """캡션을 모두 그린 시간 (초)"""
+    renderer = font_render.FontRenderer(path, cache)
+    started = time.perf_counter()
+    for text in captions:
+        renderer.render(text, WIDTH, HEIGHT)
+    seconds = time.perf_counter() - started
+    renderer.close()
+    return seconds
+
+
+def _worker(path, captions):
+    return render_captions(path, captions, font_render._CACHE)
+
+
+def run_font(path, captions, cache_mb, jobs):
+    cache_bytes = int(cache_mb * 1024 * 1024)
+    results = []
+    for mode in ('none', 'local', 'shared'):
+        cache = (None if mode == 'none' else
+                 glyph_raster_cache.RasterCache(cache_bytes) if mode == 'local' else
+                 glyph_raster_cache.SharedRasterCache.create(cache_bytes))
+        seconds = render_captions(path, captions, cache)
+        stats = cache.stats() if cache else {}
+        if mode == 'shared':
+            cache.close()
+        results.append({'font': os.path.basename(path), 'mode': mode, 'jobs': 1,
+                        'captions': len(captions), 'seconds': seconds, **stats})
+
+    # 워커 여러 개가 공유 캐시 하나를 같이 씀 (캡션을 나눠 그림)
+    shared = glyph_raster_cache.SharedRasterCache.create(cache_bytes)
+    try:
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=jobs, initializer=font_render._init_worker,
+                                 initargs=(shared.spec,)) as executor:
+            chunks = [captions[i::jobs] for i in range(jobs)]
+            list(executor.map(_worker, [path] * jobs, chunks))
+        seconds = time.perf_counter() - started
+        results.append({'font': os.path.basename(path), 'mode': 'shared', 'jobs': jobs,
+                        'captions': len(captions), 'seconds': seconds, **shared.stats()})
+    finally:
+        shared.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='글리프 비트맵 캐시 적중률 / 속도')
+    parser.add_argument('--captions', type=int, default=300, help='합성 캡션 수')
+    parser.add_argument('--fonts', nargs='+', default=DEFAULT_FONTS)
+    parser.add_argument('--repeat', type=int, default=2,
+                        help='같은 캡션을 다시 그리는 횟수 (서비스의 반복 렌더링)')
+    parser.add_argument('--cache-mb', type=float, default=glyph_raster_cache.RASTER_CACHE_MAX_MB)
+    parser.add_argument('-j', '--jobs', type=positive_int, default=max(os.cpu_count() or 1, 2),
+                        help='공유 캐시 측정에 쓸 워커 수')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='결과 JSON 경로')
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"  글리프 비트맵 캐시 벤치마크 - 캡션 {args.captions:,}개 × {args.repeat}, "
+          f"{WIDTH}×{HEIGHT}px, 캐시 {args.cache_mb:g}MB")
+    print("=" * 78)
+
+    captions = make_captions(args.captions) * args.repeat
+    results = []
+    for font in args.fonts:
+        path = os.path.join(FONT_DIR, font)
+        text_metrics.get_metrics(path)      # 메트릭 캐시 준비는 측정에서 제외
+        rows = run_font(path, captions, args.cache_mb, args.jobs)
+        base = rows[0]['seconds']
+        for r in rows:
+            rate = f"적중 {r['hit_rate']:5.1%}, 교체 {r['evictions']:,}" if 'hit_rate' in r else ''
+            print(f"✅ {r['font']:<26} {r['mode']:<6} ×{r['jobs']}  "
+                  f"{r['seconds'] / r['captions'] * 1000:6.2f}ms/캡션  "
+                  f"(×{base / r['seconds']:4.1f})  {rate}")
+        results.extend(rows)
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'cache_mb': args.cache_mb,
+        'repeat': args.repeat,
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print()
+    print(f"📁 결과 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+파생 스타일 변환 벤치마크
+- 글리프마다 튜플 좌표를 도는 Python 루프와 NumPy 변환 엔진(glyph_transform)의
+  스타일 변형 하나당 시간 비교 (엔진은 배열 연산 / 글리프 dict 되돌리기 단계를 따로 표시)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fontTools.misc.transform import Transform
+
+import create_fonts
+import create_unique_fonts
+import glyph_transform
+from glyph_path import GlyphPath, compile_paths, embolden
+
+CASES = {
+    'GeoRound': create_fonts.create_geometric_font,
+    'SharpEdge': create_unique_fonts.create_sharp_font,
+    'BubblePop': create_unique_fonts.create_bubble_font,
+}
+
+
+def loop_transform(glyphs, transform):
+    """글리프마다 점 튜플을 하나씩 변환하는 기준선 (합성 글리프는 M·T·M⁻¹)"""
+    m = Transform(*transform)
+    inverse = m.inverse()
+    result = {}
+    for name, glyph in glyphs.items():
+        if 'components' in glyph:
+            components = [(base, tuple(m.transform(t).transform(inverse)))
+                          for base, t in glyph['components']]
+            result[name] = {'width': glyph['width'] * m.xx, 'components': components}
+            continue
+        path = compile_paths(glyph.get('paths', []))
+        c = path.coords
+        points = m.transformPoints(list(zip(c[0::2], c[1::2])))
+        coords = [round(v) for point in points for v in point]
+        result[name] = {'width': glyph['width'] * m.xx,
+                        'paths': GlyphPath(path.ops, type(c)('h', coords))}
+    return result
+
+
+def loop_derive(glyphs, options):
+    """glyph_transform.derive 와 같은 순서를 글리프 단위 Python 루프로"""
+    sx, sy = options.get('scale', (1.0, 1.0))
+    if (sx, sy) != (1.0, 1.0):
+        glyphs = loop_transform(glyphs, glyph_transform.scale(sx, sy))
+    stroke = options.get('stroke', 0)
+    if stroke:
+        referenced = {base for g in glyphs.values() for base, _ in g.get('components', [])}
+        bold = {}
+        for name, glyph in glyphs.items():
+            if 'components' in glyph:
+                bold[name] = glyph
+                continue
+            paths = embolden(glyph.get('paths', []), stroke)
+            if name in referenced:
+                bold[name] = {'width': glyph['width'], 'paths': paths}
+            else:
+                bold[name] = {'width': glyph['width'] + 2 * stroke,
+                              'paths': paths.translated(stroke, 0)}
+        glyphs = bold
+    if options.get('slant'):
+        glyphs = loop_transform(glyphs, glyph_transform.slant(options['slant']))
+    tracking = options.get('tracking', 0)
+    if tracking:
+        referenced = {base for g in glyphs.values() for base, _ in g.get('components', [])}
+        tracked = {}
+        for name, glyph in glyphs.items():
+            if name in referenced:
+                tracked[name] = glyph
+            elif 'components' in glyph:
+                components = [(base, tuple(t[:4]) + (t[4] + tracking / 2, t[5]))
+                              for base, t in glyph['components']]
+                tracked[name] = {'width': glyph['width'] + tracking, 'components': components}
+            else:
+                tracked[name] = {'width': glyph['width'] + tracking,
+                                 'paths': glyph['paths'].translated(round(tracking / 2), 0)}
+        glyphs = tracked
+    return glyphs
+
+
+def best_of(rounds, function):
+    times = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='파생 스타일 변환 벤치마크')
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    parser.add_argument('--rounds', type=int, default=3, help='반복 횟수 (가장 빠른 값)')
+    args = parser.parse_args()
+
+    presets = glyph_transform.STYLE_PRESETS
+    print("=" * 72)
+    print(f"  파생 스타일 변환 벤치마크 - 스타일 {len(presets)}개")
+    print("=" * 72)
+
+    for case in args.cases:
+        glyphs = CASES[case]()
+        started = time.perf_counter()
+        outlines = glyph_transform.OutlineArray.from_glyphs(glyphs)
+        outlines.structure.neighbors()
+        load = time.perf_counter() - started
+
+        print()
+        print(f"🔤 {case}: 글리프 {len(glyphs):,}개, 점 {len(outlines.coords):,}개 "
+              f"(배열 적재 + 이웃 점 {load * 1000:.0f}ms, 한 번만)")
+        print(f"   {'style':<14} {'Python 루프':>12} {'NumPy 변환':>11} {'되돌리기':>9} {'배율':>7}")
+        total_loop = total_numpy = 0.0
+        for preset, options in presets.items():
+            loop = best_of(args.rounds, lambda: loop_derive(glyphs, options))
+            array_only = best_of(args.rounds, lambda: glyph_transform.derive(
+                outlines, options.get('slant', 0), options.get('scale', (1.0, 1.0)),
+                options.get('stroke', 0), options.get('tracking', 0), to_glyphs=False))
+            full = best_of(args.rounds, lambda: glyph_transform.derive_preset(outlines, preset))
+            total_loop += loop
+            total_numpy += full
+            print(f"   {preset:<14} {loop * 1000:>10.1f}ms {array_only * 1000:>9.2f}ms "
+                  f"{(full - array_only) * 1000:>7.1f}ms {loop / full:>6.1f}x")
+        print(f"   → 전체 {total_loop * 1000:.0f}ms → {total_numpy * 1000:.0f}ms "
+              f"({total_loop / total_numpy:.1f}배)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+WOFF2 압축 벤치마크 - 격자 맞춤 / 윤곽선 정규화 / 글리프 순서 변경 전후 크기 비교 (glyph_normalize)
+- 생성 폰트: 스타일마다 build_font 옵션만 바꿔 빌드
+- 함께 배포하는 한글 폰트: 라틴 + KS X 1001 음절 2,350자 부분 집합에 같은 변환을 적용
+  (변환이 힌팅을 지우므로 기준선도 힌팅 없이 부분 집합을 만들어 비교)
+"""
+
+import argparse
+import contextlib
+import glob
+import importlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fontTools import subset
+from fontTools.ttLib import TTFont
+
+import build_all_fonts
+import font_cache
+import font_export
+import glyph_normalize
+import hangul
+import subset_fonts
+from cli_options import positive_int
+
+DEFAULT_OUTPUT = os.path.join(ROOT, 'benchmarks', 'results', 'bench_woff2.json')
+FONT_DIR = os.path.join(ROOT, 'fonts')
+
+# 변형 이름: (격자, 윤곽선 정규화, 글리프 순서)
+VARIANTS = {
+    'base': (0, False, 'source'),
+    'grid2': (2, False, 'source'),
+    'grid4': (4, False, 'source'),
+    'contours': (0, True, 'source'),
+    'initial': (0, False, 'initial'),
+    'medial': (0, False, 'medial'),
+    'all': (4, True, 'initial'),
+}
+
+
+def _woff2_size(font):
+    buf = io.BytesIO()
+    font.save(buf)
+    data = buf.getvalue()
+    return len(data), len(font_export.convert(data, 'woff2'))
+
+
+# ============================================
+# 생성 폰트
+# ============================================
+
+def run_generated(style, variant, hangul_mode):
+    """새 프로세스에서 생성 스타일 하나를 변형 옵션으로 빌드"""
+    module_name, generator, font_name, family_name, _ = style
+    grid, normalize, order = VARIANTS[variant]
+    module = importlib.import_module(module_name)
+    glyphs = getattr(module, generator)()
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        font_cache.CACHE_DIR = os.path.join(tmp, 'cache')
+        output_path = os.path.join(tmp, f'{font_name}.ttf')
+        module.build_font(glyphs, font_name, family_name, output_path, use_cache=False,
+                          formats=('ttf', 'woff2'), hangul_mode=hangul_mode,
+                          grid=grid, normalize=normalize, order=order)
+        paths = font_export.output_paths(output_path, ('ttf', 'woff2'))
+        sizes = {fmt: os.path.getsize(path) for fmt, path in paths.items()}
+    return {'font': font_name, 'source': 'generated', 'variant': variant,
+            'ttf': sizes['ttf'], 'woff2': sizes['woff2']}
+
+
+# ============================================
+# 함께 배포하는 폰트 (부분 집합)
+# ============================================
+
+def bundled_fonts(font_dir=FONT_DIR):
+    """fonts/ 의 정적 TTF 중 생성 폰트와 가변 폰트를 뺀 목록"""
+    generated = {os.path.basename(style[4]) for style in build_all_fonts.discover_styles()}
+    return [path for path in sorted(glob.glob(os.path.join(font_dir, '*.ttf')))
+            if os.path.basename(path) not in generated and not path.endswith('-VF.ttf')]
+
+
+def subset_codepoints():
+    latin = [cp for start, end in subset_fonts.LATIN_RANGES for cp in range(start, end + 1)]
+    return latin + subset_fonts.ks_x_1001_hangul()
+
+
+def _subset_bytes(path):
+    font = TTFont(path, recalcTimestamp=False)
+    options = subset.Options()
+    options.hinting = False
+    options.notdef_outline = True
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=subset_codepoints())
+    subsetter.subset(font)
+    buf = io.BytesIO()
+    font.save(buf)
+    font.close()
+    return buf.getvalue()
+
+
+def run_bundled(path, variants):
+    """한 폰트의 부분 집합을 만들고 변형마다 glyph_normalize.normalize_font 적용"""
+    data = _subset_bytes(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    results = []
+    for variant in variants:
+        grid, normalize, order = VARIANTS[variant]
+        font = TTFont(io.BytesIO(data), recalcTimestamp=False)
+        started = time.perf_counter()
+        glyph_normalize.normalize_font(font, grid, normalize, order)
+        seconds = time.perf_counter() - started
+        ttf, woff2 = _woff2_size(font)
+        font.close()
+        results.append({'font': name, 'source': 'bundled', 'variant': variant,
+                        'ttf': ttf, 'woff2': woff2, 'seconds': seconds})
+    return results
+
+
+def print_table(results, variants):
+    """폰트별 변형 WOFF2 크기 (base 대비 변화율)"""
+    print()
+    print(f"  {'font':<28}" + ''.join(f"{v:>18}" for v in variants))
+    rows = {}
+    for r in results:
+        rows.setdefault((r['source'], r['font']), {})[r['variant']] = r['woff2']
+    totals = dict.fromkeys(variants, 0)
+    for (source, font), sizes in rows.items():
+        base = sizes.get('base')
+        cells = []
+        for variant in variants:
+            size = sizes[variant]
+            totals[variant] += size
+            change = f" {(size - base) / base:+5.1%}" if base and variant != 'base' else ''
+            cells.append(f"{size:>10,}{change:>7}")
+        label = f"{font}{' *' if source == 'bundled' else ''}"
+        print(f"  {label:<28}" + ''.join(f"{c:>18}" for c in cells))
+    base = totals.get('base')
+    print(f"  {'합계':<26}" + ''.join(
+        f"{totals[v]:>11,}{(f' {(totals[v] - base) / base:+5.1%}' if base and v != 'base' else ''):>7}"
+        for v in variants))
+    print("  (* 라틴 + KS X 1001 음절 부분 집합, 힌팅 없음)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='격자 맞춤 / 윤곽선 정규화 / 글리프 순서별 WOFF2 크기')
+    parser.add_argument('--variants', nargs='+', choices=list(VARIANTS), default=list(VARIANTS))
+    parser.add_argument('--fonts', nargs='+', metavar='NAME',
+                        help='함께 배포하는 폰트 중 비교할 것 (예: NanumGothic-Regular)')
+    parser.add_argument('--no-generated', action='store_true', help='생성 폰트는 건너뜀')
+    parser.add_argument('--no-bundled', action='store_true', help='함께 배포하는 폰트는 건너뜀')
+    parser.add_argument('--hangul-mode', default='precomposed', choices=hangul.HANGUL_MODES,
+                        help='생성 폰트의 한글 출력 방식 (precomposed / jamo)')
+    parser.add_argument('-j', '--jobs', type=positive_int, default=os.cpu_count())
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='결과 JSON 경로')
+    args = parser.parse_args()
+    variants = ['base'] + [v for v in args.variants if v != 'base']
+
+    print("=" * 78)
+    print("  WOFF2 압축 벤치마크 (glyph_normalize)")
+    print("=" * 78)
+
+    started = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = []
+        if not args.no_generated:
+            for style in build_all_fonts.discover_styles():
+                for variant in variants:
+                    futures.append(executor.submit(run_generated, style, variant,
+                                                   args.hangul_mode))
+        if not args.no_bundled:
+            paths = bundled_fonts()
+            if args.fonts:
+                paths = [p for p in paths
+                         if os.path.splitext(os.path.basename(p))[0] in args.fonts]
+            for path in paths:
+                futures.append(executor.submit(run_bundled, path, variants))
+        for future in futures:
+            result = future.result()
+            for r in result if isinstance(result, list) else [result]:
+                results.append(r)
+                if r['variant'] == 'base':
+                    print(f"✅ {r['font']:<28} ttf {r['ttf']:>10,}B  woff2 {r['woff2']:>9,}B")
+
+    print_table(results, variants)
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'hangul_mode': args.hangul_mode,
+        'variants': {v: dict(zip(('grid', 'normalize', 'order'), VARIANTS[v])) for v in variants},
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print()
+    print(f"📁 결과 저장: {args.output} ({time.perf_counter() - started:.0f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+전체 폰트 병렬 빌드 드라이버
+- create_fonts / create_unique_fonts 의 스타일 생성기를 모아 프로세스 풀에서 빌드
+"""
+
+import argparse
+import importlib
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import font_cff
+import font_export
+import glyph_normalize
+import hangul
+from cli_options import positive_int
+
+# 스타일 생성기를 제공하는 모듈 (각 모듈의 FONT_STYLES 를 읽는다)
+STYLE_MODULES = ['create_fonts', 'create_unique_fonts']
+
+
+def discover_styles(module_names=STYLE_MODULES):
+    """모든 모듈에서 빌드 대상 스타일 목록 수집"""
+    styles = []
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        for generator, font_name, family_name, output_path in module.FONT_STYLES:
+            styles.append((module_name, generator.__name__, font_name,
+                           family_name, output_path))
+    return styles
+
+
+def build_style(module_name, generator_name, font_name, family_name, output_path,
+                use_cache=True, formats=('ttf',), hangul_mode='precomposed',
+                outline='glyf', subroutinize=True, dedupe=True, simplify=0,
+                grid=0, normalize=False, order='source'):
+    """워커 프로세스에서 스타일 하나를 빌드하고 결과를 반환"""
+    started = time.perf_counter()
+    result = {'font': font_name, 'output': output_path, 'error': None,
+              'skipped': False, 'simplified': {}}
+
+    def collect(event):
+        # 단순화 보고서는 'total' 이벤트에 실려 옴
+        if event['stage'] == 'total' and event.get('simplified'):
+            result['simplified'] = event['simplified']
+
+    try:
+        module = importlib.import_module(module_name)
+        glyphs = getattr(module, generator_name)()
+        built = module.build_font(glyphs, font_name, family_name, output_path,
+                                  use_cache=use_cache, hook=collect, formats=formats,
+                                  hangul_mode=hangul_mode, outline=outline,
+                                  subroutinize=subroutinize, dedupe=dedupe,
+                                  simplify=simplify, grid=grid, normalize=normalize,
+                                  order=order)
+        result['skipped'] = not built
+        paths = font_export.output_paths(
+            output_path, font_export.sfnt_formats(formats, outline))
+        result['output'] = next(iter(paths.values()))
+        result['sizes'] = {fmt: os.path.getsize(path) for fmt, path in paths.items()}
+        result['bytes'] = sum(result['sizes'].values())
+    except Exception:
+        result['error'] = traceback.format_exc()
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def build_all(styles, jobs=None, use_cache=True, formats=('ttf',),
+              hangul_mode='precomposed', outline='glyf', subroutinize=True, dedupe=True,
+              simplify=0, grid=0, normalize=False, order='source'):
+    """스타일 목록을 병렬로 빌드 (jobs=1 이면 현재 프로세스에서 순차 빌드)"""
+    options = {'use_cache': use_cache, 'formats': formats, 'hangul_mode': hangul_mode,
+               'outline': outline, 'subroutinize': subroutinize, 'dedupe': dedupe,
+               'simplify': simplify, 'grid': grid, 'normalize': normalize, 'order': order}
+    if jobs == 1:
+        return [build_style(*style, **options) for style in styles]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(build_style, *style, **options): style
+                   for style in styles}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception:
+                # 워커 프로세스가 죽은 경우 (BrokenProcessPool 등) - 빌드 실패와 같이 보고
+                style = futures[future]
+                results.append({'font': style[2], 'output': style[4], 'skipped': False,
+                                'simplified': {}, 'seconds': 0.0,
+                                'error': traceback.format_exc()})
+    # 완료 순서와 무관하게 입력 순서로 정렬
+    order = {style[2]: i for i, style in enumerate(styles)}
+    results.sort(key=lambda r: order[r['font']])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='모든 커스텀 폰트를 병렬로 빌드')
+    parser.add_argument('-j', '--jobs', type=positive_int, default=os.cpu_count(),
+                        help='동시에 실행할 빌드 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--only', nargs='+', metavar='FONT',
+                        help='지정한 폰트만 빌드 (예: GeoRound SharpEdge)')
+    parser.add_argument('--output-dir',
+                        help='출력 디렉터리 (기본: 각 스타일에 지정된 경로)')
+    parser.add_argument('--force', action='store_true',
+                        help='빌드 캐시를 무시하고 모든 폰트를 다시 빌드')
+    parser.add_argument('--formats', nargs='+', default=['ttf'],
+                        choices=font_export.SUPPORTED_FORMATS,
+                        help='출력 형식 (예: --formats ttf woff2)')
+    parser.add_argument('--hangul-mode', default='precomposed',
+                        choices=hangul.HANGUL_MODES,
+                        help='한글 출력 방식 (jamo: 위치별 자모 + GSUB 조합)')
+    parser.add_argument('--outline', default='glyf', choices=font_cff.OUTLINE_FORMATS,
+                        help='윤곽선 형식 (cff/cff2 는 .otf 로 저장)')
+    parser.add_argument('--no-subroutinize', action='store_true',
+                        help='CFF 계열 출력에서 cffsubr 서브루틴화를 건너뜀')
+    parser.add_argument('--no-dedupe', action='store_true',
+                        help='반복 윤곽선을 부품 글리프 참조로 바꾸지 않음 (glyf)')
+    parser.add_argument('--simplify', type=float, default=0, metavar='TOL',
+                        help='윤곽선 단순화 허용 오차 (폰트 단위, 기본: 0 = 끔)')
+    parser.add_argument('--simplify-report', metavar='JSON',
+                        help='글리프별 제거한 점 개수 보고서를 저장할 경로')
+    parser.add_argument('--grid', type=int, default=0, metavar='UNITS',
+                        help='좌표를 맞출 격자 크기 (폰트 단위, 기본: 0 = 끔)')
+    parser.add_argument('--normalize-contours', action='store_true',
+                        help='윤곽선 방향과 시작점을 정규화 (WOFF2 압축 / 중복 제거 개선)')
+    parser.add_argument('--glyph-order', default='source', choices=glyph_normalize.GLYPH_ORDERS,
+                        help='한글 음절 글리프를 모으는 기준 (source: 입력 순서)')
+    parser.add_argument('--size-report', metavar='JSON',
+                        help='형식별 파일 크기 보고서를 저장할 경로')
+    args = parser.parse_args()
+    formats = font_export.check_formats(args.formats)
+    font_cff.check_outline(args.outline, not args.no_subroutinize)
+
+    styles = discover_styles()
+    if args.only:
+        unknown = sorted(set(args.only) - {s[2] for s in styles})
+        if unknown:
+            parser.error(f"알 수 없는 스타일: {', '.join(unknown)} "
+                         f"(가능: {', '.join(s[2] for s in styles)})")
+        styles = [s for s in styles if s[2] in args.only]
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+        styles = [s[:4] + (os.path.join(args.output_dir, os.path.basename(s[4])),)
+                  for s in styles]
+
+    print("=" * 50)
+    print(f"  폰트 병렬 빌드 - {len(styles)}개 스타일, jobs={args.jobs}")
+    print("=" * 50)
+    print()
+
+    started = time.perf_counter()
+    results = build_all(styles, jobs=args.jobs, use_cache=not args.force,
+                        formats=formats, hangul_mode=args.hangul_mode,
+                        outline=args.outline, subroutinize=not args.no_subroutinize,
+                        dedupe=not args.no_dedupe, simplify=args.simplify,
+                        grid=args.grid, normalize=args.normalize_contours,
+                        order=args.glyph_order)
+    elapsed = time.perf_counter() - started
+
+    failed = [r for r in results if r['error']]
+    for r in results:
+        if r['error']:
+            print(f"❌ {r['font']}: 빌드 실패 ({r['seconds']:.2f}s)")
+            print(r['error'])
+        elif r['skipped']:
+            print(f"⏭️  {r['font']}: 변경 없음 ({r['seconds']:.3f}s)")
+        else:
+            print(f"✅ {r['font']}: {r['output']} "
+                  f"({r['bytes']:,} bytes, {r['seconds']:.2f}s)")
+        if not r['error'] and len(formats) > 1:
+            print(f"   {font_export.format_sizes(r['sizes'])}")
+
+    if args.size_report:
+        font_export.write_size_report(
+            args.size_report, {r['font']: r['sizes'] for r in results if not r['error']})
+        print()
+        print(f"📁 크기 보고서 저장: {args.size_report}")
+
+    if args.simplify_report:
+        # {폰트: {글리프: {'points': 원래 점 수, 'removed': 제거한 점 수}}}
+        report = {r['font']: {name: {'points': total, 'removed': removed}
+                              for name, (total, removed) in r['simplified'].items()}
+                  for r in results if not r['error'] and not r['skipped']}
+        os.makedirs(os.path.dirname(os.path.abspath(args.simplify_report)), exist_ok=True)
+        with open(args.simplify_report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print()
+        print(f"📁 단순화 보고서 저장: {args.simplify_report}")
+
+    print()
+    print(f"🎉 {len(results) - len(failed)}/{len(results)}개 폰트 빌드 완료 "
+          f"({elapsed:.2f}s)")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
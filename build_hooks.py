@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+빌드 단계 타이밍 / 프로파일링 훅
+- build_font 가 단계마다 이벤트를 보내고, 등록된 콜백이 이를 받음
+- FONT_BUILD_PROFILE 환경 변수로 출력/프로파일러 선택
+    timing      단계별 시간 출력
+    cprofile    build_font 전체를 cProfile 로 측정해 .prof 저장 + 상위 함수 출력
+    tracemalloc 단계별 메모리 증가량과 최대 사용량을 이벤트에 추가
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+
+PROFILE_MODE = os.environ.get('FONT_BUILD_PROFILE', '').lower()
+PROFILE_DIR = os.environ.get('FONT_BUILD_PROFILE_DIR', '.font_profile')
+
+# 모든 빌드에 적용되는 전역 콜백 - callback(event) 형태
+_hooks = []
+
+
+def add_hook(callback):
+    """모든 build_font 호출의 단계 이벤트를 받을 콜백 등록"""
+    _hooks.append(callback)
+
+
+def remove_hook(callback):
+    _hooks.remove(callback)
+
+
+def _print_event(event):
+    if event['stage'] == 'total':
+        print(f"   ⏱️  {event['font']} 합계 {event['seconds'] * 1000:.1f}ms")
+        return
+    line = f"   ⏱️  {event['font']} {event['stage']:<10} {event['seconds'] * 1000:8.1f}ms"
+    if 'memory_bytes' in event:
+        line += (f"  mem {event['memory_bytes'] / 1024:+9.1f}KB"
+                 f"  peak {event['peak_bytes'] / 1024:9.1f}KB")
+    print(line)
+
+
+class BuildTimer:
+    """build_font 한 번의 단계 시간 측정기
+
+    stage(name) 을 호출하면 이전 단계를 끝내고 새 단계를 시작한다.
+    done() 은 마지막 단계를 끝내고 'total' 이벤트를 보낸다.
+    with 문으로 쓰면 빌드가 예외로 끝나도 프로파일러 / tracemalloc 을 끈다
+    (워커 프로세스를 다음 빌드에 다시 쓸 때 측정이 새지 않도록).
+    """
+
+    def __init__(self, font_name, hook=None, mode=None):
+        self.font_name = font_name
+        self.mode = PROFILE_MODE if mode is None else mode
+        self.hooks = list(_hooks)
+        if hook is not None:
+            self.hooks.append(hook)
+        if self.mode in ('timing', 'tracemalloc'):
+            self.hooks.append(_print_event)
+        self.events = []
+        self._stage = None
+        self._started = self._stage_started = time.perf_counter()
+
+        self._profiler = None
+        if self.mode == 'cprofile':
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._own_tracemalloc = False
+        if self.mode == 'tracemalloc' and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._own_tracemalloc = True
+        self._memory = self._trace_memory()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """켜 둔 프로파일러와 tracemalloc 을 끔 (여러 번 불러도 됨)"""
+        if self._profiler is not None:
+            self._profiler.disable()
+        if self._own_tracemalloc:
+            tracemalloc.stop()
+            self._own_tracemalloc = False
+
+    def _trace_memory(self):
+        if not tracemalloc.is_tracing():
+            return None
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0]
+
+    def _emit(self, event):
+        self.events.append(event)
+        for hook in self.hooks:
+            hook(event)
+
+    def _finish_stage(self):
+        if self._stage is None:
+            return
+        now = time.perf_counter()
+        event = {'font': self.font_name, 'stage': self._stage,
+                 'seconds': now - self._stage_started}
+        if self._memory is not None and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            event['memory_bytes'] = current - self._memory
+            event['peak_bytes'] = peak
+        self._stage = None
+        self._emit(event)
+
+    def stage(self, name):
+        """이전 단계를 끝내고 name 단계 시작"""
+        self._finish_stage()
+        self._stage = name
+        self._memory = self._trace_memory()
+        self._stage_started = time.perf_counter()
+
+    def done(self, **extra):
+        """마지막 단계를 끝내고 합계 이벤트 전송 (extra 는 합계 이벤트에 추가)"""
+        self._finish_stage()
+        event = dict({'font': self.font_name, 'stage': 'total',
+                      'seconds': time.perf_counter() - self._started}, **extra)
+        profiler = self._profiler
+        self.close()
+        if profiler is not None:
+            event['profile'] = self._dump_profile()
+        self._emit(event)
+        return self.events
+
+    def _dump_profile(self):
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        path = os.path.join(PROFILE_DIR, f'{self.font_name}.prof')
+        self._profiler.dump_stats(path)
+        out = io.StringIO()
+        pstats.Stats(self._profiler, stream=out).sort_stats('cumulative').print_stats(15)
+        print(f"   🔬 {self.font_name} 프로파일 저장: {path}")
+        print(out.getvalue())
+        return path
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+명령행 스크립트 공용 옵션 형식
+- positive_int: -j/--jobs 처럼 1 이상이어야 하는 정수 (0 이나 음수면 프로세스 풀이 실패)
+"""
+
+import argparse
+
+
+def positive_int(value):
+    """argparse 형식 - 1 이상의 정수"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상의 정수여야 합니다: {value}")
+    return number
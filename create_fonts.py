@@ -4,20 +4,19 @@
 - 기하학적 스타일의 영문 + 숫자 + 한글 기본 폰트
 """
 
-from fontTools.fontBuilder import FontBuilder
-from fontTools.pens.t2CharStringPen import T2CharStringPen
-from fontTools.ttLib import TTFont
 import math
 
-# 폰트 기본 설정
-UNITS_PER_EM = 1000
-ASCENDER = 800
-DESCENDER = -200
-CAP_HEIGHT = 700
-X_HEIGHT = 500
+import hangul
+# 빌드 파이프라인은 font_builder 에 있음 (module.build_font 등 기존 호출용으로 다시 내보냄)
+from font_builder import build_font, create_basic_cmap  # noqa: F401
+from glyph_path import embolden
 
-def create_geometric_font():
-    """기하학적 버블 스타일 폰트 생성"""
+
+def create_geometric_font(stroke=0):
+    """기하학적 버블 스타일 폰트 생성
+
+    stroke: 획 굵기 증감 (한쪽 기준 단위, 가변 폰트 마스터용 - variable_fonts 참고)
+    """
 
     # 글리프 정의 (각 글자의 윤곽선)
     glyphs = {}
@@ -104,9 +103,28 @@ def create_geometric_font():
     glyphs['at'] = create_at()
     glyphs['numbersign'] = create_hash()
 
+    if stroke:
+        glyphs = embolden_glyphs(glyphs, stroke)
+
+    # 한글 - 둥근 자모를 합성한 완성형 음절 (획 굵기는 렌더링 매개변수로 조절)
+    glyphs.update(hangul.create_hangul_glyphs('round', stroke))
+
     return glyphs
 
 
+def embolden_glyphs(glyphs, stroke):
+    """윤곽선을 stroke 만큼 두껍게 하고 양쪽 여백이 유지되도록 폭도 늘림"""
+    result = {}
+    for name, glyph in glyphs.items():
+        paths = glyph.get('paths', [])
+        if not paths:
+            result[name] = glyph
+            continue
+        result[name] = {'width': glyph['width'] + 2 * stroke,
+                        'paths': embolden(paths, stroke).translated(stroke, 0)}
+    return result
+
+
 def create_notdef_glyph():
     """기본 .notdef 글리프 (사각형)"""
     return {
@@ -1588,110 +1606,10 @@ def create_hash():
     }
 
 
-def build_font(glyphs, font_name, family_name, output_path):
-    """TTF 폰트 파일 생성"""
-
-    # 글리프 이름 목록
-    glyph_order = ['.notdef'] + [g for g in glyphs.keys() if g != '.notdef']
-
-    # 문자 매핑 생성
-    cmap = {}
-    char_map = {
-        'space': 0x0020,
-        'exclam': 0x0021,
-        'numbersign': 0x0023,
-        'comma': 0x002C,
-        'period': 0x002E,
-        'zero': 0x0030, 'one': 0x0031, 'two': 0x0032, 'three': 0x0033,
-        'four': 0x0034, 'five': 0x0035, 'six': 0x0036, 'seven': 0x0037,
-        'eight': 0x0038, 'nine': 0x0039,
-        'question': 0x003F,
-        'at': 0x0040,
-        'A': 0x0041, 'B': 0x0042, 'C': 0x0043, 'D': 0x0044, 'E': 0x0045,
-        'F': 0x0046, 'G': 0x0047, 'H': 0x0048, 'I': 0x0049, 'J': 0x004A,
-        'K': 0x004B, 'L': 0x004C, 'M': 0x004D, 'N': 0x004E, 'O': 0x004F,
-        'P': 0x0050, 'Q': 0x0051, 'R': 0x0052, 'S': 0x0053, 'T': 0x0054,
-        'U': 0x0055, 'V': 0x0056, 'W': 0x0057, 'X': 0x0058, 'Y': 0x0059,
-        'Z': 0x005A,
-        'a': 0x0061, 'b': 0x0062, 'c': 0x0063, 'd': 0x0064, 'e': 0x0065,
-        'f': 0x0066, 'g': 0x0067, 'h': 0x0068, 'i': 0x0069, 'j': 0x006A,
-        'k': 0x006B, 'l': 0x006C, 'm': 0x006D, 'n': 0x006E, 'o': 0x006F,
-        'p': 0x0070, 'q': 0x0071, 'r': 0x0072, 's': 0x0073, 't': 0x0074,
-        'u': 0x0075, 'v': 0x0076, 'w': 0x0077, 'x': 0x0078, 'y': 0x0079,
-        'z': 0x007A,
-    }
-
-    for glyph_name, unicode_val in char_map.items():
-        if glyph_name in glyphs:
-            cmap[unicode_val] = glyph_name
-
-    # FontBuilder 생성
-    fb = FontBuilder(UNITS_PER_EM, isTTF=True)
-    fb.setupGlyphOrder(glyph_order)
-
-    # 글리프 폭 설정
-    advance_widths = {name: glyph['width'] for name, glyph in glyphs.items()}
-    fb.setupCharacterMap(cmap)
-
-    # 글리프 윤곽선 생성
-    pen_glyphs = {}
-    for name, glyph_data in glyphs.items():
-        from fontTools.pens.ttGlyphPen import TTGlyphPen
-        pen = TTGlyphPen(None)
-
-        for path in glyph_data.get('paths', []):
-            for item in path:
-                cmd = item[0]
-                args = item[1] if len(item) > 1 else None
-
-                if cmd == 'moveTo':
-                    pen.moveTo(args)
-                elif cmd == 'lineTo':
-                    pen.lineTo(args)
-                elif cmd == 'qCurveTo':
-                    # qCurveTo는 (컨트롤포인트, 끝점) 형태
-                    if len(item) == 3:
-                        pen.qCurveTo(item[1], item[2])
-                    elif len(item) == 2 and isinstance(item[1], tuple):
-                        # 단일 튜플인 경우
-                        pen.qCurveTo(item[1])
-                elif cmd == 'closePath':
-                    pen.closePath()
-
-        pen_glyphs[name] = pen.glyph()
-
-    fb.setupGlyf(pen_glyphs)
-
-    # 메트릭 설정
-    metrics = {name: (glyph['width'], pen_glyphs[name].xMin if hasattr(pen_glyphs[name], 'xMin') and pen_glyphs[name].xMin is not None else 0)
-               for name, glyph in glyphs.items()}
-    fb.setupHorizontalMetrics(metrics)
-
-    # 헤더 설정
-    fb.setupHorizontalHeader(ascent=ASCENDER, descent=DESCENDER)
-    fb.setupHead(unitsPerEm=UNITS_PER_EM)
-
-    # 이름 테이블 설정
-    name_strings = {
-        'familyName': family_name,
-        'styleName': 'Regular',
-        'uniqueFontIdentifier': f'{family_name}-Regular',
-        'fullName': f'{family_name} Regular',
-        'version': 'Version 1.0',
-        'psName': font_name,
-    }
-    fb.setupNameTable(name_strings)
-
-    # OS/2 테이블 설정
-    fb.setupOS2(sTypoAscender=ASCENDER, sTypoDescender=DESCENDER,
-                sCapHeight=CAP_HEIGHT, sxHeight=X_HEIGHT)
-
-    # Post 테이블 설정
-    fb.setupPost()
-
-    # 폰트 저장
-    fb.save(output_path)
-    print(f"✅ 폰트 생성 완료: {output_path}")
+# 빌드 대상 스타일: (생성 함수, PostScript 이름, 패밀리 이름, 출력 경로)
+FONT_STYLES = [
+    (create_geometric_font, 'GeoRound', 'GeoRound', 'fonts/GeoRound-Regular.ttf'),
+]
 
 
 def main():
@@ -1700,16 +1618,16 @@ def main():
     print("=" * 50)
     print()
 
-    # 기하학적 버블 스타일 폰트 생성
-    print("📝 GeoRound 폰트 생성 중...")
-    glyphs = create_geometric_font()
-    build_font(glyphs, 'GeoRound', 'GeoRound', 'fonts/GeoRound-Regular.ttf')
+    for generator, font_name, family_name, output_path in FONT_STYLES:
+        print(f"📝 {font_name} 폰트 생성 중...")
+        build_font(generator(), font_name, family_name, output_path)
 
     print()
     print("🎉 모든 폰트 생성 완료!")
     print()
     print("📁 생성된 폰트:")
-    print("   - fonts/GeoRound-Regular.ttf (기하학적 둥근 스타일)")
+    for _, _, _, output_path in FONT_STYLES:
+        print(f"   - {output_path}")
 
 
 if __name__ == '__main__':
@@ -3,106 +3,20 @@
 유니크한 커스텀 폰트 생성기 - 다양한 스타일
 """
 
-from fontTools.fontBuilder import FontBuilder
-from fontTools.pens.ttGlyphPen import TTGlyphPen
 import math
 
-UNITS_PER_EM = 1000
-ASCENDER = 800
-DESCENDER = -200
+import hangul
+# 빌드 파이프라인은 font_builder 에 있음 (module.build_font 등 기존 호출용으로 다시 내보냄)
+from font_builder import build_font, create_basic_cmap  # noqa: F401
+from glyph_path import draw_paths
 
 # ============================================
 # 공통 유틸리티
 # ============================================
 
-def create_basic_cmap():
-    """기본 문자 매핑"""
-    return {
-        'space': 0x0020, 'exclam': 0x0021, 'numbersign': 0x0023,
-        'comma': 0x002C, 'period': 0x002E,
-        'zero': 0x0030, 'one': 0x0031, 'two': 0x0032, 'three': 0x0033,
-        'four': 0x0034, 'five': 0x0035, 'six': 0x0036, 'seven': 0x0037,
-        'eight': 0x0038, 'nine': 0x0039,
-        'question': 0x003F, 'at': 0x0040,
-        'A': 0x0041, 'B': 0x0042, 'C': 0x0043, 'D': 0x0044, 'E': 0x0045,
-        'F': 0x0046, 'G': 0x0047, 'H': 0x0048, 'I': 0x0049, 'J': 0x004A,
-        'K': 0x004B, 'L': 0x004C, 'M': 0x004D, 'N': 0x004E, 'O': 0x004F,
-        'P': 0x0050, 'Q': 0x0051, 'R': 0x0052, 'S': 0x0053, 'T': 0x0054,
-        'U': 0x0055, 'V': 0x0056, 'W': 0x0057, 'X': 0x0058, 'Y': 0x0059,
-        'Z': 0x005A,
-        'a': 0x0061, 'b': 0x0062, 'c': 0x0063, 'd': 0x0064, 'e': 0x0065,
-        'f': 0x0066, 'g': 0x0067, 'h': 0x0068, 'i': 0x0069, 'j': 0x006A,
-        'k': 0x006B, 'l': 0x006C, 'm': 0x006D, 'n': 0x006E, 'o': 0x006F,
-        'p': 0x0070, 'q': 0x0071, 'r': 0x0072, 's': 0x0073, 't': 0x0074,
-        'u': 0x0075, 'v': 0x0076, 'w': 0x0077, 'x': 0x0078, 'y': 0x0079,
-        'z': 0x007A,
-    }
-
-
 def draw_glyph(pen, paths):
-    """경로를 펜으로 그리기"""
-    for path in paths:
-        for item in path:
-            cmd = item[0]
-            if cmd == 'moveTo':
-                pen.moveTo(item[1])
-            elif cmd == 'lineTo':
-                pen.lineTo(item[1])
-            elif cmd == 'qCurveTo':
-                if len(item) == 3:
-                    pen.qCurveTo(item[1], item[2])
-            elif cmd == 'closePath':
-                pen.closePath()
-
-
-def build_font(glyphs, font_name, family_name, output_path):
-    """TTF 폰트 파일 생성"""
-    glyph_order = ['.notdef'] + [g for g in glyphs.keys() if g != '.notdef']
-
-    char_map = create_basic_cmap()
-    cmap = {}
-    for glyph_name, unicode_val in char_map.items():
-        if glyph_name in glyphs:
-            cmap[unicode_val] = glyph_name
-
-    fb = FontBuilder(UNITS_PER_EM, isTTF=True)
-    fb.setupGlyphOrder(glyph_order)
-    fb.setupCharacterMap(cmap)
-
-    pen_glyphs = {}
-    for name, glyph_data in glyphs.items():
-        pen = TTGlyphPen(None)
-        draw_glyph(pen, glyph_data.get('paths', []))
-        pen_glyphs[name] = pen.glyph()
-
-    fb.setupGlyf(pen_glyphs)
-
-    metrics = {}
-    for name, glyph in glyphs.items():
-        xMin = 0
-        if hasattr(pen_glyphs[name], 'xMin') and pen_glyphs[name].xMin is not None:
-            xMin = pen_glyphs[name].xMin
-        metrics[name] = (glyph['width'], xMin)
-    fb.setupHorizontalMetrics(metrics)
-
-    fb.setupHorizontalHeader(ascent=ASCENDER, descent=DESCENDER)
-    fb.setupHead(unitsPerEm=UNITS_PER_EM)
-
-    fb.setupNameTable({
-        'familyName': family_name,
-        'styleName': 'Regular',
-        'uniqueFontIdentifier': f'{family_name}-Regular',
-        'fullName': f'{family_name} Regular',
-        'version': 'Version 1.0',
-        'psName': font_name,
-    })
-
-    fb.setupOS2(sTypoAscender=ASCENDER, sTypoDescender=DESCENDER,
-                sCapHeight=700, sxHeight=500)
-    fb.setupPost()
-
-    fb.save(output_path)
-    print(f"   ✅ {output_path}")
+    """경로를 펜으로 그리기 (튜플 형식은 명령을 바로 호출, GlyphPath 는 버퍼에서 재생)"""
+    draw_paths(pen, paths)
 
 
 # ============================================
@@ -496,6 +410,9 @@ def create_sharp_font():
          ('lineTo', (310, 420)), ('closePath', None)]
     ]}
 
+    # 한글 - 각진 자모를 합성한 완성형 음절
+    glyphs.update(hangul.create_hangul_glyphs('sharp'))
+
     return glyphs
 
 
@@ -670,6 +587,13 @@ def create_bubble_font():
     return glyphs
 
 
+# 빌드 대상 스타일: (생성 함수, PostScript 이름, 패밀리 이름, 출력 경로)
+FONT_STYLES = [
+    (create_sharp_font, 'SharpEdge', 'SharpEdge', 'fonts/SharpEdge-Regular.ttf'),
+    (create_bubble_font, 'BubblePop', 'BubblePop', 'fonts/BubblePop-Regular.ttf'),
+]
+
+
 # ============================================
 # 메인 함수
 # ============================================
@@ -680,22 +604,16 @@ def main():
     print("=" * 50)
     print()
 
-    # Sharp Edge 폰트
-    print("📐 SharpEdge 폰트 생성 중...")
-    sharp_glyphs = create_sharp_font()
-    build_font(sharp_glyphs, 'SharpEdge', 'SharpEdge', 'fonts/SharpEdge-Regular.ttf')
-
-    # Bubble Pop 폰트
-    print("🫧 BubblePop 폰트 생성 중...")
-    bubble_glyphs = create_bubble_font()
-    build_font(bubble_glyphs, 'BubblePop', 'BubblePop', 'fonts/BubblePop-Regular.ttf')
+    for generator, font_name, family_name, output_path in FONT_STYLES:
+        print(f"🎨 {font_name} 폰트 생성 중...")
+        build_font(generator(), font_name, family_name, output_path)
 
     print()
     print("🎉 모든 폰트 생성 완료!")
     print()
     print("📁 생성된 폰트:")
-    print("   - fonts/SharpEdge-Regular.ttf (날카로운 각진 스타일)")
-    print("   - fonts/BubblePop-Regular.ttf (통통한 버블 스타일)")
+    for _, _, _, output_path in FONT_STYLES:
+        print(f"   - {output_path}")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+폰트 빌드 파이프라인 - 생성 스크립트(create_fonts / create_unique_fonts)가 공유
+- 생성 스크립트는 글리프 dict 만 만들고 build_font 로 넘김
+- 단계: cmap → 빌드 캐시 확인 → 단순화 → 정규화 → 중복 제거 → 글리프 순서
+  → 윤곽선(glyf: 글리프 캐시 + tt_glyph / CFF: font_cff) → 메트릭 → 테이블 → GSUB → 저장
+- 단계마다 build_hooks 이벤트를 보냄
+"""
+
+from fontTools.fontBuilder import FontBuilder
+
+import build_hooks
+import font_cache
+import font_cff
+import font_export
+import glyph_dedupe
+import glyph_normalize
+import glyph_simplify
+import hangul
+from glyph_metrics import measure_glyphs
+from glyph_path import compile_paths, tt_composite, tt_glyph
+
+# 폰트 기본 설정
+UNITS_PER_EM = 1000
+ASCENDER = 800
+DESCENDER = -200
+CAP_HEIGHT = 700
+X_HEIGHT = 500
+
+
+def create_basic_cmap():
+    """기본 문자 매핑"""
+    return {
+        'space': 0x0020,
+        'exclam': 0x0021,
+        'numbersign': 0x0023,
+        'comma': 0x002C,
+        'period': 0x002E,
+        'zero': 0x0030, 'one': 0x0031, 'two': 0x0032, 'three': 0x0033,
+        'four': 0x0034, 'five': 0x0035, 'six': 0x0036, 'seven': 0x0037,
+        'eight': 0x0038, 'nine': 0x0039,
+        'question': 0x003F,
+        'at': 0x0040,
+        'A': 0x0041, 'B': 0x0042, 'C': 0x0043, 'D': 0x0044, 'E': 0x0045,
+        'F': 0x0046, 'G': 0x0047, 'H': 0x0048, 'I': 0x0049, 'J': 0x004A,
+        'K': 0x004B, 'L': 0x004C, 'M': 0x004D, 'N': 0x004E, 'O': 0x004F,
+        'P': 0x0050, 'Q': 0x0051, 'R': 0x0052, 'S': 0x0053, 'T': 0x0054,
+        'U': 0x0055, 'V': 0x0056, 'W': 0x0057, 'X': 0x0058, 'Y': 0x0059,
+        'Z': 0x005A,
+        'a': 0x0061, 'b': 0x0062, 'c': 0x0063, 'd': 0x0064, 'e': 0x0065,
+        'f': 0x0066, 'g': 0x0067, 'h': 0x0068, 'i': 0x0069, 'j': 0x006A,
+        'k': 0x006B, 'l': 0x006C, 'm': 0x006D, 'n': 0x006E, 'o': 0x006F,
+        'p': 0x0070, 'q': 0x0071, 'r': 0x0072, 's': 0x0073, 't': 0x0074,
+        'u': 0x0075, 'v': 0x0076, 'w': 0x0077, 'x': 0x0078, 'y': 0x0079,
+        'z': 0x007A,
+    }
+
+
+def build_font(glyphs, font_name, family_name, output_path, use_cache=True,
+               extra_cmap=None, hook=None, formats=('ttf',), hangul_mode='precomposed',
+               outline='glyf', subroutinize=True, dedupe=True, simplify=0,
+               grid=0, normalize=False, order='source'):
+    """TTF/OTF 폰트 파일 생성 (입력이 바뀌지 않았으면 건너뛰고 False 반환)
+
+    extra_cmap: 기본 매핑 외에 추가할 {유니코드: 글리프 이름}
+    hook: 단계별 타이밍 이벤트를 받을 콜백 (build_hooks 참고)
+    formats: 출력 형식 목록 ('ttf' 또는 'otf', 'woff', 'woff2') - 확장자만 바꿔 함께 저장
+    hangul_mode: 'precomposed' 는 음절별 합성 글리프, 'jamo' 는 위치별 자모만 넣고
+                 GSUB(ccmp/ljmo/vjmo)로 렌더링 시 조합 (hangul.setup_jamo_gsub)
+    outline: 'glyf' (TrueType) / 'cff' / 'cff2' - CFF 계열은 .otf 로 저장 (font_cff)
+    subroutinize: CFF 계열일 때 cffsubr 로 서브루틴화
+    dedupe: glyf 일 때 반복 윤곽선을 부품 글리프 참조로 바꿈 (glyph_dedupe)
+    simplify: 윤곽선 단순화 허용 오차 (폰트 단위, 0 이면 끔) - 일직선 위의 점과
+              암시할 수 있는 on-curve 점 제거 (glyph_simplify)
+    grid: 좌표를 맞출 격자 (폰트 단위, 0 이면 끔) / normalize: 윤곽선 방향과 시작점 정규화
+    order: 글리프 순서 - 'source' 또는 한글 음절을 모으는 기준 (glyph_normalize.GLYPH_ORDERS)
+    """
+    outline = font_cff.check_outline(outline, subroutinize)
+    glyph_normalize.check_order(order)
+    formats = font_export.sfnt_formats(font_export.check_formats(formats), outline)
+    with build_hooks.BuildTimer(font_name, hook) as timer:
+        timer.stage('cmap')
+
+        jamo_gsub = False
+        if hangul.check_mode(hangul_mode) == 'jamo':
+            jamo_glyphs = hangul.jamo_mode_glyphs(glyphs)
+            jamo_gsub = jamo_glyphs is not glyphs
+            glyphs = jamo_glyphs
+
+        # 문자 매핑 생성
+        cmap = {}
+        char_map = create_basic_cmap()
+        char_map.update(hangul.create_hangul_cmap())
+
+        for glyph_name, unicode_val in char_map.items():
+            if glyph_name in glyphs:
+                cmap[unicode_val] = glyph_name
+        if extra_cmap:
+            cmap.update(extra_cmap)
+
+        # 이름 테이블 문자열
+        name_strings = {
+            'familyName': family_name,
+            'styleName': 'Regular',
+            'uniqueFontIdentifier': f'{family_name}-Regular',
+            'fullName': f'{family_name} Regular',
+            'version': 'Version 1.0',
+            'psName': font_name,
+        }
+
+        # 빌드 캐시 확인 - 입력이 같으면 글리프를 다시 그리지 않음
+        timer.stage('cache')
+        cache_key = font_cache.font_cache_key(
+            glyphs, cmap,
+            {'unitsPerEm': UNITS_PER_EM, 'ascender': ASCENDER, 'descender': DESCENDER,
+             'capHeight': CAP_HEIGHT, 'xHeight': X_HEIGHT, 'heights': 'measured',
+             'outline': outline, 'subroutinize': subroutinize and outline != 'glyf',
+             'dedupe': dedupe and outline == 'glyf', 'simplify': simplify,
+             'grid': grid, 'normalize': normalize, 'order': order},
+            name_strings)
+        outputs = list(font_export.output_paths(output_path, formats).values())
+        if use_cache and font_cache.is_up_to_date(output_path, cache_key, outputs):
+            print(f"⏭️  변경 없음, 건너뜀: {output_path}")
+            timer.done(skipped=True)
+            return False
+
+        report = {}
+        if simplify:
+            timer.stage('simplify')
+            glyphs, report = glyph_simplify.simplify_glyphs(glyphs, simplify)
+            summary, *top = glyph_simplify.format_report(report)
+            print(f"✂️  윤곽선 단순화 (허용 오차 {simplify}): {summary}")
+            for line in top:
+                print(f"   {line}")
+
+        if grid or normalize:
+            # 격자 맞춤 / 윤곽선 정규화 - 중복 제거 전에 해야 같은 모양을 더 많이 찾음
+            timer.stage('normalize')
+            glyphs = glyph_normalize.normalize_glyphs(glyphs, grid, normalize)
+
+        helpers = []
+        if dedupe and outline == 'glyf':
+            # 반복 윤곽선을 부품 글리프 참조로 (CFF 는 합성 글리프를 풀어 그리므로 제외)
+            timer.stage('dedupe')
+            glyphs = glyph_dedupe.dedupe_glyphs(glyphs)
+            # 추가된 부품 글리프는 글자가 아니므로 xAvgCharWidth 평균에서 뺌
+            helpers = glyph_dedupe.added_glyphs(glyphs)
+        glyph_order = ['.notdef'] + [g for g in glyphs.keys() if g != '.notdef']
+        glyph_order = glyph_normalize.compression_order(glyph_order, cmap, order)
+
+        # FontBuilder 생성
+        timer.stage('setupCmap')
+        fb = FontBuilder(UNITS_PER_EM, isTTF=outline == 'glyf')
+        fb.setupGlyphOrder(glyph_order)
+
+        fb.setupCharacterMap(cmap)
+
+        if outline == 'glyf':
+            # 글리프 윤곽선 생성 - 바뀐 윤곽선만 다시 그리고 나머지는 글리프 캐시에서 읽음
+            timer.stage('draw')
+            glyph_cache = font_cache.GlyphCache()
+            pen_glyphs = {}
+            for name, glyph_data in glyphs.items():
+                if 'components' in glyph_data:
+                    # 한글 음절 등 자모를 참조하는 합성 글리프 - 윤곽선 없이 변환만 저장
+                    pen_glyphs[name] = tt_composite(glyph_data['components'])
+                    continue
+                paths = glyph_data.get('paths', [])
+                cached = glyph_cache.get(paths)
+                if cached is not None:
+                    pen_glyphs[name] = cached
+                    continue
+
+                # 명령을 opcode 로 한 번 컴파일한 뒤 버퍼에서 바로 glyf 글리프 생성
+                pen_glyphs[name] = tt_glyph(compile_paths(paths))
+                glyph_cache.put(paths, pen_glyphs[name])
+            glyph_cache.evict()
+
+            timer.stage('setupGlyf')
+            fb.setupGlyf(pen_glyphs, calcGlyphBounds=False)
+
+            # 메트릭 설정 - 좌표 배열에서 경계 상자와 폰트 메트릭을 한 번에 계산 (glyph_metrics)
+            timer.stage('metrics')
+            glyph_metrics = measure_glyphs(glyphs, glyph_order, helpers)
+            metrics = glyph_metrics.horizontal_metrics()
+        else:
+            # CFF 계열 - 합성 글리프를 풀어 CharString 으로 그림
+            timer.stage('draw')
+            char_strings, bounds = font_cff.draw_charstrings(glyphs, cff2=outline == 'cff2')
+            timer.stage('setupCFF')
+            font_cff.setup_cff(fb, char_strings, font_name, family_name, outline)
+            timer.stage('metrics')
+            glyph_metrics = measure_glyphs(glyphs, glyph_order, helpers)
+            metrics = font_cff.horizontal_metrics(glyphs, bounds)
+        fb.setupHorizontalMetrics(metrics)
+
+        # 헤더 설정
+        timer.stage('tables')
+        fb.setupHorizontalHeader(ascent=ASCENDER, descent=DESCENDER)
+        fb.setupHead(unitsPerEm=UNITS_PER_EM)
+
+        # 이름 테이블 설정
+        fb.setupNameTable(name_strings)
+
+        # OS/2 테이블 설정
+        # 대문자 / 소문자 높이는 H / x 실측값 (없으면 기본값)
+        fb.setupOS2(sTypoAscender=ASCENDER, sTypoDescender=DESCENDER,
+                    sCapHeight=glyph_metrics.cap_height or CAP_HEIGHT,
+                    sxHeight=glyph_metrics.x_height or X_HEIGHT,
+                    xAvgCharWidth=glyph_metrics.avg_char_width)
+
+        # Post 테이블 설정
+        # 자모 조합 모드는 자리표시 음절 글리프 11,172개의 이름만 100KB 가 넘으므로
+        # 글리프 이름을 저장하지 않는 format 3 을 씀
+        fb.setupPost(keepGlyphNames=not jamo_gsub)
+
+        # OpenType 기능 (자모 조합 모드의 GSUB)
+        if jamo_gsub:
+            timer.stage('features')
+            hangul.setup_jamo_gsub(fb.font)
+
+        if outline == 'glyf':
+            # 저장할 때 glyf / head / hhea / maxp 를 다시 계산하지 않도록 미리 구한 값을 채움
+            glyph_metrics.apply(fb.font)
+        else:
+            # 저장할 때 CharString 을 모두 실행해 경계 상자를 다시 구하지 않도록 미리 채움
+            font_cff.set_bounds(fb.font, bounds)
+            if subroutinize:
+                timer.stage('subroutinize')
+                font_cff.subroutinize(fb.font, outline)
+
+        # 폰트 저장
+        timer.stage('save')
+        sizes = font_export.save_formats(fb.font, output_path, formats)
+        font_cache.record_build(output_path, cache_key, outputs)
+        timer.done(skipped=False, sizes={fmt: size for fmt, (_, size) in sizes.items()},
+                   simplified=report)
+        print(f"✅ 폰트 생성 완료: {outputs[0]}")
+        return True
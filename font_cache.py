@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+폰트 빌드 캐시
+- 글리프 딕셔너리, cmap, 메트릭, 이름 테이블과 빌더 모듈 소스의 해시로 변경 없는
+  폰트 빌드를 건너뜀
+- 글리프별 컴파일 결과(glyf 바이트)를 디스크에 캐시하고 LRU 용량 제한으로 정리
+"""
+
+import hashlib
+import importlib
+import json
+import os
+
+from fontTools import version as FONTTOOLS_VERSION
+from fontTools.ttLib.tables._g_l_y_f import Glyph
+
+from glyph_path import GlyphPath
+
+# 빌드 방식이 바뀌어 이전 결과를 쓸 수 없을 때 올린다
+CACHE_VERSION = 1
+
+CACHE_DIR = os.environ.get('FONT_BUILD_CACHE', '.font_cache')
+
+# 글리프 캐시 최대 용량 (MB)
+GLYPH_CACHE_MAX_MB = float(os.environ.get('FONT_GLYPH_CACHE_MB', '64'))
+
+# 출력 바이트에 영향을 주는 빌더 모듈 - 소스가 바뀌면 빌드 캐시를 무효화
+BUILDER_MODULES = ['font_builder', 'font_cff', 'font_export', 'glyph_dedupe', 'glyph_metrics',
+                   'glyph_normalize', 'glyph_path', 'glyph_simplify', 'hangul']
+
+# {모듈 이름 튜플: 소스 해시} - 프로세스당 한 번만 읽음
+_SOURCE_HASHES = {}
+
+
+def _json_default(obj):
+    if isinstance(obj, GlyphPath):
+        return ['GlyphPath', obj.ops.tobytes().hex(), obj.coords.tobytes().hex()]
+    raise TypeError(f'{type(obj).__name__} 는 해시할 수 없습니다')
+
+
+def stable_hash(obj):
+    """JSON 직렬화 기반의 안정적인 해시 (튜플/리스트 구분 없음, 키 정렬)"""
+    data = json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False,
+                      default=_json_default)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def source_hash(module_names):
+    """모듈 소스 파일 내용의 해시 (모듈 순서대로 이어 붙인 바이트)"""
+    names = tuple(module_names)
+    if names not in _SOURCE_HASHES:
+        digest = hashlib.sha256()
+        for name in names:
+            with open(importlib.import_module(name).__file__, 'rb') as f:
+                digest.update(f.read())
+        _SOURCE_HASHES[names] = digest.hexdigest()
+    return _SOURCE_HASHES[names]
+
+
+def font_cache_key(glyphs, cmap, metrics, names):
+    """폰트 하나의 빌드 입력 전체에 대한 캐시 키 (빌더 코드가 바뀌어도 달라짐)"""
+    return stable_hash({
+        'version': CACHE_VERSION,
+        'fontTools': FONTTOOLS_VERSION,
+        'source': source_hash(BUILDER_MODULES),
+        'glyphs': glyphs,
+        'cmap': {str(k): v for k, v in cmap.items()},
+        'metrics': metrics,
+        'names': names,
+    })
+
+
+def _stamp_path(output_path):
+    """출력 파일별 빌드 기록 경로 (병렬 빌드 시 서로 겹치지 않음)"""
+    digest = hashlib.sha1(os.path.abspath(output_path).encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, 'builds', f'{digest}.json')
+
+
+def _file_state(path):
+    st = os.stat(path)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+def is_up_to_date(output_path, key, outputs=None):
+    """저장된 키와 같고 출력 파일(outputs, 기본은 output_path 하나)이 그대로 있으면 True"""
+    outputs = outputs or [output_path]
+    try:
+        with open(_stamp_path(output_path), encoding='utf-8') as f:
+            stamp = json.load(f)
+        return stamp['key'] == key and stamp['files'] == {
+            path: _file_state(path) for path in outputs}
+    except (OSError, ValueError, KeyError):
+        return False
+
+
+def record_build(output_path, key, outputs=None):
+    """빌드 결과를 캐시에 기록 (outputs: 함께 생성된 모든 출력 파일)"""
+    outputs = outputs or [output_path]
+    stamp_path = _stamp_path(output_path)
+    os.makedirs(os.path.dirname(stamp_path), exist_ok=True)
+    tmp_path = f'{stamp_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'key': key, 'output': output_path,
+                   'files': {path: _file_state(path) for path in outputs}}, f)
+    os.replace(tmp_path, stamp_path)
+
+
+# ============================================
+# 글리프 단위 컴파일 캐시
+# ============================================
+
+class GlyphCache:
+    """경로 데이터 해시 -> 컴파일된 glyf 바이트 디스크 캐시
+
+    항목마다 파일 하나를 쓰고, 적중 시 mtime 을 갱신해 LRU 순서로 사용한다.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        self.cache_dir = os.path.join(cache_dir or CACHE_DIR, 'glyphs')
+        if max_bytes is None:
+            max_bytes = int(GLYPH_CACHE_MAX_MB * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, paths):
+        # 컴파일 결과는 glyph_path.tt_glyph 에만 의존
+        return stable_hash({'version': CACHE_VERSION, 'fontTools': FONTTOOLS_VERSION,
+                            'source': source_hash(['glyph_path']), 'paths': paths})
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f'{key}.glyf')
+
+    def get(self, paths):
+        """캐시된 글리프를 반환 (없으면 None)"""
+        entry_path = self._entry_path(self.key(paths))
+        try:
+            with open(entry_path, 'rb') as f:
+                data = f.read()
+            os.utime(entry_path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        glyph = Glyph(data)
+        glyph.expand(None)
+        return glyph
+
+    def put(self, paths, glyph):
+        """컴파일된 글리프 저장 (단순 글리프만 - 컴포지트는 glyf 테이블이 필요)"""
+        if glyph.isComposite():
+            return
+        entry_path = self._entry_path(self.key(paths))
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        tmp_path = f'{entry_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(glyph.compile(None))
+        os.replace(tmp_path, entry_path)
+
+    def evict(self):
+        """최근에 쓰지 않은 항목부터 지워 최대 용량 이하로 유지"""
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime_ns, st.st_size, path))
+                total += st.st_size
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+폰트 카탈로그 - fonts/ 의 폰트 메타데이터를 JSON 색인 하나로 모아 두고 빠르게 조회
+- TTFont(lazy=True) 로 열어 name / OS/2 / head / hhea / maxp / cmap 만 읽음
+  (테이블 크기는 sfnt 디렉터리에서 읽고 glyf / CFF 등 큰 테이블은 파싱하지 않음)
+- 패밀리 / 스타일 / 굵기, 글리프 수, 세로 메트릭, 테이블별 크기, 파일 해시 저장
+- cmap 지원 범위는 블록 비트셋으로 함께 저장 (font_coverage 가 조회)
+- 증분 갱신: 크기와 mtime 이 같으면 그대로 쓰고, 달라졌어도 해시가 같으면 다시 읽지 않음
+- 도구와 갤러리는 색인만 읽어 폰트 파일을 파싱하지 않고 조회
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from fontTools.ttLib import TTFont
+
+import font_coverage
+import hangul
+from cli_options import positive_int
+
+# 항목 구조가 바뀌어 이전 색인을 쓸 수 없을 때 올린다
+CATALOG_VERSION = 2
+
+FONT_DIR = 'fonts'
+CATALOG_PATH = os.path.join(FONT_DIR, 'catalog.json')
+FONT_EXTENSIONS = ('.ttf', '.otf')
+
+
+def file_hash(path):
+    """파일 내용 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _file_state(path):
+    st = os.stat(path)
+    return {'bytes': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+# ============================================
+# 폰트 하나 읽기 (워커 프로세스)
+# ============================================
+
+def read_entry(path, sha256=None):
+    """카탈로그 항목 하나 - 필요한 테이블만 지연 로딩으로 읽음"""
+    entry = dict(_file_state(path), file=os.path.basename(path),
+                 sha256=sha256 or file_hash(path))
+    font = TTFont(path, lazy=True)
+    try:
+        name = font['name']
+        os2 = font['OS/2']
+        head = font['head']
+        hhea = font['hhea']
+        cmap = font.getBestCmap() or {}
+        entry.update({
+            'family': name.getBestFamilyName(),
+            'subfamily': name.getBestSubFamilyName(),
+            'full_name': name.getBestFullName(),
+            'ps_name': name.getDebugName(6),
+            'version': name.getDebugName(5),
+            'weight': os2.usWeightClass,
+            'width': os2.usWidthClass,
+            'style': 'italic' if os2.fsSelection & 1 else 'normal',
+            'units_per_em': head.unitsPerEm,
+            'glyphs': font['maxp'].numGlyphs,
+            'outline': 'glyf' if 'glyf' in font.reader else
+                       'cff2' if 'CFF2' in font.reader else 'cff',
+            'variable': 'fvar' in font.reader,
+            'metrics': {
+                'ascender': hhea.ascent,
+                'descender': hhea.descent,
+                'line_gap': hhea.lineGap,
+                'typo_ascender': os2.sTypoAscender,
+                'typo_descender': os2.sTypoDescender,
+                'typo_line_gap': os2.sTypoLineGap,
+                'win_ascent': os2.usWinAscent,
+                'win_descent': os2.usWinDescent,
+                'cap_height': getattr(os2, 'sCapHeight', None),
+                'x_height': getattr(os2, 'sxHeight', None),
+                'bbox': [head.xMin, head.yMin, head.xMax, head.yMax],
+            },
+            'codepoints': len(cmap),
+            'hangul_syllables': sum(
+                1 for cp in cmap
+                if hangul.SYLLABLE_BASE <= cp < hangul.SYLLABLE_BASE + hangul.SYLLABLE_COUNT),
+            'coverage': font_coverage.encode_coverage(cmap),
+            'tables': {tag: font.reader.tables[tag].length for tag in sorted(font.reader.keys())},
+        })
+    finally:
+        font.close()
+    return entry
+
+
+# ============================================
+# 색인 갱신 / 조회
+# ============================================
+
+def load_catalog(catalog_path=CATALOG_PATH):
+    """색인 JSON → {'version', 'fonts': {파일 이름: 항목}} (없거나 버전이 다르면 빈 색인)"""
+    try:
+        with open(catalog_path, encoding='utf-8') as f:
+            catalog = json.load(f)
+        if catalog.get('version') == CATALOG_VERSION:
+            return catalog
+    except (OSError, ValueError):
+        pass
+    return {'version': CATALOG_VERSION, 'fonts': {}}
+
+
+def save_catalog(catalog, catalog_path=CATALOG_PATH):
+    """한 줄 JSON 으로 원자적 저장"""
+    os.makedirs(os.path.dirname(os.path.abspath(catalog_path)), exist_ok=True)
+    tmp_path = f'{catalog_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, separators=(',', ':'), ensure_ascii=False, sort_keys=True)
+    os.replace(tmp_path, catalog_path)
+
+
+def font_paths(font_dir=FONT_DIR):
+    return sorted(path for path in glob.glob(os.path.join(font_dir, '*'))
+                  if path.lower().endswith(FONT_EXTENSIONS))
+
+
+def update_catalog(font_dir=FONT_DIR, catalog_path=CATALOG_PATH, jobs=None, force=False):
+    """바뀐 폰트만 다시 읽어 색인 갱신 - (카탈로그, {'reused', 'rehashed', 'read', 'removed'})
+
+    크기와 mtime 이 같은 파일은 그대로 쓰고, 다르면 해시를 구해 같으면 mtime 만 고친다.
+    나머지 파일만 프로세스 풀에서 테이블을 읽는다 (jobs=1 이면 현재 프로세스).
+    """
+    old = {} if force else load_catalog(catalog_path)['fonts']
+    fonts = {}
+    stats = {'reused': 0, 'rehashed': 0, 'read': 0, 'removed': 0}
+    pending = []
+    for path in font_paths(font_dir):
+        file_name = os.path.basename(path)
+        entry = old.get(file_name)
+        state = _file_state(path)
+        if entry and all(entry[k] == v for k, v in state.items()):
+            fonts[file_name] = entry
+            stats['reused'] += 1
+            continue
+        sha256 = file_hash(path)
+        if entry and entry['sha256'] == sha256:
+            fonts[file_name] = dict(entry, **state)
+            stats['rehashed'] += 1
+            continue
+        pending.append((path, sha256))
+
+    if jobs == 1 or len(pending) < 2:
+        entries = [read_entry(path, sha256) for path, sha256 in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            entries = list(executor.map(read_entry, *zip(*pending)))
+    for entry in entries:
+        fonts[entry['file']] = entry
+    stats['read'] = len(entries)
+    stats['removed'] = len(set(old) - set(fonts))
+
+    catalog = {'version': CATALOG_VERSION, 'fonts': dict(sorted(fonts.items()))}
+    if fonts != old or not os.path.exists(catalog_path):
+        save_catalog(catalog, catalog_path)
+    return catalog, stats
+
+
+def find_fonts(catalog, family=None, weight=None, style=None):
+    """조건에 맞는 항목 목록 (패밀리는 공백 / 대소문자 무시, weight 는 가까운 순 정렬)"""
+    key = family.replace(' ', '').lower() if family else None
+    result = []
+    for entry in catalog['fonts'].values():
+        if key and entry['family'].replace(' ', '').lower() != key:
+            continue
+        if style and entry['style'] != style:
+            continue
+        result.append(entry)
+    if weight is not None:
+        result.sort(key=lambda entry: (abs(entry['weight'] - weight), entry['file']))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='fonts/ 폰트 카탈로그 색인 갱신 / 조회')
+    parser.add_argument('--fonts-dir', default=FONT_DIR, help='폰트 디렉터리')
+    parser.add_argument('--catalog', default=CATALOG_PATH, help='색인 JSON 경로')
+    parser.add_argument('--force', action='store_true', help='기존 색인을 무시하고 모두 다시 읽음')
+    parser.add_argument('--family', help='이 패밀리만 출력 (예: "Nanum Gothic")')
+    parser.add_argument('--weight', type=int, help='가까운 굵기 순으로 정렬')
+    parser.add_argument('--json', action='store_true', help='조회 결과를 JSON 으로 출력')
+    parser.add_argument('-j', '--jobs', type=positive_int, default=os.cpu_count(),
+                        help='바뀐 폰트를 읽을 프로세스 수 (기본: CPU 코어 수)')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    catalog, stats = update_catalog(args.fonts_dir, args.catalog, args.jobs, args.force)
+    elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    catalog = load_catalog(args.catalog)
+    entries = find_fonts(catalog, args.family, args.weight)
+    query = time.perf_counter() - started
+
+    if args.json:
+        entries = [{k: v for k, v in entry.items() if k != 'coverage'} for entry in entries]
+        print(json.dumps(entries, indent=2, ensure_ascii=False))
+        return 0
+
+    print("=" * 78)
+    print(f"  폰트 카탈로그 - {len(catalog['fonts'])}개 파일")
+    print("=" * 78)
+    print()
+    print(f"  {'file':<30} {'family':<20} {'wght':>4} {'glyphs':>6} {'hangul':>6} "
+          f"{'upm':>5} {'asc/desc':>11} {'size':>9}")
+    for entry in entries:
+        m = entry['metrics']
+        print(f"  {entry['file']:<30} {entry['family'][:20]:<20} {entry['weight']:>4} "
+              f"{entry['glyphs']:>6,} {entry['hangul_syllables']:>6,} "
+              f"{entry['units_per_em']:>5} {m['ascender']:>5}/{m['descender']:<5} "
+              f"{entry['bytes'] / 1024:>7,.0f}KB")
+    print()
+    print(f"📁 색인: {args.catalog} ({os.path.getsize(args.catalog):,} bytes)")
+    print(f"🔄 재사용 {stats['reused']}, 해시만 확인 {stats['rehashed']}, "
+          f"새로 읽음 {stats['read']}, 삭제 {stats['removed']} ({elapsed * 1000:.0f}ms)")
+    print(f"🔎 색인 읽기 + 조회 {query * 1000:.2f}ms")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+CFF / CFF2 윤곽선 백엔드 (glyf 대신 PostScript 윤곽선)
+- 글리프를 T2CharStringPen 으로 그려 CharString 생성 (2차 곡선은 펜이 3차로 변환)
+- CFF 에는 합성 글리프가 없으므로 한글 음절 등은 구성 요소를 풀어 그림
+  (기준 글리프 + 변환 조합별로 한 번만 그리고 음절마다 프로그램 조각을 이어 붙임)
+- cffsubr(AFDKO tx)로 반복되는 윤곽선 조각을 서브루틴으로 묶어 크기를 줄임
+"""
+
+import math
+
+from fontTools.cffLib import PrivateDict
+from fontTools.misc.psCharStrings import T2CharString
+from fontTools.misc.roundTools import otRound
+from fontTools.misc.transform import Identity, Transform
+from fontTools.pens.reverseContourPen import ReverseContourPen
+from fontTools.pens.t2CharStringPen import T2CharStringPen
+from fontTools.pens.transformPen import TransformPen
+
+from glyph_path import draw_paths
+
+OUTLINE_FORMATS = ('glyf', 'cff', 'cff2')
+
+# 조각의 경계 상자 계산용 (폭 기본값만 쓰이는 빈 Private DICT)
+_BOUNDS_PRIVATE = PrivateDict()
+
+
+def check_outline(outline, subroutinize=True):
+    """윤곽선 형식 검증 (서브루틴화에는 cffsubr 패키지 필요)"""
+    if outline not in OUTLINE_FORMATS:
+        raise ValueError(f"지원하지 않는 윤곽선 형식: {outline} "
+                         f"(가능: {', '.join(OUTLINE_FORMATS)})")
+    if outline != 'glyf' and subroutinize:
+        try:
+            import cffsubr  # noqa: F401
+        except ImportError:
+            raise RuntimeError("CFF 서브루틴화에는 cffsubr 패키지가 필요합니다 "
+                               "(pip install cffsubr)") from None
+    return outline
+
+
+# ============================================
+# CharString 생성
+# ============================================
+
+class _FragmentPen(T2CharStringPen):
+    """마지막 점(다음 조각의 rmoveto 기준점)을 알려 주는 T2CharStringPen"""
+
+    @property
+    def current_point(self):
+        return self._p0
+
+
+def _union(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+class CharStringBuilder:
+    """글리프 dict → T2CharString (합성 글리프는 조각을 이어 붙여 풀어 그림)
+
+    TrueType(시계 방향)과 PostScript(반시계 방향)는 바깥 윤곽선 방향이 반대라
+    윤곽선을 뒤집어 그린다. CFF2 CharString 에는 폭과 endchar 를 넣지 않는다.
+    """
+
+    def __init__(self, glyphs, cff2=False):
+        self.glyphs = glyphs
+        self.cff2 = cff2
+        self.bounds = {}
+        # (기준 글리프, 변환) → (시작점, 끝점, 첫 moveto 뒤 프로그램, 경계 상자)
+        self._fragments = {}
+
+    def _fragment(self, name, transform):
+        key = (name, tuple(transform))
+        fragment = self._fragments.get(key)
+        if fragment is not None:
+            return fragment
+        pen = _FragmentPen(None, None, CFF2=self.cff2)
+        target = pen if transform == Identity else TransformPen(pen, transform)
+        draw_paths(ReverseContourPen(target), self.glyphs[name].get('paths', []))
+        program = pen.getCharString().program
+        if not self.cff2:
+            program = program[:-1]      # endchar
+        if not program:
+            fragment = (None, None, [], None)
+        else:
+            # 원점에서 시작했으므로 첫 moveto 인자가 곧 절대 시작점
+            index = next(i for i, token in enumerate(program) if isinstance(token, str))
+            args = program[:index]
+            start = {'rmoveto': lambda: tuple(args),
+                     'hmoveto': lambda: (args[0], 0),
+                     'vmoveto': lambda: (0, args[0])}[program[index]]()
+            bounds = T2CharString(program=program + ['endchar'],
+                                  private=_BOUNDS_PRIVATE).calcBounds(None)
+            fragment = (start, pen.current_point, program[index + 1:], bounds)
+        self._fragments[key] = fragment
+        return fragment
+
+    def _collect(self, name, transform, fragments):
+        glyph = self.glyphs[name]
+        if 'components' not in glyph:
+            fragments.append(self._fragment(name, transform))
+            return
+        for base_name, transformation in glyph['components']:
+            self._collect(base_name, transform.transform(transformation), fragments)
+
+    def build(self, name):
+        """글리프 하나의 T2CharString (경계 상자는 self.bounds 에 기록)"""
+        fragments = []
+        self._collect(name, Identity, fragments)
+        program = []
+        bounds = None
+        x = y = 0
+        for start, end, body, fragment_bounds in fragments:
+            if start is None:
+                continue
+            program += [start[0] - x, start[1] - y, 'rmoveto'] + body
+            x, y = end
+            bounds = _union(bounds, fragment_bounds)
+        if not self.cff2:
+            program = [otRound(self.glyphs[name]['width'])] + program + ['endchar']
+        self.bounds[name] = bounds
+        return T2CharString(program=program)
+
+
+def draw_charstrings(glyphs, cff2=False):
+    """글리프 dict → ({이름: T2CharString}, {이름: 경계 상자 또는 None})"""
+    builder = CharStringBuilder(glyphs, cff2)
+    char_strings = {name: builder.build(name) for name in glyphs}
+    return char_strings, builder.bounds
+
+
+# ============================================
+# 테이블 설정
+# ============================================
+
+def setup_cff(fb, char_strings, ps_name, family_name, outline):
+    """FontBuilder 에 CFF 또는 CFF2 테이블 설정"""
+    if outline == 'cff2':
+        fb.setupCFF2(char_strings)
+    else:
+        fb.setupCFF(ps_name, {'FullName': f'{family_name} Regular',
+                              'FamilyName': family_name}, char_strings, {})
+
+
+def horizontal_metrics(glyphs, bounds):
+    """{이름: (폭, 왼쪽 여백)} - 왼쪽 여백은 CharString 경계 상자의 xMin"""
+    return {name: (glyph['width'], otRound(bounds[name][0]) if bounds[name] else 0)
+            for name, glyph in glyphs.items()}
+
+
+def set_bounds(font, bounds):
+    """미리 구한 경계 상자로 head / hhea / CFF FontBBox 를 채우고 저장 시 재계산을 끔
+
+    fontTools 는 CFF 폰트를 저장할 때마다 모든 CharString 을 실행해 경계 상자를
+    다시 구하므로 (head, hhea, CFF 각각) 한글 음절 수만큼 글리프가 많으면 느리다.
+    값은 fontTools 의 재계산 결과와 같다 (hhea 는 floor/ceil, head 는 intRect).
+    """
+    boxes = [box for box in bounds.values() if box]
+    font_bbox = [min(b[0] for b in boxes), min(b[1] for b in boxes),
+                 max(b[2] for b in boxes), max(b[3] for b in boxes)] if boxes else [0, 0, 0, 0]
+    if 'CFF ' in font:
+        font['CFF '].cff.topDictIndex[0].FontBBox = font_bbox
+    head = font['head']
+    head.xMin, head.yMin = (math.floor(v) for v in font_bbox[:2])
+    head.xMax, head.yMax = (math.ceil(v) for v in font_bbox[2:])
+
+    hhea = font['hhea']
+    hmtx = font['hmtx']
+    hhea.advanceWidthMax = max(advance for advance, _ in hmtx.metrics.values())
+    if boxes:
+        min_lsb = min_rsb = math.inf
+        max_extent = -math.inf
+        for name, box in bounds.items():
+            if not box:
+                continue
+            advance, lsb = hmtx[name]
+            width = math.ceil(box[2]) - math.floor(box[0])
+            min_lsb = min(min_lsb, lsb)
+            min_rsb = min(min_rsb, advance - lsb - width)
+            max_extent = max(max_extent, lsb + width)
+        hhea.minLeftSideBearing = min_lsb
+        hhea.minRightSideBearing = min_rsb
+        hhea.xMaxExtent = max_extent
+    font.recalcBBoxes = False
+
+
+def subroutinize(font, outline):
+    """cffsubr 로 CFF/CFF2 테이블을 서브루틴화 (font 를 제자리에서 교체)"""
+    import cffsubr
+    cffsubr.subroutinize(font, cff_version=2 if outline == 'cff2' else 1)
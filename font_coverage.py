@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+유니코드 지원 범위 색인 - "이 글을 전부 렌더링할 수 있는 폰트" / "폰트 X 에 없는 글자" 조회
+- 폰트마다 cmap 코드포인트를 256 개 단위 블록 비트셋으로 압축
+  (꽉 찬 블록은 번호만, 일부만 찬 블록은 32바이트 비트맵 hex 로 저장)
+- fonts/ 의 폰트는 font_catalog 색인 항목에 함께 저장되어 파일이 바뀔 때만 다시 만듦
+- 생성 스타일(create_fonts / create_unique_fonts)은 build_font 와 같은 방식으로
+  create_basic_cmap + 한글 cmap 에서 만들고, 모듈 소스 해시로 캐시
+- 조회 시 폰트 비트셋과 글 비트셋을 정수 비트 연산 한 번으로 비교
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+import unicodedata
+
+import font_cache
+import font_catalog
+
+BLOCK_BITS = 256
+_BLOCK_BYTES = BLOCK_BITS // 8
+
+# 생성 스타일 지원 범위 캐시 (모듈 소스가 바뀌면 다시 만듦)
+STYLE_CACHE = 'coverage_styles.json'
+STYLE_MODULES = ['create_fonts', 'create_unique_fonts']
+
+
+# ============================================
+# 비트셋
+# ============================================
+
+def bitset(codepoints):
+    """코드포인트 모음 → 정수 비트셋 (비트 cp 가 1 이면 포함)"""
+    codepoints = list(codepoints)
+    if not codepoints:
+        return 0
+    buf = bytearray(max(codepoints) // 8 + 1)
+    for cp in codepoints:
+        buf[cp >> 3] |= 1 << (cp & 7)
+    return int.from_bytes(buf, 'little')
+
+
+def iter_bits(value):
+    """비트셋에서 1 인 코드포인트를 작은 것부터"""
+    data = value.to_bytes((value.bit_length() + 7) // 8, 'little')
+    for i, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            yield i * 8 + low.bit_length() - 1
+            byte ^= low
+
+
+def encode_coverage(codepoints):
+    """코드포인트 → {'full': [블록 번호], 'partial': {블록 번호: 비트맵 hex}}"""
+    value = bitset(codepoints)
+    data = value.to_bytes((value.bit_length() + 7) // 8, 'little')
+    full = []
+    partial = {}
+    for block in range(0, len(data), _BLOCK_BYTES):
+        chunk = data[block:block + _BLOCK_BYTES]
+        if not any(chunk):
+            continue
+        if chunk == b'\xff' * _BLOCK_BYTES:
+            full.append(block // _BLOCK_BYTES)
+        else:
+            partial[str(block // _BLOCK_BYTES)] = chunk.hex()
+    return {'full': full, 'partial': partial}
+
+
+def decode_coverage(coverage):
+    """encode_coverage 결과 → 정수 비트셋"""
+    blocks = [int(b) for b in coverage['partial']] + coverage['full']
+    if not blocks:
+        return 0
+    buf = bytearray((max(blocks) + 1) * _BLOCK_BYTES)
+    for block in coverage['full']:
+        buf[block * _BLOCK_BYTES:(block + 1) * _BLOCK_BYTES] = b'\xff' * _BLOCK_BYTES
+    for block, bits in coverage['partial'].items():
+        chunk = bytes.fromhex(bits)
+        start = int(block) * _BLOCK_BYTES
+        buf[start:start + len(chunk)] = chunk
+    return int.from_bytes(buf, 'little')
+
+
+def text_codepoints(text):
+    """글에서 폰트가 그려야 하는 코드포인트 (줄바꿈 / 탭 등 제어 문자 제외)"""
+    return {ord(ch) for ch in set(text) if unicodedata.category(ch) != 'Cc'}
+
+
+# ============================================
+# 생성 스타일 cmap
+# ============================================
+
+def style_cmap(module_name, generator_name):
+    """생성 스타일의 cmap 코드포인트 - build_font 와 같이 글리프가 있는 문자만"""
+    import hangul
+    module = importlib.import_module(module_name)
+    glyphs = getattr(module, generator_name)()
+    char_map = module.create_basic_cmap()
+    char_map.update(hangul.create_hangul_cmap())
+    return sorted(cp for name, cp in char_map.items() if name in glyphs)
+
+
+def style_coverage(module_names=STYLE_MODULES):
+    """{'style:<폰트 이름>': 지원 범위} - 모듈 소스가 그대로면 캐시에서 읽음"""
+    cache_path = os.path.join(font_cache.CACHE_DIR, STYLE_CACHE)
+    key = font_cache.source_hash(module_names + ['font_builder', 'hangul'])
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['key'] == key:
+            return cached['styles']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    styles = {}
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        for generator, font_name, _, _ in module.FONT_STYLES:
+            styles[f'style:{font_name}'] = encode_coverage(
+                style_cmap(module_name, generator.__name__))
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'key': key, 'styles': styles}, f, separators=(',', ':'))
+    os.replace(tmp_path, cache_path)
+    return styles
+
+
+# ============================================
+# 색인 / 조회
+# ============================================
+
+class CoverageIndex:
+    """폰트 이름 → 정수 비트셋"""
+
+    def __init__(self, coverages=None):
+        self.fonts = {name: decode_coverage(coverage)
+                      for name, coverage in (coverages or {}).items()}
+
+    @classmethod
+    def from_catalog(cls, catalog, styles=None):
+        """font_catalog 색인 (+ style_coverage 결과) 로 만듦"""
+        coverages = {entry['file']: entry['coverage'] for entry in catalog['fonts'].values()}
+        coverages.update(styles or {})
+        return cls(coverages)
+
+    def add(self, name, codepoints):
+        self.fonts[name] = bitset(codepoints)
+
+    def covering(self, text):
+        """글의 모든 문자를 가진 폰트 이름 목록"""
+        mask = bitset(text_codepoints(text))
+        return [name for name, bits in self.fonts.items() if not mask & ~bits]
+
+    def missing(self, name, text):
+        """폰트 name 에 없는 글의 문자 (코드포인트 순)"""
+        mask = bitset(text_codepoints(text))
+        return ''.join(chr(cp) for cp in iter_bits(mask & ~self.fonts[name]))
+
+    def ranking(self, text):
+        """[(폰트 이름, 없는 문자 수)] - 없는 문자가 적은 순"""
+        mask = bitset(text_codepoints(text))
+        return sorted(((name, (mask & ~bits).bit_count()) for name, bits in self.fonts.items()),
+                      key=lambda item: (item[1], item[0]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='글을 렌더링할 수 있는 폰트 / 없는 글자 조회')
+    parser.add_argument('text', nargs='?', help='확인할 글 (없으면 --file 또는 표준 입력)')
+    parser.add_argument('--file', help='확인할 글이 든 텍스트 파일')
+    parser.add_argument('--font', help='이 폰트(파일 이름 또는 style:이름)에 없는 문자만 출력')
+    parser.add_argument('--styles', action='store_true',
+                        help='생성 스타일의 cmap(create_basic_cmap + 한글)도 포함')
+    parser.add_argument('--fonts-dir', default=font_catalog.FONT_DIR, help='폰트 디렉터리')
+    parser.add_argument('--catalog', default=font_catalog.CATALOG_PATH, help='색인 JSON 경로')
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, encoding='utf-8') as f:
+            text = f.read()
+    else:
+        text = args.text if args.text is not None else sys.stdin.read()
+
+    started = time.perf_counter()
+    catalog, _ = font_catalog.update_catalog(args.fonts_dir, args.catalog)
+    styles = style_coverage() if args.styles else None
+    index = CoverageIndex.from_catalog(catalog, styles)
+    loaded = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if args.font:
+        if args.font not in index.fonts:
+            print(f"❌ 색인에 없는 폰트: {args.font}")
+            return 1
+        missing = index.missing(args.font, text)
+        query = time.perf_counter() - started
+        print(f"🔎 {args.font}: 없는 문자 {len(missing):,}개 ({query * 1000:.2f}ms)")
+        if missing:
+            print(f"   {missing}")
+        return 0 if not missing else 2
+
+    ranking = index.ranking(text)
+    query = time.perf_counter() - started
+    chars = len(text_codepoints(text))
+    print(f"🔎 글자 {len(text):,}자 (서로 다른 문자 {chars:,}개) - 폰트 {len(ranking)}개 "
+          f"(색인 {loaded * 1000:.0f}ms, 조회 {query * 1000:.2f}ms)")
+    for name, count in ranking:
+        state = '✅ 전부 지원' if not count else f'⚠️  없는 문자 {count:,}개'
+        print(f"   {name:<30} {state}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+폰트 출력 형식 (ttf / otf / woff / woff2)
+- 한 번 컴파일한 폰트 바이트를 다시 열어 flavor 만 바꿔 저장 (글리프 재컴파일 없음)
+"""
+
+import io
+import json
+import logging
+import os
+
+from fontTools.ttLib import TTFont
+
+SUPPORTED_FORMATS = ('ttf', 'otf', 'woff', 'woff2')
+# 압축하지 않은 sfnt - glyf 윤곽선은 .ttf, CFF/CFF2 윤곽선은 .otf
+SFNT_FORMATS = ('ttf', 'otf')
+
+# head 테이블을 다시 읽을 때 created/modified 가 0 이면 나오는 경고
+_HEAD_LOG = logging.getLogger('fontTools.ttLib.tables._h_e_a_d')
+
+
+def check_formats(formats):
+    """출력 형식 목록 검증 (woff2 는 brotli 패키지 필요)"""
+    formats = tuple(formats)
+    unknown = [f for f in formats if f not in SUPPORTED_FORMATS]
+    if unknown or not formats:
+        raise ValueError(f"지원하지 않는 출력 형식: {unknown or formats} "
+                         f"(가능: {', '.join(SUPPORTED_FORMATS)})")
+    if 'woff2' in formats:
+        try:
+            import brotli  # noqa: F401
+        except ImportError:
+            raise RuntimeError("woff2 출력에는 brotli 패키지가 필요합니다 "
+                               "(pip install brotli)") from None
+    return formats
+
+
+def sfnt_formats(formats, outline):
+    """압축하지 않은 형식 이름을 윤곽선 종류에 맞춤 (glyf → ttf, cff/cff2 → otf)"""
+    sfnt = 'ttf' if outline == 'glyf' else 'otf'
+    return tuple(dict.fromkeys(sfnt if fmt in SFNT_FORMATS else fmt for fmt in formats))
+
+
+def output_paths(output_path, formats):
+    """형식별 출력 경로 - output_path 의 확장자만 바꿈"""
+    base = os.path.splitext(output_path)[0]
+    return {fmt: f'{base}.{fmt}' for fmt in formats}
+
+
+def convert(data, fmt):
+    """컴파일된 sfnt 바이트를 fmt 형식 바이트로 변환 (테이블은 다시 컴파일하지 않음)"""
+    if fmt in SFNT_FORMATS:
+        return data
+    # 컴파일된 테이블 바이트를 그대로 재사용하고 컨테이너만 바꿈
+    font = TTFont(io.BytesIO(data), recalcBBoxes=False, recalcTimestamp=False)
+    font.flavor = fmt
+    out = io.BytesIO()
+    level = _HEAD_LOG.level
+    _HEAD_LOG.setLevel(logging.ERROR)
+    try:
+        font.save(out, reorderTables=False)
+    finally:
+        _HEAD_LOG.setLevel(level)
+        font.close()
+    return out.getvalue()
+
+
+def save_formats(font, output_path, formats):
+    """TTFont 을 형식별로 저장하고 {형식: (경로, 바이트 수)} 반환"""
+    paths = output_paths(output_path, check_formats(formats))
+
+    buf = io.BytesIO()
+    font.save(buf)
+    data = buf.getvalue()
+
+    sizes = {}
+    for fmt, path in paths.items():
+        with open(path, 'wb') as f:
+            f.write(convert(data, fmt))
+        sizes[fmt] = (path, os.path.getsize(path))
+    return sizes
+
+
+def _sfnt_size(sizes):
+    return next((sizes[fmt] for fmt in SFNT_FORMATS if fmt in sizes), None)
+
+
+def format_sizes(sizes):
+    """크기 비교 문자열 (ttf/otf 대비 비율 포함) - sizes: {형식: 바이트 수}"""
+    base = _sfnt_size(sizes)
+    parts = []
+    for fmt, size in sizes.items():
+        part = f'{fmt} {size:,}B'
+        if base and fmt not in SFNT_FORMATS:
+            part += f' ({(size - base) / base * 100:+.0f}%)'
+        parts.append(part)
+    return ', '.join(parts)
+
+
+def write_size_report(report_path, fonts):
+    """폰트별 형식 크기 보고서를 JSON 으로 저장
+
+    fonts: {폰트 이름: {형식: 바이트 수}}
+    """
+    report = {}
+    for font_name, sizes in fonts.items():
+        entry = dict(sizes)
+        base = _sfnt_size(sizes)
+        if base:
+            for fmt in ('woff', 'woff2'):
+                if fmt in sizes:
+                    entry[f'{fmt}_saving'] = round(1 - sizes[fmt] / base, 4)
+        report[font_name] = entry
+    os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return report
@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+폰트 견본 / 썸네일 렌더러 - 브라우저 없이 샘플 글을 PNG / WebP 이미지로 그림
+- fontTools 펜으로 윤곽선을 픽셀 좌표의 선분으로 펴고 (곡선은 허용 오차 안에서 분할)
+  NumPy 스캔라인 래스터라이저로 안티에일리어싱 (세로 OVERSAMPLE 줄, 가로는 교차점 면적)
+- 글리프마다 따로 비트맵을 만들고 (가로 위치는 1/SUBPIXEL_STEPS 픽셀 단위) 캔버스에 합성
+  (glyph_raster_cache 를 주면 같은 글리프 / 크기 / 위치는 캐시된 비트맵을 복사)
+- 줄바꿈 / 크기 맞춤은 text_layout, 글자 폭 / 커닝은 text_metrics 사용
+- 배치: 폰트 × 샘플 조합을 프로세스 풀에서 그려 폰트별 썸네일과 스프라이트 시트
+  (+ 좌표 매니페스트 JSON) 로 저장 - 갤러리 카드는 폰트를 열기 전까지 이미지를 쓸 수 있음
+- PNG 는 zlib 으로 직접 인코딩, WebP 는 Pillow 패키지가 있을 때만
+"""
+
+import argparse
+import io
+import json
+import math
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from fontTools.pens.basePen import BasePen
+from fontTools.ttLib import TTFont
+
+import font_catalog
+import glyph_raster_cache
+import text_layout
+import text_metrics
+from cli_options import positive_int
+
+# 세로 방향 샘플 줄 수 (픽셀 한 줄당)
+OVERSAMPLE = 4
+# 글리프 가로 위치 양자화 단계 (픽셀당)
+SUBPIXEL_STEPS = 4
+# 곡선을 선분으로 펼 때 허용 오차 (픽셀)
+FLATTEN_TOLERANCE = 0.2
+
+IMAGE_FORMATS = ('png', 'webp')
+OUTPUT_DIR = os.path.join('fonts', 'web', 'thumbnails')
+
+DEFAULT_SAMPLES = [
+    '다람쥐 헌 쳇바퀴에 타고파',
+    '가나다라 ABC 123',
+    'The quick brown fox',
+]
+
+
+def check_image_formats(formats):
+    """이미지 형식 목록 검증 (webp 는 Pillow 패키지 필요)"""
+    formats = tuple(formats)
+    unknown = [f for f in formats if f not in IMAGE_FORMATS]
+    if unknown or not formats:
+        raise ValueError(f"지원하지 않는 이미지 형식: {unknown or formats} "
+                         f"(가능: {', '.join(IMAGE_FORMATS)})")
+    if 'webp' in formats:
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            raise RuntimeError("webp 출력에는 Pillow 패키지가 필요합니다 "
+                               "(pip install Pillow)") from None
+    return formats
+
+
+# ============================================
+# 윤곽선 → 선분
+# ============================================
+
+class FlattenPen(BasePen):
+    """윤곽선을 픽셀 좌표 선분 (x0, y0, x1, y1) 목록으로 (y 는 아래로 증가, 기준선이 0)"""
+
+    def __init__(self, glyph_set, scale, dx=0.0, tolerance=FLATTEN_TOLERANCE):
+        super().__init__(glyph_set)
+        self.scale = scale
+        self.dx = dx
+        self.tolerance = tolerance
+        self.edges = []
+        self._start = None
+
+    def _point(self, pt):
+        return pt[0] * self.scale + self.dx, -pt[1] * self.scale
+
+    def _moveTo(self, pt):
+        self._start = self._point(pt)
+        self._last = self._start
+
+    def _lineTo(self, pt):
+        p = self._point(pt)
+        self.edges.append(self._last + p)
+        self._last = p
+
+    def _segments(self, deviation):
+        return max(1, math.ceil(math.sqrt(deviation / self.tolerance)))
+
+    def _qCurveToOne(self, pt1, pt2):
+        (x0, y0), (x1, y1), (x2, y2) = self._last, self._point(pt1), self._point(pt2)
+        n = self._segments(math.hypot(x0 - 2 * x1 + x2, y0 - 2 * y1 + y2) / 4)
+        for i in range(1, n + 1):
+            t = i / n
+            u = 1 - t
+            p = (u * u * x0 + 2 * u * t * x1 + t * t * x2,
+                 u * u * y0 + 2 * u * t * y1 + t * t * y2)
+            self.edges.append(self._last + p)
+            self._last = p
+
+    def _curveToOne(self, pt1, pt2, pt3):
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = (
+            self._last, self._point(pt1), self._point(pt2), self._point(pt3))
+        n = self._segments(0.75 * max(math.hypot(x0 - 2 * x1 + x2, y0 - 2 * y1 + y2),
+                                      math.hypot(x1 - 2 * x2 + x3, y1 - 2 * y2 + y3)))
+        for i in range(1, n + 1):
+            t = i / n
+            u = 1 - t
+            p = (u ** 3 * x0 + 3 * u * u * t * x1 + 3 * u * t * t * x2 + t ** 3 * x3,
+                 u ** 3 * y0 + 3 * u * u * t * y1 + 3 * u * t * t * y2 + t ** 3 * y3)
+            self.edges.append(self._last + p)
+            self._last = p
+
+    def _closePath(self):
+        if self._start is not None and self._last != self._start:
+            self.edges.append(self._last + self._start)
+        self._start = None
+
+    _endPath = _closePath
+
+
+# ============================================
+# 스캔라인 래스터라이저
+# ============================================
+
+def rasterize(edges, width, height, oversample=OVERSAMPLE):
+    """선분 배열 (n, 4) → 덮인 비율 (height, width) float32 (nonzero 채우기 규칙)
+
+    샘플 줄(픽셀당 oversample 개)마다 선분과의 교차점을 한꺼번에 구하고, 교차점의
+    가로 위치 비율만큼 두 칸에 방향(+1 / -1)을 나눠 더한 뒤 누적합으로 감김 수를 얻는다.
+    """
+    edges = np.asarray(edges, dtype=np.float64).reshape(-1, 4)
+    x0, y0, x1, y1 = edges.T
+    rows = height * oversample
+    # 샘플 줄 j 의 y = (j + 0.5) / oversample, 선분의 [ymin, ymax) 구간과 만나는 줄만
+    ymin, ymax = np.minimum(y0, y1), np.maximum(y0, y1)
+    j0 = np.clip(np.ceil(ymin * oversample - 0.5), 0, rows).astype(np.int64)
+    j1 = np.clip(np.ceil(ymax * oversample - 0.5), 0, rows).astype(np.int64)
+    counts = np.maximum(j1 - j0, 0)
+    total = int(counts.sum())
+    coverage = np.zeros((rows, width + 2), dtype=np.float64)
+    if total:
+        edge = np.repeat(np.arange(len(edges)), counts)
+        offsets = np.cumsum(counts) - counts
+        j = j0[edge] + np.arange(total) - offsets[edge]
+        y = (j + 0.5) / oversample
+        ex0, ey0, ex1, ey1 = x0[edge], y0[edge], x1[edge], y1[edge]
+        x = ex0 + (y - ey0) * (ex1 - ex0) / (ey1 - ey0)
+        direction = np.where(ey1 > ey0, 1.0, -1.0)
+        x = np.clip(x, 0, width + 1)
+        cell = np.floor(x).astype(np.int64)
+        frac = x - cell
+        flat = j * (width + 2) + cell
+        size = rows * (width + 2)
+        coverage = (np.bincount(flat, direction * (1 - frac), size)
+                    + np.bincount(np.minimum(flat + 1, size - 1), direction * frac, size))
+        coverage = coverage.reshape(rows, width + 2)
+    winding = np.cumsum(coverage, axis=1)[:, :width]
+    covered = np.minimum(np.abs(winding), 1.0)
+    return covered.reshape(height, oversample, width).mean(axis=1).astype(np.float32)
+
+
+# ============================================
+# 폰트 하나
+# ============================================
+
+class FontRenderer:
+    """폰트 파일 하나의 글리프 비트맵과 글 렌더링
+
+    cache: glyph_raster_cache.RasterCache / SharedRasterCache (없으면 매번 래스터화)
+    """
+
+    def __init__(self, path, cache=None):
+        self.path = path
+        self.font = TTFont(path, lazy=True)
+        self.glyph_set = self.font.getGlyphSet()
+        self.glyph_order = self.font.getGlyphOrder()
+        self.metrics = text_metrics.get_metrics(path)
+        self.units_per_em = self.metrics.units_per_em
+        self.cache = cache
+        if cache is not None:
+            self.font_id = glyph_raster_cache.font_id(
+                self.metrics.sha256 or font_catalog.file_hash(path))
+
+    def close(self):
+        self.font.close()
+
+    def glyph_bitmap(self, gid, size, subpixel=0):
+        """(비트맵 uint8 (h, w), 왼쪽, 위) - 펜 위치 기준 오프셋, 위는 기준선에서 아래로 +
+
+        subpixel: 가로 위치 (0 ~ SUBPIXEL_STEPS - 1) × 1/SUBPIXEL_STEPS 픽셀
+        """
+        pen = FlattenPen(self.glyph_set, size / self.units_per_em, subpixel / SUBPIXEL_STEPS)
+        self.glyph_set[self.glyph_order[gid]].draw(pen)
+        if not pen.edges:
+            return np.zeros((0, 0), dtype=np.uint8), 0, 0
+        edges = np.array(pen.edges)
+        left = math.floor(min(edges[:, 0].min(), edges[:, 2].min()))
+        top = math.floor(min(edges[:, 1].min(), edges[:, 3].min()))
+        right = math.ceil(max(edges[:, 0].max(), edges[:, 2].max()))
+        bottom = math.ceil(max(edges[:, 1].max(), edges[:, 3].max()))
+        edges -= (left, top, left, top)
+        coverage = rasterize(edges, max(right - left, 1), max(bottom - top, 1))
+        return (coverage * 255 + 0.5).astype(np.uint8), left, top
+
+    def glyph(self, gid, size, subpixel=0):
+        """glyph_bitmap 과 같지만 캐시가 있으면 양자화한 크기로 그려 캐시에서 재사용"""
+        if self.cache is None:
+            return self.glyph_bitmap(gid, size, subpixel)
+        size_key, size = glyph_raster_cache.quantize_size(size)
+        key = (self.font_id, gid, size_key, subpixel)
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = self.glyph_bitmap(gid, size, subpixel)
+            self.cache.put(key, entry)
+        return entry
+
+    def draw_line(self, canvas, text, size, x, baseline, kerning=True):
+        """canvas(uint8) 에 글 한 줄을 그림 - x 는 왼쪽 끝, baseline 은 기준선 y (픽셀)"""
+        if not text:
+            return
+        codes, starts, _ = text_metrics.encode([text])
+        gids = self.metrics.lookup(codes)
+        advances = self.metrics.char_advances(codes, starts, kerning)
+        pens = np.concatenate(([0], np.cumsum(advances)[:-1])) * (size / self.units_per_em) + x
+        base = int(round(baseline))
+        height, width = canvas.shape
+        for code, gid, pen_x in zip(codes.tolist(), gids.tolist(), pens.tolist()):
+            if code < 0x20:
+                continue
+            origin = math.floor(pen_x)
+            subpixel = int(round((pen_x - origin) * SUBPIXEL_STEPS))
+            if subpixel == SUBPIXEL_STEPS:
+                origin, subpixel = origin + 1, 0
+            bitmap, left, top = self.glyph(gid, size, subpixel)
+            if not bitmap.size:
+                continue
+            _composite(canvas, bitmap, origin + left, base + top)
+
+    def render(self, text, width, height, padding=12, max_size=72, max_lines=2,
+               word_break='keep-all', line_height=None):
+        """text 를 width × height 상자에 들어가는 가장 큰 크기로 그린 알파 값 (uint8)
+
+        줄바꿈 / 크기 맞춤은 text_layout 와 같고, 줄 묶음은 상자 세로 가운데에 놓는다.
+        """
+        canvas = np.zeros((height, width), dtype=np.uint8)
+        inner_w, inner_h = width - 2 * padding, height - 2 * padding
+        prepared = text_layout.PreparedText([text], self.metrics, word_break)
+        size = prepared.fit_size(0, inner_w, inner_h, min_size=6, max_size=max_size,
+                                 line_height=line_height, max_lines=max_lines)
+        lines = prepared.lines(0, inner_w * self.units_per_em / size)
+        info = self.metrics.info
+        line_px = (line_height or prepared.natural_line) * size
+        top = padding + (inner_h - line_px * len(lines)) / 2
+        gap = (line_px - (info['ascender'] - info['descender']) * size / self.units_per_em) / 2
+        for i, (a, b, _) in enumerate(lines):
+            baseline = top + i * line_px + gap + info['ascender'] * size / self.units_per_em
+            self.draw_line(canvas, text[a:b].rstrip(), size, padding, baseline)
+        return canvas
+
+
+def _composite(canvas, bitmap, x, y):
+    """비트맵을 (x, y) 에 더해 합성 (겹친 곳은 255 에서 자름, 캔버스 밖은 잘라냄)"""
+    height, width = canvas.shape
+    h, w = bitmap.shape
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, width), min(y + h, height)
+    if x0 >= x1 or y0 >= y1:
+        return
+    region = canvas[y0:y1, x0:x1]
+    part = bitmap[y0 - y:y1 - y, x0 - x:x1 - x]
+    np.minimum(region.astype(np.uint16) + part, 255, out=region, casting='unsafe')
+
+
+# ============================================
+# 이미지 인코딩
+# ============================================
+
+def _hex_color(color):
+    color = color.lstrip('#')
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def _pixels(alpha, color):
+    """알파 값 + 글자 색 → (PNG 색 형식, 채널 배열) - 회색이면 회색+알파, 아니면 RGBA"""
+    r, g, b = _hex_color(color)
+    if r == g == b:
+        return 4, np.dstack([np.full_like(alpha, r), alpha])
+    return 6, np.dstack([np.full_like(alpha, r), np.full_like(alpha, g),
+                         np.full_like(alpha, b), alpha])
+
+
+def encode_png(alpha, color='#222222'):
+    """알파 값 (uint8) → PNG 바이트 (배경 투명)"""
+    color_type, pixels = _pixels(alpha, color)
+    height, width = alpha.shape
+    rows = pixels.reshape(height, -1)
+    raw = np.hstack([np.zeros((height, 1), dtype=np.uint8), rows]).tobytes()
+
+    def chunk(tag, data):
+        return (struct.pack('>I', len(data)) + tag + data
+                + struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+    header = struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(raw, 9)) + chunk(b'IEND', b''))
+
+
+def encode_webp(alpha, color='#222222', quality=90):
+    """알파 값 (uint8) → WebP 바이트 (Pillow 필요)"""
+    from PIL import Image
+    r, g, b = _hex_color(color)
+    pixels = np.dstack([np.full_like(alpha, r), np.full_like(alpha, g),
+                        np.full_like(alpha, b), alpha])
+    buf = io.BytesIO()
+    Image.fromarray(pixels, 'RGBA').save(buf, 'WEBP', quality=quality, method=6)
+    return buf.getvalue()
+
+
+def encode_image(alpha, fmt, color='#222222'):
+    return encode_png(alpha, color) if fmt == 'png' else encode_webp(alpha, color)
+
+
+def _write(path, data):
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+# ============================================
+# 배치 (폰트 × 샘플)
+# ============================================
+
+# 워커 프로세스의 글리프 비트맵 캐시 (_init_worker 에서 설정)
+_CACHE = None
+
+
+def _init_worker(shared_spec=None, cache_bytes=None):
+    """워커 초기화 - 공유 캐시에 연결하거나 프로세스 안 캐시를 만듦 (cache_bytes 0 이면 끔)"""
+    global _CACHE
+    if shared_spec is not None:
+        _CACHE = glyph_raster_cache.SharedRasterCache.attach(shared_spec)
+    elif cache_bytes != 0:
+        _CACHE = glyph_raster_cache.RasterCache(cache_bytes)
+
+
+def render_font(path, samples, width, height, formats, output_dir, color, max_lines,
+                word_break):
+    """워커: 폰트 하나로 샘플을 모두 그려 썸네일을 저장하고 알파 값 목록을 돌려줌"""
+    started = time.perf_counter()
+    renderer = FontRenderer(path, _CACHE)
+    try:
+        images = [renderer.render(text, width, height, max_lines=max_lines,
+                                  word_break=word_break) for text in samples]
+    finally:
+        renderer.close()
+    stem = os.path.splitext(os.path.basename(path))[0]
+    files = []
+    for i, alpha in enumerate(images):
+        for fmt in formats:
+            file_name = f'{stem}-{i}.{fmt}'
+            _write(os.path.join(output_dir, file_name), encode_image(alpha, fmt, color))
+            files.append(file_name)
+    return {'file': os.path.basename(path), 'images': images, 'files': files,
+            'seconds': time.perf_counter() - started, 'pid': os.getpid(),
+            'cache': _CACHE.stats() if isinstance(_CACHE, glyph_raster_cache.RasterCache) else None}
+
+
+def build_sprite(results, samples, width, height, formats, output_dir, color):
+    """폰트별 한 줄, 샘플별 한 칸의 스프라이트 시트와 좌표 매니페스트 저장"""
+    sheet = np.zeros((height * len(results), width * len(samples)), dtype=np.uint8)
+    fonts = {}
+    for row, result in enumerate(results):
+        for col, alpha in enumerate(result['images']):
+            sheet[row * height:(row + 1) * height, col * width:(col + 1) * width] = alpha
+        fonts[result['file']] = {
+            'y': row * height,
+            'thumbnails': result['files'],
+        }
+    sprites = {}
+    for fmt in formats:
+        file_name = f'sprite.{fmt}'
+        data = encode_image(sheet, fmt, color)
+        _write(os.path.join(output_dir, file_name), data)
+        sprites[fmt] = {'file': file_name, 'bytes': len(data)}
+    manifest = {
+        'cell': [width, height],
+        'samples': [{'text': text, 'x': i * width} for i, text in enumerate(samples)],
+        'sprites': sprites,
+        'fonts': fonts,
+    }
+    manifest_path = os.path.join(output_dir, 'sprite.json')
+    tmp_path = f'{manifest_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, manifest_path)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='폰트 샘플 썸네일 / 스프라이트 시트 렌더링')
+    parser.add_argument('--fonts', nargs='+', help='폰트 파일 이름 또는 경로 (기본: fonts/ 전체)')
+    parser.add_argument('--samples', nargs='+', default=DEFAULT_SAMPLES, help='샘플 글')
+    parser.add_argument('--width', type=int, default=480, help='썸네일 폭 (px)')
+    parser.add_argument('--height', type=int, default=120, help='썸네일 높이 (px)')
+    parser.add_argument('--max-lines', type=int, default=2, help='샘플 하나의 최대 줄 수')
+    parser.add_argument('--word-break', default='keep-all', choices=text_layout.WORD_BREAKS)
+    parser.add_argument('--color', default='#222222', help='글자 색 (배경은 투명)')
+    parser.add_argument('--formats', nargs='+', default=['png'], help='png / webp')
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help='출력 디렉터리')
+    parser.add_argument('--cache-mb', type=float, default=glyph_raster_cache.RASTER_CACHE_MAX_MB,
+                        help='글리프 비트맵 캐시 용량 (MB, 0 이면 끔)')
+    parser.add_argument('--shared-cache', action='store_true',
+                        help='워커들이 공유 메모리 캐시 하나를 같이 씀')
+    parser.add_argument('-j', '--jobs', type=positive_int, default=os.cpu_count(),
+                        help='병렬 렌더링 프로세스 수 (기본: CPU 코어 수)')
+    args = parser.parse_args()
+
+    formats = check_image_formats(args.formats)
+    paths = ([p if os.path.exists(p) else os.path.join(font_catalog.FONT_DIR, p)
+              for p in args.fonts] if args.fonts else font_catalog.font_paths())
+    os.makedirs(args.output_dir, exist_ok=True)
+    # 메트릭 캐시는 워커들이 같은 파일을 만들지 않게 그릴 폰트만 미리 준비
+    for path in paths:
+        text_metrics.get_metrics(path)
+
+    started = time.perf_counter()
+    task = (args.samples, args.width, args.height, formats, args.output_dir, args.color,
+            args.max_lines, args.word_break)
+    cache_bytes = int(args.cache_mb * 1024 * 1024)
+    shared = (glyph_raster_cache.SharedRasterCache.create(cache_bytes)
+              if args.shared_cache and cache_bytes else None)
+    results = []
+    try:
+        with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker,
+                                 initargs=(shared.spec if shared else None, cache_bytes)) as executor:
+            futures = [executor.submit(render_font, path, *task) for path in paths]
+            for future in futures:
+                result = future.result()
+                results.append(result)
+                print(f"🖼️  {result['file']:<30} 샘플 {len(args.samples)}개 "
+                      f"({result['seconds']:.2f}s)")
+        if shared:
+            stats = shared.stats()
+        else:
+            # 워커별 누적 값 중 마지막 것만 합산
+            last = {r['pid']: r['cache'] for r in results if r['cache']}
+            stats = {key: sum(s[key] for s in last.values())
+                     for key in ('hits', 'misses', 'evictions', 'bytes')}
+    finally:
+        if shared:
+            shared.close()
+
+    manifest = build_sprite(results, args.samples, args.width, args.height, formats,
+                            args.output_dir, args.color)
+    print()
+    for fmt, sprite in manifest['sprites'].items():
+        print(f"📁 스프라이트: {os.path.join(args.output_dir, sprite['file'])} "
+              f"({sprite['bytes'] / 1024:,.0f}KB)")
+    if cache_bytes:
+        lookups = stats['hits'] + stats['misses']
+        print(f"🗃️  글리프 캐시{' (공유 메모리)' if shared else ''}: 적중 {stats['hits']:,} / "
+              f"{lookups:,} ({stats['hits'] / max(lookups, 1):.0%}), 교체 {stats['evictions']:,}, "
+              f"{stats['bytes'] / 1024:,.0f}KB")
+    print(f"⏱️  폰트 {len(results)}개 × 샘플 {len(args.samples)}개 "
+          f"{time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
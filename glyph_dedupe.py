@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+윤곽선 중복 제거 - 반복되는 윤곽선을 합성 글리프 참조로 바꿔 glyf 크기를 줄임
+- 윤곽선을 첫 점이 원점에 오도록 옮긴(이동 불변) 형태로 해시해 여러 번 나오는 모양을 찾음
+- 반복되는 모양은 부품 글리프(_part1, _part2, ...) 하나로 두고 오프셋만 있는 구성 요소로 참조
+- TrueType 글리프는 윤곽선과 구성 요소를 섞을 수 없으므로 남은 윤곽선은
+  '<이름>.rest' 글리프로 묶어 함께 참조
+- 윤곽선 전체가 같은 글리프(같은 경로를 공유하는 대소문자 등)는 앞 글리프를 그대로 참조
+- 예상 바이트(glyf + loca + hmtx + post 이름)가 줄어드는 경우에만 바꿈
+"""
+
+from collections import Counter
+
+from glyph_path import GlyphPath, compile_paths, tt_glyph
+
+IDENTITY = (1, 0, 0, 1)
+REST_SUFFIX = '.rest'
+PART_PREFIX = '_part'
+
+# 단순 글리프 헤더(윤곽선 수 + 경계 상자) + instructionLength
+_SIMPLE_HEADER = 12
+# 합성 글리프 헤더 (윤곽선 수 + 경계 상자)
+_COMPOSITE_HEADER = 10
+# 글리프 하나를 늘리는 고정 비용: loca(4) + hmtx(4) + post 이름 색인(2) + 이름 길이(1)
+_GLYPH_OVERHEAD = 11
+
+
+def _component_size(dx, dy):
+    """구성 요소 레코드 크기 - flags + glyphIndex + 오프셋 (바이트 범위면 1바이트씩)"""
+    return 4 + (2 if -128 <= dx <= 127 and -128 <= dy <= 127 else 4)
+
+
+def _new_glyph_size(name, contour_bytes):
+    """윤곽선 contour_bytes 바이트짜리 단순 글리프를 새로 추가하는 비용"""
+    return _GLYPH_OVERHEAD + len(name) + _SIMPLE_HEADER + contour_bytes
+
+
+def _contour_size(contour):
+    """윤곽선 하나가 단순 글리프 안에서 차지하는 바이트 (endPtsOfContours 포함)
+
+    한 점짜리처럼 glyf 에 남지 않는 윤곽선은 0.
+    """
+    glyph = tt_glyph(contour)
+    if not glyph.numberOfContours:
+        return 0
+    return len(glyph.compile(None)) - _SIMPLE_HEADER
+
+
+def _offset(dx, dy):
+    """이동만 있는 구성 요소 변환 (xx, xy, yx, yy, dx, dy)"""
+    return IDENTITY + (dx, dy)
+
+
+# ============================================
+# 모양 수집
+# ============================================
+
+class _Shapes:
+    """정규화된 윤곽선 모양 → (GlyphPath, 바이트)"""
+
+    def __init__(self):
+        self.paths = {}
+        self.sizes = {}
+
+    def add(self, contour):
+        """윤곽선을 첫 점 기준으로 옮겨 (모양 키, dx, dy) 반환"""
+        dx, dy = contour.coords[0], contour.coords[1]
+        normal = contour.translated(-dx, -dy)
+        key = (normal.ops.tobytes(), normal.coords.tobytes())
+        if key not in self.sizes:
+            self.paths[key] = normal
+            self.sizes[key] = _contour_size(normal)
+        return key, dx, dy
+
+
+def _collect(glyphs, shapes):
+    """({글리프: [(모양 키, dx, dy), ...]}, {같은 윤곽선 글리프: 앞 글리프})"""
+    items = {}
+    aliases = {}
+    first = {}
+    for name, glyph in glyphs.items():
+        if name == '.notdef' or 'components' in glyph:
+            continue
+        path = compile_paths(glyph.get('paths', []))
+        if not path.coords:
+            continue
+        whole = (path.ops.tobytes(), path.coords.tobytes())
+        if whole in first:
+            aliases[name] = first[whole]
+            continue
+        first[whole] = name
+        glyph_items = []
+        for contour in path.contours():
+            if not contour.coords:
+                continue
+            item = shapes.add(contour)
+            if shapes.sizes[item[0]]:
+                glyph_items.append(item)
+        items[name] = glyph_items
+    return items, aliases
+
+
+# ============================================
+# 바꿀 글리프 / 부품 선택
+# ============================================
+
+def _choose(items, sizes):
+    """바이트가 줄어드는 글리프만 고르고, 두 번 이상 쓰여 이득인 모양만 남을 때까지 반복
+
+    반환: {글리프: (부품으로 참조할 항목, .rest 로 묶을 항목)}
+    """
+    counts = Counter(key for glyph_items in items.values() for key, _, _ in glyph_items)
+    candidates = {key for key, count in counts.items() if count >= 2}
+    while True:
+        converted = {}
+        for name, glyph_items in items.items():
+            shared = [item for item in glyph_items if item[0] in candidates]
+            if not shared:
+                continue
+            rest = [item for item in glyph_items if item[0] not in candidates]
+            simple = _SIMPLE_HEADER + sum(sizes[key] for key, _, _ in glyph_items)
+            composite = _COMPOSITE_HEADER + sum(_component_size(dx, dy) for _, dx, dy in shared)
+            if rest:
+                composite += _component_size(0, 0) + _new_glyph_size(
+                    name + REST_SUFFIX, sum(sizes[key] for key, _, _ in rest))
+            if composite < simple:
+                converted[name] = (shared, rest)
+
+        # 부품 글리프 비용을 쓰임새로 메우지 못하는 모양은 후보에서 뺌
+        uses = Counter(key for shared, _ in converted.values() for key, _, _ in shared)
+        part_name = f'{PART_PREFIX}{len(candidates)}'
+        kept = {key for key in candidates
+                if uses[key] >= 2
+                and uses[key] * (sizes[key] - _component_size(0, 0))
+                > _new_glyph_size(part_name, sizes[key])}
+        if kept == candidates:
+            return converted
+        candidates = kept
+
+
+# ============================================
+# 공개 API
+# ============================================
+
+def added_glyphs(glyphs):
+    """dedupe_glyphs 가 추가한 부품 / .rest 글리프 이름 (글자가 아니므로 폭 평균 등에서 제외)"""
+    return [name for name in glyphs
+            if name.startswith(PART_PREFIX) or name.endswith(REST_SUFFIX)]
+
+
+def dedupe_glyphs(glyphs):
+    """반복 윤곽선을 부품 글리프 참조로 바꾼 새 글리프 dict 반환 (바꿀 것이 없으면 그대로)
+
+    부품 / .rest 글리프는 dict 맨 뒤에 추가하고 (cmap 에는 넣지 않음), 원래 글리프의
+    순서(글리프 ID)와 폭은 그대로 유지한다. 윤곽선은 정수 오프셋만큼 옮기므로 풀어 그린
+    결과가 원래 윤곽선과 같다. 추가한 글리프 이름은 added_glyphs 로 구한다.
+    """
+    shapes = _Shapes()
+    items, aliases = _collect(glyphs, shapes)
+    converted = _choose(items, shapes.sizes)
+    if not converted and not aliases:
+        return glyphs
+
+    # 부품 폭은 소유 글리프 폭 이상이면서 마지막 글리프 폭과 같게 해 hhea 값과 hmtx 의
+    # 끝 반복 구간을 유지 (xAvgCharWidth 평균에서는 빠지도록 added_glyphs 로 알려 줌)
+    last_width = glyphs[next(reversed(glyphs))]['width']
+
+    def width_for(name):
+        return max(glyphs[name]['width'], last_width)
+
+    parts = {}
+    for name, (shared, _) in converted.items():
+        for key, dx, dy in shared:
+            if key not in parts:
+                parts[key] = (f'{PART_PREFIX}{len(parts) + 1}', dx, dy, width_for(name))
+
+    deduped = {}
+    for name, glyph in glyphs.items():
+        if name in aliases:
+            components = [(aliases[name], _offset(0, 0))]
+        elif name in converted:
+            shared, rest = converted[name]
+            components = [(name + REST_SUFFIX, _offset(0, 0))] if rest else []
+            for key, dx, dy in shared:
+                part, part_dx, part_dy, _ = parts[key]
+                components.append((part, _offset(dx - part_dx, dy - part_dy)))
+        else:
+            deduped[name] = glyph
+            continue
+        deduped[name] = {'width': glyph['width'], 'components': components}
+
+    # 새 글리프는 맨 뒤에 추가 (기존 글리프 ID 가 바뀌지 않음)
+    for key, (part, dx, dy, width) in parts.items():
+        deduped[part] = {'width': width, 'paths': shapes.paths[key].translated(dx, dy)}
+    for name, (_, rest) in converted.items():
+        if rest:
+            paths = GlyphPath.join([shapes.paths[key].translated(dx, dy) for key, dx, dy in rest])
+            deduped[name + REST_SUFFIX] = {'width': width_for(name), 'paths': paths}
+    return deduped
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+벡터화 메트릭 계산 - 글리프 dict 의 좌표 배열에서 경계 상자와 폰트 전체 메트릭을 한 번에 구함
+- 단순 글리프: 모든 좌표를 (N, 2) 배열 하나로 모아 글리프 구간별 min/max (reduceat)
+- 합성 글리프: 중첩 깊이 순서로 구성 요소 경계 상자를 변환해 합침
+  (tt_composite 와 같은 F2Dot14 양자화 / 오프셋 반올림, ScaledComposite 와 같은 규칙)
+- 왼쪽 여백, head / hhea / maxp 값, xAvgCharWidth, 실측 대문자 / 소문자 높이
+- 빌더는 이 값을 glyf 글리프와 테이블에 채우고 저장 시 재계산을 끈다 (recalcBBoxes)
+"""
+
+import numpy as np
+
+from glyph_path import compile_paths, contour_lengths
+
+# 실측 높이를 재는 글리프 (OS/2 sCapHeight / sxHeight 정의와 같음)
+CAP_HEIGHT_GLYPH = 'H'
+X_HEIGHT_GLYPH = 'x'
+
+_F2DOT14 = 1 << 14
+
+
+def _ot_round(values):
+    """fontTools otRound 와 같은 반올림 (floor(v + 0.5))"""
+    return np.floor(np.asarray(values, dtype=float) + 0.5)
+
+
+class GlyphMetrics:
+    """글리프 순서대로 정렬한 메트릭 배열
+
+    bounds: (n, 4) xMin, yMin, xMax, yMax (정수, 윤곽선이 없으면 0)
+    outlined: glyf numberOfContours 가 0 이 아닌 글리프 (합성 글리프 포함)
+    averaged: xAvgCharWidth 에 넣는 글리프 (중복 제거 부품 글리프 등은 제외)
+    """
+
+    def __init__(self, names, widths, bounds, outlined, maxp, averaged=None):
+        self.names = names
+        self.widths = widths
+        self.bounds = bounds
+        self.outlined = outlined
+        self.maxp = maxp
+        self.averaged = np.ones(len(names), dtype=bool) if averaged is None else averaged
+        self._index = {name: i for i, name in enumerate(names)}
+
+    # ----- 글리프별 값 -----
+
+    def glyph_bounds(self, name):
+        return tuple(self.bounds[self._index[name]].tolist())
+
+    @property
+    def lsb(self):
+        return self.bounds[:, 0]
+
+    def horizontal_metrics(self):
+        """{이름: (폭, 왼쪽 여백)} - setupHorizontalMetrics 입력"""
+        return dict(zip(self.names, zip(self.widths, self.lsb.tolist())))
+
+    # ----- 폰트 전체 값 -----
+
+    @property
+    def font_bbox(self):
+        box = self.bounds[self.outlined]
+        if not len(box):
+            return (0, 0, 0, 0)
+        return (int(box[:, 0].min()), int(box[:, 1].min()),
+                int(box[:, 2].max()), int(box[:, 3].max()))
+
+    def hhea_values(self):
+        """advanceWidthMax / minLeftSideBearing / minRightSideBearing / xMaxExtent"""
+        values = {'advanceWidthMax': max(self.widths)}
+        box = self.bounds[self.outlined]
+        if not len(box):
+            values.update(minLeftSideBearing=0, minRightSideBearing=0, xMaxExtent=0)
+            return values
+        advances = np.array(self.widths)[self.outlined]
+        extent = box[:, 2] - box[:, 0]
+        values['minLeftSideBearing'] = int(box[:, 0].min())
+        values['minRightSideBearing'] = int((advances - box[:, 0] - extent).min())
+        values['xMaxExtent'] = int((box[:, 0] + extent).max())
+        return values
+
+    @property
+    def avg_char_width(self):
+        """OS/2 xAvgCharWidth - 폭이 0 보다 큰 글리프의 평균 (averaged 가 아닌 글리프 제외)"""
+        widths = np.array(self.widths)
+        widths = widths[(widths > 0) & self.averaged]
+        return int(_ot_round(widths.mean())) if len(widths) else 0
+
+    def measured_height(self, name):
+        """글리프 윗변 높이 (글리프가 없거나 비어 있으면 None)"""
+        index = self._index.get(name)
+        if index is None or not self.outlined[index]:
+            return None
+        return int(self.bounds[index, 3])
+
+    @property
+    def cap_height(self):
+        return self.measured_height(CAP_HEIGHT_GLYPH)
+
+    @property
+    def x_height(self):
+        return self.measured_height(X_HEIGHT_GLYPH)
+
+    # ----- 폰트에 적용 -----
+
+    def apply(self, font):
+        """glyf 글리프 경계 상자와 head / hhea / maxp / OS/2 값을 채우고 저장 시 재계산을 끔
+
+        fontTools 는 저장할 때 glyf / head / hhea / maxp 를 위해 합성 글리프를 따라가며
+        경계 상자와 점 개수를 여러 번 다시 구한다. 결과는 그 재계산과 같다.
+        """
+        glyf = font['glyf']
+        for name, (x_min, y_min, x_max, y_max) in zip(self.names, self.bounds.tolist()):
+            glyph = glyf.glyphs[name]
+            glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax = x_min, y_min, x_max, y_max
+
+        head = font['head']
+        head.xMin, head.yMin, head.xMax, head.yMax = self.font_bbox
+        # hmtx 왼쪽 여백이 모두 xMin 과 같음 (head flags bit 1)
+        head.flags |= 0x2
+
+        hhea = font['hhea']
+        for key, value in self.hhea_values().items():
+            setattr(hhea, key, value)
+
+        maxp = font['maxp']
+        for key, value in self.maxp.items():
+            setattr(maxp, key, value)
+
+        font['OS/2'].xAvgCharWidth = self.avg_char_width
+        font.recalcBBoxes = False
+
+
+# ============================================
+# 계산
+# ============================================
+
+def _simple_metrics(glyphs, names, index):
+    """단순 글리프 경계 상자와 (점 수, 윤곽선 수) - tt_glyph 규칙
+
+    tt_glyph 는 한 점짜리 윤곽선을 버리고 시작점과 같은 마지막 점을 지운다.
+    """
+    chunks = []
+    lengths = []
+    owners = []
+    for name in names:
+        glyph = glyphs[name]
+        path = compile_paths(glyph.get('paths', []))
+        contours = contour_lengths(path.ops)
+        chunks.append(path.coords.tobytes())
+        lengths.extend(contours)
+        owners.extend([index[name]] * len(contours))
+    coords = np.frombuffer(b''.join(chunks), dtype=np.int16).reshape(-1, 2).astype(np.int64)
+    lengths = np.array(lengths, dtype=np.intp)
+    owners = np.array(owners, dtype=np.intp)
+
+    n = len(index)
+    bounds = np.zeros((n, 4), dtype=np.int64)
+    points = np.zeros(n, dtype=np.int64)
+    contours = np.zeros(n, dtype=np.int64)
+    kept = lengths >= 2
+    if not kept.any():
+        return bounds, points, contours, np.zeros(n, dtype=bool)
+
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    ends = starts + lengths - 1
+    closing = np.zeros(len(lengths), dtype=bool)
+    closing[kept] = (coords[starts[kept]] == coords[ends[kept]]).all(axis=1)
+    np.add.at(points, owners[kept], lengths[kept] - closing[kept])
+    np.add.at(contours, owners[kept], 1)
+
+    # 남는 윤곽선의 점만 모아 (글리프 순서로 이어져 있으므로) 글리프 구간별 min/max
+    point_kept = np.repeat(kept, lengths)
+    point_owner = np.repeat(owners, lengths)[point_kept]
+    kept_coords = coords[point_kept]
+    segment = np.flatnonzero(np.r_[True, point_owner[1:] != point_owner[:-1]])
+    glyph_ids = point_owner[segment]
+    bounds[glyph_ids, :2] = np.minimum.reduceat(kept_coords, segment)
+    bounds[glyph_ids, 2:] = np.maximum.reduceat(kept_coords, segment)
+    return bounds, points, contours, contours > 0
+
+
+def _leaf_bounds(name, linear, glyphs, cache):
+    """합성 글리프를 끝까지 풀어 선형 변환한 좌표의 (xMin, yMin, xMax, yMax) 실수값
+
+    일반 변환(기울임 등)이 있는 합성 글리프용 - fontTools getCoordinates 와 같이
+    모든 단순 글리프 점에 누적 변환을 적용한 뒤 마지막에만 반올림한다.
+    """
+    key = (name, linear.tobytes())
+    if key in cache:
+        return cache[key]
+    glyph = glyphs[name]
+    if 'components' not in glyph:
+        path = compile_paths(glyph.get('paths', []))
+        lengths = np.array(contour_lengths(path.ops), dtype=np.intp)
+        coords = np.frombuffer(path.coords, dtype=np.int16).reshape(-1, 2).astype(float)
+        coords = coords[np.repeat(lengths >= 2, lengths)]
+        result = None
+        if len(coords):
+            moved = coords @ linear
+            result = (*moved.min(axis=0), *moved.max(axis=0))
+    else:
+        result = None
+        for base, matrix, offset in _quantized(glyph['components']):
+            box = _leaf_bounds(base, matrix @ linear, glyphs, cache)
+            if box is None:
+                continue
+            dx, dy = offset @ linear
+            box = (box[0] + dx, box[1] + dy, box[2] + dx, box[3] + dy)
+            result = box if result is None else (min(result[0], box[0]), min(result[1], box[1]),
+                                                 max(result[2], box[2]), max(result[3], box[3]))
+    cache[key] = result
+    return result
+
+
+def _quantized(components):
+    """[(기준 글리프, 2x2 행렬, 오프셋)] - tt_composite 와 같은 양자화"""
+    result = []
+    for base, t in components:
+        matrix = _ot_round(np.array(t[:4], dtype=float) * _F2DOT14) / _F2DOT14
+        result.append((base, matrix.reshape(2, 2), _ot_round(t[4:])))
+    return result
+
+
+def measure_glyphs(glyphs, glyph_order=None, exclude_average=()):
+    """글리프 dict → GlyphMetrics (glyf 로 빌드했을 때의 값)
+
+    glyph_order: 폰트 글리프 순서 (기본: dict 순서)
+    exclude_average: xAvgCharWidth 평균에서 뺄 글리프 이름 (글자가 아닌 부품 글리프)
+    """
+    names = list(glyph_order or glyphs)
+    index = {name: i for i, name in enumerate(names)}
+    n = len(names)
+    composite_names = [name for name in names if 'components' in glyphs[name]]
+    simple_names = [name for name in names if 'components' not in glyphs[name]]
+    bounds, points, contours, outlined = _simple_metrics(glyphs, simple_names, index)
+
+    # 구성 요소 표: 소유 글리프, 기준 글리프, 양자화한 변환 (서로 다른 변환만 한 번씩 양자화)
+    component_lists = [glyphs[name]['components'] for name in composite_names]
+    owners = np.repeat(np.array([index[name] for name in composite_names], dtype=np.intp),
+                       [len(components) for components in component_lists])
+    flat = [component for components in component_lists for component in components]
+    bases = np.array([index[base] for base, _ in flat], dtype=np.intp)
+    table = {}
+    matrix_ids = np.array([table.setdefault(tuple(t), len(table)) for _, t in flat], dtype=np.intp)
+    matrices = np.array(list(table), dtype=float).reshape(-1, 6)[matrix_ids]
+    linear = _ot_round(matrices[:, :4] * _F2DOT14) / _F2DOT14
+    offsets = _ot_round(matrices[:, 4:])
+    is_composite = np.zeros(n, dtype=bool)
+    is_composite[[index[name] for name in composite_names]] = True
+    outlined |= is_composite
+
+    # 배율 + 이동만 있는 구성 요소 (ScaledComposite 규칙), 그 밖은 좌표를 풀어 계산
+    scaled = (linear[:, 1] == 0) & (linear[:, 2] == 0) & (linear[:, 0] > 0) & (linear[:, 3] > 0)
+    general = np.zeros(n, dtype=bool)
+    general[owners[~scaled]] = True
+
+    # 중첩 깊이 (단순 글리프 0) - maxComponentDepth 와 계산 순서에 사용
+    depth = np.zeros(n, dtype=np.int64)
+    for _ in range(n):
+        base_depth = np.where(is_composite[bases], depth[bases], 0)
+        new_depth = np.zeros(n, dtype=np.int64)
+        np.maximum.at(new_depth, owners, base_depth + 1)
+        if (new_depth == depth).all():
+            break
+        depth = new_depth
+    else:
+        raise ValueError("합성 글리프가 자기 자신을 참조합니다")
+
+    composite_points = points.copy()
+    composite_contours = contours.copy()
+    cache = {}
+    for level in range(1, int(depth.max(initial=0)) + 1):
+        rows = np.flatnonzero(depth[owners] == level)
+        row_owners = owners[rows]
+        row_bases = bases[rows]
+
+        # 점 / 윤곽선 수 - 빈 기준 글리프는 건너뜀
+        counted = outlined[row_bases]
+        np.add.at(composite_points, row_owners[counted], composite_points[row_bases[counted]])
+        np.add.at(composite_contours, row_owners[counted], composite_contours[row_bases[counted]])
+
+        # 구성 요소별 경계 상자를 소유 글리프로 합친 뒤 반올림
+        low = np.full((n, 2), np.inf)
+        high = np.full((n, 2), -np.inf)
+
+        # ScaledComposite: 기준 글리프 경계 상자 x 배율 + 오프셋
+        fast = rows[~general[row_owners] & scaled[rows] & outlined[row_bases]]
+        if len(fast):
+            scale = linear[fast][:, [0, 3]]
+            base_box = bounds[bases[fast]].astype(float)
+            np.minimum.at(low, owners[fast], base_box[:, :2] * scale + offsets[fast])
+            np.maximum.at(high, owners[fast], base_box[:, 2:] * scale + offsets[fast])
+
+        # 일반 변환: (기준 글리프, 행렬) 조합마다 한 번 좌표를 풀어 변환
+        slow = rows[general[row_owners]]
+        if len(slow):
+            keys, inverse = np.unique(np.column_stack([bases[slow], linear[slow]]),
+                                      axis=0, return_inverse=True)
+            boxes = np.array([_leaf_bounds(names[int(key[0])], key[1:].reshape(2, 2),
+                                           glyphs, cache) or (np.nan,) * 4 for key in keys])
+            boxes = boxes[inverse.reshape(-1)]
+            valid = ~np.isnan(boxes[:, 0])
+            np.minimum.at(low, owners[slow][valid], boxes[valid, :2] + offsets[slow][valid])
+            np.maximum.at(high, owners[slow][valid], boxes[valid, 2:] + offsets[slow][valid])
+
+        found = np.flatnonzero(np.isfinite(low[:, 0]))
+        bounds[found, :2] = _ot_round(low[found])
+        bounds[found, 2:] = _ot_round(high[found])
+
+    composite = is_composite
+    elements = np.bincount(owners, minlength=n) if len(owners) else np.zeros(n, dtype=np.int64)
+    simple = outlined & ~composite
+    maxp = {
+        'maxPoints': int(points[simple].max(initial=0)),
+        'maxContours': int(contours[simple].max(initial=0)),
+        'maxCompositePoints': int(composite_points[composite].max(initial=0)),
+        'maxCompositeContours': int(composite_contours[composite].max(initial=0)),
+        'maxComponentElements': int(elements[composite].max(initial=0)),
+        'maxComponentDepth': int(depth[composite].max(initial=0)),
+    }
+    widths = [glyphs[name]['width'] for name in names]
+    averaged = np.ones(n, dtype=bool)
+    averaged[[index[name] for name in exclude_average if name in index]] = False
+    return GlyphMetrics(names, widths, bounds, outlined, maxp, averaged)
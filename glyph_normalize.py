@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+압축용 윤곽선 정규화 - WOFF2 glyf 변환이 잘 압축하는 작고 규칙적인 좌표 차이를 만듦
+- 격자 맞춤: 좌표와 구성 요소 오프셋을 grid 폰트 단위의 배수로 맞춤 (윤곽선 첫 점 기준)
+  (겹친 이웃 점은 하나로 합치고 넓이 없는 윤곽선은 제거)
+- 윤곽선 정규화: 글리프 전체 방향을 TrueType 관례(바깥 윤곽선 시계 방향)로 맞추고
+  윤곽선마다 가장 아래-왼쪽 on-curve 점에서 시작 (윤곽선 중복 제거도 더 많이 찾음)
+- 글리프 순서: 한글 음절을 초성(또는 중성) 기준으로 모아 맨 뒤에 둠
+  (비슷한 구성 요소 레코드가 붙어 있고 hmtx 끝 반복 구간도 길어짐)
+- 빌더의 글리프 dict 와 이미 있는 TTF(TTFont) 모두에 적용
+"""
+
+from array import array
+
+from fontTools.misc.roundTools import otRound
+from fontTools.ttLib.tables import ttProgram
+from fontTools.ttLib.tables._g_l_y_f import GlyphCoordinates, flagCubic, flagOnCurve
+
+import hangul
+from glyph_path import GlyphPath, build_contour, compile_paths, contour_nodes
+
+# 글리프 순서 방식: 'source' 는 입력 순서 그대로
+# 'initial' 은 음절 코드포인트 순서와 같아 cmap 구간이 하나로 유지되고,
+# 'medial' 은 같은 중성 / 종성 배치끼리 모으지만 cmap format 4 구간이 음절마다 쪼개짐
+GLYPH_ORDERS = ('source', 'initial', 'medial')
+
+# (초성, 중성, 종성) → 정렬 키
+_HANGUL_KEYS = {
+    'initial': lambda l, v, t: (l, v, t),
+    'medial': lambda l, v, t: (v, t, l),
+}
+
+# 점 번호가 바뀌면 의미가 없어지는 힌팅 테이블
+_HINTING_TABLES = ('fpgm', 'prep', 'cvt ', 'hdmx', 'LTSH', 'VDMX')
+
+_OVERLAP_SIMPLE = 0x40
+
+
+def check_order(order):
+    if order not in GLYPH_ORDERS:
+        raise ValueError(f"알 수 없는 글리프 순서: {order} (가능: {', '.join(GLYPH_ORDERS)})")
+    return order
+
+
+def snap(value, grid):
+    """grid 배수로 반올림 (grid 가 0 이면 그대로)"""
+    return otRound(value / grid) * grid if grid else value
+
+
+# ============================================
+# 윤곽선 노드 목록 [(점, on-curve 여부), ...]
+# ============================================
+
+def _snap_nodes(nodes, grid):
+    """윤곽선 첫 점은 격자에, 나머지 점은 첫 점에서의 거리를 격자 배수로 맞춤
+
+    좌표마다 따로 반올림하면 같은 모양이 홀수 단위만큼 옮겨진 곳에서 점 사이 차이가
+    달라져 압축기가 반복을 못 찾는다. 첫 점 기준으로 맞추면 모든 점이 격자 위에 있으면서
+    옮겨진 모양끼리 차이 값이 같게 남는다 (오차는 grid 이내).
+    """
+    (x0, y0), _ = nodes[0]
+    bx, by = snap(x0, grid), snap(y0, grid)
+    return [((bx + snap(x - x0, grid), by + snap(y - y0, grid)), on) for (x, y), on in nodes]
+
+
+def _merge_duplicates(nodes):
+    """같은 위치에 겹친 이웃 점을 on-curve 점 하나로 합침
+
+    겹친 점 중 하나가 on-curve 면 그 점을 지나는 직선이 되고, 둘 다 off-curve 면
+    암시되는 on-curve 점(중점)이 바로 그 위치라서 어느 경우든 on-curve 점 하나와 같다.
+    """
+    result = []
+    for point, on in nodes:
+        if result and result[-1][0] == point:
+            result[-1] = (point, True)
+        else:
+            result.append((point, on))
+    while len(result) > 1 and result[-1][0] == result[0][0]:
+        result[0] = (result.pop()[0], True)
+    return result
+
+
+def _signed_area(nodes):
+    """점 다각형의 부호 있는 넓이 (반시계 방향이면 양수)"""
+    points = [point for point, _ in nodes]
+    return sum(x0 * y1 - x1 * y0
+               for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1])) / 2
+
+
+def _rotate(nodes):
+    """가장 아래-왼쪽 on-curve 점에서 시작하도록 회전 (on-curve 점이 없으면 그대로)"""
+    starts = [i for i, (_, on) in enumerate(nodes) if on]
+    if not starts:
+        return nodes
+    start = min(starts, key=lambda i: (nodes[i][0][1], nodes[i][0][0]))
+    return nodes[start:] + nodes[:start]
+
+
+def _normalize(contours, reversible=True):
+    """글리프 하나의 노드 목록들 - 방향을 시계로 맞추고 시작점을 정함
+
+    방향은 글리프 전체를 한꺼번에 뒤집어서 정한다. 윤곽선별로 뒤집으면 겹친 획이나
+    구멍의 채우기 결과가 바뀔 수 있지만 전부 뒤집으면 nonzero / even-odd 모두 같다.
+    """
+    if reversible and sum(_signed_area(nodes) for nodes in contours) > 0:
+        contours = [nodes[::-1] for nodes in contours]
+    return [_rotate(nodes) for nodes in contours]
+
+
+# ============================================
+# 글리프 dict (빌더)
+# ============================================
+
+def normalize_path(paths, grid=0, contours=True):
+    """경로를 격자에 맞추고 (grid) 윤곽선 방향 / 시작점을 정규화한 GlyphPath
+
+    3차 곡선이나 열린 윤곽선은 좌표만 격자에 맞추고 점 순서는 그대로 둔다.
+    이런 윤곽선이 있으면 글리프 방향도 뒤집지 않는다.
+    """
+    pieces = []
+    converted = []
+    for contour in compile_paths(paths).contours():
+        nodes = contour_nodes(contour)
+        if nodes is None:
+            if grid:
+                c = contour.coords
+                snapped = _snap_nodes([(point, True) for point in zip(c[0::2], c[1::2])], grid)
+                contour = GlyphPath(contour.ops, array('h', [v for point, _ in snapped for v in point]))
+            pieces.append(contour)
+            continue
+        if grid:
+            nodes = _merge_duplicates(_snap_nodes(nodes, grid))
+            if len(nodes) < 3:
+                continue        # 넓이 없는 윤곽선
+        pieces.append(len(converted))
+        converted.append(nodes)
+    if contours:
+        converted = _normalize(converted, reversible=len(converted) == len(pieces))
+    return GlyphPath.join([build_contour(converted[p]) if isinstance(p, int) else p
+                           for p in pieces])
+
+
+def normalize_glyphs(glyphs, grid=0, contours=True):
+    """글리프 dict 전체에 normalize_path 적용 (바뀌지 않은 글리프는 원래 객체 유지)
+
+    grid: 좌표 격자 (폰트 단위, 0 이면 맞추지 않음) - 합성 글리프 오프셋도 맞춤.
+    폭(advance)은 그대로 둔다.
+    """
+    if not grid and not contours:
+        return glyphs
+    result = {}
+    for name, glyph in glyphs.items():
+        if 'components' in glyph:
+            components = [(base, tuple(t[:4]) + (snap(t[4], grid), snap(t[5], grid)))
+                          for base, t in glyph['components']]
+            if components != [(base, tuple(t)) for base, t in glyph['components']]:
+                glyph = dict(glyph, components=components)
+            result[name] = glyph
+            continue
+        paths = glyph.get('paths')
+        if not paths:
+            result[name] = glyph
+            continue
+        path = normalize_path(paths, grid, contours)
+        result[name] = glyph if path == compile_paths(paths) else dict(glyph, paths=path)
+    return result
+
+
+# ============================================
+# 글리프 순서
+# ============================================
+
+def compression_order(glyph_order, cmap, order='initial'):
+    """한글 음절 글리프를 order 기준으로 정렬해 맨 뒤로 옮긴 글리프 순서
+
+    cmap: {유니코드: 글리프 이름} - 음절은 이름이 아니라 cmap 으로 찾으므로
+    'glyph1234' 같은 이름을 쓰는 폰트에도 적용된다. 나머지 글리프는 순서 유지.
+    """
+    if check_order(order) == 'source':
+        return list(glyph_order)
+    syllables = {}
+    for code, name in cmap.items():
+        if hangul.SYLLABLE_BASE <= code < hangul.SYLLABLE_BASE + hangul.SYLLABLE_COUNT:
+            syllables[name] = min(code, syllables.get(name, code))
+    key = _HANGUL_KEYS[order]
+    rest = [name for name in glyph_order if name not in syllables or name == '.notdef']
+    hangul_names = sorted((name for name in glyph_order if name in syllables and name != '.notdef'),
+                          key=lambda name: key(*hangul.decompose(syllables[name])))
+    return rest + hangul_names
+
+
+# ============================================
+# 이미 있는 TTF (TTFont)
+# ============================================
+
+def _glyph_contours(glyph):
+    """단순 글리프 → 윤곽선별 노드 목록"""
+    coords = glyph.coordinates
+    flags = glyph.flags
+    contours = []
+    start = 0
+    for end in glyph.endPtsOfContours:
+        contours.append([(tuple(coords[i]), bool(flags[i] & flagOnCurve))
+                         for i in range(start, end + 1)])
+        start = end + 1
+    return contours
+
+
+def _set_contours(glyph, contours, overlap):
+    points = [point for nodes in contours for point, _ in nodes]
+    glyph.coordinates = GlyphCoordinates(points)
+    glyph.flags = array('B', [flagOnCurve if on else 0 for nodes in contours for _, on in nodes])
+    if overlap and glyph.flags:
+        glyph.flags[0] |= _OVERLAP_SIMPLE
+    ends = []
+    for nodes in contours:
+        ends.append((ends[-1] if ends else -1) + len(nodes))
+    glyph.endPtsOfContours = ends
+    glyph.numberOfContours = len(contours)
+
+
+def drop_hinting(font):
+    """TrueType 힌팅(글리프 명령과 fpgm / prep / cvt 등) 제거"""
+    for tag in _HINTING_TABLES:
+        if tag in font:
+            del font[tag]
+    glyf = font['glyf']
+    for name in font.getGlyphOrder():
+        glyph = glyf[name]
+        if hasattr(glyph, 'program'):
+            glyph.program = ttProgram.Program()
+            glyph.program.fromBytecode(b'')
+
+
+def reorder_font(font, order):
+    """TTFont 의 글리프 순서를 compression_order 로 바꿈 (바뀌었으면 True)"""
+    old = font.getGlyphOrder()
+    new = compression_order(old, font.getBestCmap() or {}, order)
+    if new == old:
+        return False
+    font.ensureDecompiled()
+    font.setGlyphOrder(new)
+    font['glyf'].setGlyphOrder(new)
+    return True
+
+
+def normalize_font(font, grid=0, contours=False, order='source'):
+    """glyf 폰트에 격자 맞춤 / 윤곽선 정규화 / 글리프 순서 변경을 적용
+
+    점 번호가 바뀌므로 grid 나 contours 를 쓰면 힌팅을 제거한다.
+    경계 상자와 maxp 는 저장할 때 다시 계산된다 (recalcBBoxes).
+    """
+    if 'glyf' not in font:
+        raise ValueError("glyf 윤곽선 폰트만 지원 (CFF 는 제외)")
+    check_order(order)
+    if grid or contours:
+        drop_hinting(font)
+        glyf = font['glyf']
+        for name in font.getGlyphOrder():
+            glyph = glyf[name]
+            if glyph.isComposite():
+                if grid:
+                    for component in glyph.components:
+                        component.x, component.y = snap(component.x, grid), snap(component.y, grid)
+                continue
+            if glyph.numberOfContours <= 0 or any(f & flagCubic for f in glyph.flags):
+                continue
+            overlap = bool(glyph.flags[0] & _OVERLAP_SIMPLE)
+            nodes = _glyph_contours(glyph)
+            if grid:
+                nodes = [n for n in (_merge_duplicates(_snap_nodes(n, grid)) for n in nodes)
+                         if len(n) >= 3]
+            if contours:
+                nodes = _normalize(nodes)
+            _set_contours(glyph, nodes, overlap)
+    if order != 'source':
+        reorder_font(font, order)
+    return font
@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""
+배열 기반 글리프 경로 표현
+- 튜플 리스트 [('moveTo', (x, y)), ...] 대신 opcode 배열 + int16 좌표 버퍼 하나로 저장
+- 경로 컴파일러 + 테이블 기반 재생기 (두 빌더가 공유하는 그리기 엔진)
+"""
+
+import math
+from array import array
+from itertools import islice
+
+from fontTools.misc.fixedTools import floatToFixedToFloat
+from fontTools.misc.roundTools import otRound
+from fontTools.ttLib.tables import ttProgram
+from fontTools.ttLib.tables._g_l_y_f import (
+    ROUND_XY_TO_GRID, Glyph, GlyphComponent, GlyphCoordinates, flagCubic)
+
+# 경로 명령 opcode
+OP_MOVE = 0
+OP_LINE = 1
+OP_QCURVE = 2      # 다음 바이트 = 점 개수
+OP_CURVE = 3       # 다음 바이트 = 점 개수
+OP_CLOSE = 4
+OP_END = 5
+
+_COMMAND_OPS = {
+    'moveTo': OP_MOVE,
+    'lineTo': OP_LINE,
+    'qCurveTo': OP_QCURVE,
+    'curveTo': OP_CURVE,
+    'closePath': OP_CLOSE,
+    'endPath': OP_END,
+}
+_OP_COMMANDS = {op: cmd for cmd, op in _COMMAND_OPS.items()}
+
+# opcode 별 점 개수 (-1 = 다음 바이트에 저장된 가변 개수)
+OP_POINT_COUNTS = (1, 1, -1, -1, 0, 0)
+
+
+def contour_lengths(ops):
+    """opcode 배열에서 윤곽선별 점 개수 (GlyphPath.contours 와 같은 구분)"""
+    lengths = []
+    count = 0
+    i = 0
+    while i < len(ops):
+        points = OP_POINT_COUNTS[ops[i]]
+        i += 1
+        if points < 0:
+            points = ops[i]
+            i += 1
+        count += points
+        if points == 0:
+            lengths.append(count)
+            count = 0
+    if count:
+        lengths.append(count)
+    return lengths
+
+
+def _pen_table(pen):
+    """opcode 순서대로 펜 메서드를 미리 찾아 둔 디스패치 테이블"""
+    return (pen.moveTo, pen.lineTo, pen.qCurveTo, pen.curveTo,
+            pen.closePath, pen.endPath)
+
+
+class GlyphPath:
+    """글리프 하나의 전체 윤곽선 (opcode array('B') + 좌표 array('h'))"""
+
+    __slots__ = ('ops', 'coords')
+
+    def __init__(self, ops=None, coords=None):
+        self.ops = ops if ops is not None else array('B')
+        self.coords = coords if coords is not None else array('h')
+
+    @classmethod
+    def from_paths(cls, paths):
+        """기존 튜플 형식 경로 리스트에서 변환"""
+        # 리스트로 모은 뒤 한 번에 배열로 만들어 과할당을 피함
+        ops = []
+        coords = []
+        for path in paths:
+            for item in path:
+                op = _COMMAND_OPS[item[0]]
+                if op == OP_CLOSE or op == OP_END:
+                    ops.append(op)
+                    continue
+                points = item[1:]
+                ops.append(op)
+                if op == OP_QCURVE or op == OP_CURVE:
+                    ops.append(len(points))
+                for x, y in points:
+                    coords.append(otRound(x))
+                    coords.append(otRound(y))
+        return cls(array('B', ops), array('h', coords))
+
+    def to_paths(self):
+        """튜플 형식 경로 리스트로 되돌림"""
+        paths = []
+        current = []
+        c = self.coords
+        ops = self.ops
+        i = j = 0
+        while i < len(ops):
+            op = ops[i]
+            i += 1
+            if op == OP_CLOSE or op == OP_END:
+                current.append((_OP_COMMANDS[op], None))
+                paths.append(current)
+                current = []
+                continue
+            count = 1
+            if op == OP_QCURVE or op == OP_CURVE:
+                count = ops[i]
+                i += 1
+            points = tuple((c[k], c[k + 1]) for k in range(j, j + 2 * count, 2))
+            j += 2 * count
+            current.append((_OP_COMMANDS[op],) + points)
+        if current:
+            paths.append(current)
+        return paths
+
+    def draw(self, pen):
+        """좌표 버퍼에서 바로 펜에 그리기 (opcode 인덱스 테이블 디스패치)
+
+        좌표를 리스트로 복사하지 않고 array('h') 버퍼를 바로 순회하는 (x, y) 반복자에서
+        필요한 만큼만 꺼낸다.
+        """
+        table = _pen_table(pen)
+        coords = iter(self.coords)
+        points = zip(coords, coords)
+        ops = iter(self.ops)
+        for op in ops:
+            count = OP_POINT_COUNTS[op]
+            if count == 1:
+                table[op](next(points))
+            elif count == 0:
+                table[op]()
+            else:
+                table[op](*islice(points, next(ops)))
+
+    def contours(self):
+        """윤곽선(moveTo ~ closePath/endPath)별로 나눈 GlyphPath 리스트"""
+        result = []
+        ops = self.ops
+        c = self.coords
+        i = j = op_start = coord_start = 0
+        while i < len(ops):
+            op = ops[i]
+            i += 1
+            count = OP_POINT_COUNTS[op]
+            if count < 0:
+                count = ops[i]
+                i += 1
+            j += 2 * count
+            if count == 0:
+                result.append(GlyphPath(ops[op_start:i], c[coord_start:j]))
+                op_start, coord_start = i, j
+        if op_start < len(ops):
+            result.append(GlyphPath(ops[op_start:], c[coord_start:]))
+        return result
+
+    def translated(self, dx, dy):
+        """모든 점을 (dx, dy) 만큼 옮긴 새 GlyphPath (opcode 배열은 공유)"""
+        c = self.coords
+        coords = array('h', bytes(len(c) * c.itemsize))
+        coords[0::2] = array('h', [x + dx for x in c[0::2]])
+        coords[1::2] = array('h', [y + dy for y in c[1::2]])
+        return GlyphPath(self.ops, coords)
+
+    @classmethod
+    def join(cls, paths):
+        """여러 GlyphPath 를 순서대로 이어 붙인 GlyphPath"""
+        ops = array('B')
+        coords = array('h')
+        for path in paths:
+            ops.extend(path.ops)
+            coords.extend(path.coords)
+        return cls(ops, coords)
+
+    def as_numpy(self):
+        """좌표 버퍼를 복사 없이 (N, 2) int16 NumPy 배열로 보기"""
+        import numpy as np
+        return np.frombuffer(self.coords, dtype=np.int16).reshape(-1, 2)
+
+    @property
+    def nbytes(self):
+        return (len(self.ops) * self.ops.itemsize
+                + len(self.coords) * self.coords.itemsize)
+
+    def __eq__(self, other):
+        if not isinstance(other, GlyphPath):
+            return NotImplemented
+        return self.ops == other.ops and self.coords == other.coords
+
+    def __repr__(self):
+        return (f'GlyphPath(ops={len(self.ops)}, '
+                f'points={len(self.coords) // 2})')
+
+    def __reduce__(self):
+        # 배열을 바이트로 직렬화해 워커 프로세스로 보낼 때 크기를 줄임
+        return (_restore_glyph_path, (self.ops.tobytes(), self.coords.tobytes()))
+
+
+def _restore_glyph_path(ops_bytes, coords_bytes):
+    ops = array('B')
+    ops.frombytes(ops_bytes)
+    coords = array('h')
+    coords.frombytes(coords_bytes)
+    return GlyphPath(ops, coords)
+
+
+# ============================================
+# 경로 컴파일러 / 재생기
+# ============================================
+
+def compile_paths(paths):
+    """경로를 opcode 프로그램(GlyphPath)으로 한 번만 컴파일
+
+    문자열 명령 비교는 여기서만 일어나고, 재생 시에는 opcode 로 펜 메서드 테이블을
+    바로 찾는다. 이미 GlyphPath 이면 그대로 반환.
+    """
+    if isinstance(paths, GlyphPath):
+        return paths
+    return GlyphPath.from_paths(paths)
+
+
+def draw_paths(pen, paths):
+    """경로를 펜에 그리기 - GlyphPath 는 버퍼에서 재생, 튜플 형식은 컴파일하지 않고 바로 그림"""
+    if isinstance(paths, GlyphPath):
+        paths.draw(pen)
+        return
+    for path in paths:
+        for item in path:
+            cmd = item[0]
+            if cmd == 'qCurveTo':
+                if len(item) == 3:
+                    pen.qCurveTo(item[1], item[2])
+                else:
+                    pen.qCurveTo(*item[1:])
+            elif cmd == 'lineTo':
+                pen.lineTo(item[1])
+            elif cmd == 'moveTo':
+                pen.moveTo(item[1])
+            elif cmd == 'closePath':
+                pen.closePath()
+            elif cmd == 'curveTo':
+                pen.curveTo(*item[1:])
+            else:
+                pen.endPath()
+
+
+# ============================================
+# 노드 목록 (윤곽선 단순화 / 정규화 공용)
+# ============================================
+
+def contour_nodes(contour):
+    """닫힌 2차 윤곽선 → [(점, on-curve 여부), ...] (순환, 시작점과 같은 마지막 점 제외)
+
+    3차 곡선이 있거나 열린 윤곽선이면 None.
+    """
+    ops = contour.ops
+    c = contour.coords
+    nodes = []
+    i = p = 0
+    closed = False
+    while i < len(ops):
+        op = ops[i]
+        i += 1
+        count = OP_POINT_COUNTS[op]
+        if count < 0:
+            count = ops[i]
+            i += 1
+        if op == OP_CURVE:
+            return None
+        if op == OP_CLOSE:
+            closed = True
+        for k in range(count):
+            on = op != OP_QCURVE or k == count - 1
+            nodes.append(((c[p], c[p + 1]), on))
+            p += 2
+    if not closed or len(nodes) < 3 or ops[0] != OP_MOVE:
+        return None
+    if nodes[-1] == nodes[0]:
+        nodes.pop()
+    return nodes
+
+
+def build_contour(nodes):
+    """노드 목록 → 윤곽선 opcode / 좌표 (첫 on-curve 점에서 시작)"""
+    start = next(i for i, (_, on) in enumerate(nodes) if on)
+    nodes = nodes[start:] + nodes[:start]
+    ops = array('B', [OP_MOVE])
+    coords = array('h', nodes[0][0])
+    pending = []
+    for point, on in nodes[1:] + [nodes[0]]:
+        if not on:
+            pending.append(point)
+            continue
+        if pending:
+            ops.extend((OP_QCURVE, len(pending) + 1))
+            for off in pending:
+                coords.extend(off)
+            pending = []
+        elif point is nodes[0][0]:
+            break       # 시작점으로 돌아가는 직선은 closePath 가 대신함
+        else:
+            ops.append(OP_LINE)
+        coords.extend(point)
+    ops.append(OP_CLOSE)
+    return GlyphPath(ops, coords)
+
+
+# ============================================
+# glyf 글리프
+# ============================================
+
+# opcode 별 (중간 점 플래그, 마지막 점 플래그) - TTGlyphPen 과 같은 규칙
+_OP_TT_FLAGS = ((1, 1), (1, 1), (0, 1), (flagCubic, 1))
+
+
+def tt_glyph(glyph_path):
+    """컴파일된 경로의 버퍼에서 펜을 거치지 않고 glyf Glyph 를 바로 생성
+
+    TTGlyphPen(None) 에 그린 뒤 glyph() 를 호출한 결과와 같다
+    (한 점짜리 경로 무시, 시작점과 같은 마지막 점 제거 포함).
+    """
+    ops = glyph_path.ops
+    coordinates = GlyphCoordinates()
+    coords = coordinates.array
+    coords.fromlist(glyph_path.coords.tolist())
+    flags = array('B')
+    end_pts = []
+    start = n_points = 0
+    i = 0
+    while i < len(ops):
+        op = ops[i]
+        i += 1
+        count = OP_POINT_COUNTS[op]
+        if count < 0:
+            count = ops[i]
+            i += 1
+        if count:
+            mid_flag, last_flag = _OP_TT_FLAGS[op]
+            if count > 1:
+                flags.extend([mid_flag] * (count - 1))
+            flags.append(last_flag)
+            n_points += count
+            continue
+        # closePath / endPath
+        end = n_points - 1
+        if end < start:
+            continue
+        if end == start or (coords[2 * start] == coords[2 * end]
+                            and coords[2 * start + 1] == coords[2 * end + 1]):
+            del coords[2 * end:2 * end + 2]
+            del flags[end]
+            n_points -= 1
+            end -= 1
+            if end < start:
+                continue
+        end_pts.append(end)
+        start = n_points
+
+    glyph = Glyph()
+    glyph.coordinates = coordinates
+    glyph.endPtsOfContours = end_pts
+    glyph.flags = flags
+    glyph.numberOfContours = len(end_pts)
+    glyph.program = ttProgram.Program()
+    glyph.program.fromBytecode(b'')
+    return glyph
+
+
+class ScaledComposite(Glyph):
+    """배율 + 이동 변환만 쓰는 합성 글리프
+
+    fontTools 는 배율이 있는 합성 글리프의 경계 상자를 구하려고 구성 요소 좌표를 모두
+    변환하는데, 여기서는 구성 요소의 경계 상자만 변환한다 (양수 배율이면 결과가 같음).
+    """
+
+    def recalcBounds(self, glyfTable, *, boundsDone=None):
+        bounds = []
+        for component in self.components:
+            if hasattr(component, 'transform'):
+                (xx, xy), (yx, yy) = component.transform
+            else:
+                xx, xy, yx, yy = 1, 0, 0, 1
+            if xy or yx or xx <= 0 or yy <= 0:
+                return super().recalcBounds(glyfTable, boundsDone=boundsDone)
+            base = glyfTable[component.glyphName]
+            if boundsDone is None or component.glyphName not in boundsDone:
+                base.recalcBounds(glyfTable, boundsDone=boundsDone)
+                if boundsDone is not None:
+                    boundsDone.add(component.glyphName)
+            if not base.numberOfContours:
+                continue
+            bounds.append((base.xMin * xx + component.x, base.yMin * yy + component.y,
+                           base.xMax * xx + component.x, base.yMax * yy + component.y))
+        if not bounds:
+            self.xMin = self.yMin = self.xMax = self.yMax = 0
+            return
+        self.xMin = otRound(min(b[0] for b in bounds))
+        self.yMin = otRound(min(b[1] for b in bounds))
+        self.xMax = otRound(max(b[2] for b in bounds))
+        self.yMax = otRound(max(b[3] for b in bounds))
+
+
+def tt_composite(components):
+    """[(기준 글리프 이름, (xx, xy, yx, yy, dx, dy)), ...] 로 glyf 합성 글리프 생성
+
+    TTGlyphPen.addComponent 와 같은 결과 (변환 행렬은 F2Dot14 로 양자화,
+    오프셋은 반올림, ROUND_XY_TO_GRID 플래그).
+    """
+    glyph = ScaledComposite()
+    glyph.numberOfContours = -1
+    glyph.components = []
+    for base_name, transformation in components:
+        component = GlyphComponent()
+        component.glyphName = base_name
+        component.x, component.y = (otRound(v) for v in transformation[4:])
+        matrix = tuple(floatToFixedToFloat(v, 14) for v in transformation[:4])
+        if matrix != (1, 0, 0, 1):
+            component.transform = (matrix[:2], matrix[2:])
+        component.flags = ROUND_XY_TO_GRID
+        glyph.components.append(component)
+    return glyph
+
+
+# ============================================
+# 획 굵기 변형 (가변 폰트 마스터용)
+# ============================================
+
+def _inside(point, polygon):
+    """짝홀 규칙 점 포함 검사"""
+    x, y = point
+    inside = False
+    for (x0, y0), (x1, y1) in zip(polygon, polygon[-1:] + polygon[:-1]):
+        if (y0 > y) != (y1 > y) and x < (x1 - x0) * (y - y0) / (y1 - y0) + x0:
+            inside = not inside
+    return inside
+
+
+def is_hole(index, polygons):
+    """다른 윤곽선 안에 완전히(꼭짓점과 변 중점 모두) 들어간 횟수가 홀수이면 구멍
+
+    A 의 가로줄처럼 꼭짓점만 다른 윤곽선 안에 있고 겹쳐 그린 획은 구멍이 아니다.
+    입력 윤곽선의 방향이 일정하지 않아 방향 대신 포함 관계로 판단한다.
+    """
+    polygon = polygons[index]
+    samples = polygon + [((x0 + x1) / 2, (y0 + y1) / 2)
+                         for (x0, y0), (x1, y1) in zip(polygon, polygon[1:] + polygon[:1])]
+    depth = sum(1 for j, other in enumerate(polygons)
+                if j != index and len(other) > 2 and all(_inside(p, other) for p in samples))
+    return depth % 2 == 1
+
+
+def _offset_points(points, amount, sign):
+    """닫힌 윤곽선의 점을 잉크 쪽 법선 방향으로 amount 만큼 이동 (점 개수 유지)
+
+    sign 은 변 방향의 오른쪽 법선이 잉크 바깥을 향하면 1, 아니면 -1.
+    꼭짓점은 두 변 법선의 이등분선 방향으로 옮기고 뾰족한 모서리는 2배까지만 늘린다.
+    """
+    n = len(points)
+
+    def normal(p, q):
+        dx, dy = q[0] - p[0], q[1] - p[1]
+        length = math.hypot(dx, dy)
+        return sign * dy / length, -sign * dx / length
+
+    result = []
+    for i, point in enumerate(points):
+        # 같은 위치에 겹친 이웃 점은 건너뛰고 방향을 구함
+        prev = next((points[(i - k) % n] for k in range(1, n) if points[(i - k) % n] != point), None)
+        if prev is None:
+            result.append(point)
+            continue
+        following = next(points[(i + k) % n] for k in range(1, n) if points[(i + k) % n] != point)
+        n1 = normal(prev, point)
+        n2 = normal(point, following)
+        mx, my = n1[0] + n2[0], n1[1] + n2[1]
+        length = math.hypot(mx, my)
+        if length < 1e-9:
+            # 제자리에서 되돌아가는 점
+            mx, my, length = n1[0], n1[1], 1.0
+        mx, my = mx / length, my / length
+        cos = max(mx * n1[0] + my * n1[1], 0.5)
+        result.append((point[0] + mx * amount / cos, point[1] + my * amount / cos))
+    return result
+
+
+def embolden(paths, amount):
+    """윤곽선을 잉크 쪽으로 amount 단위만큼 두껍게 (음수면 얇게) 만든 GlyphPath
+
+    점 개수와 순서가 그대로여서 굵기가 다른 결과끼리 가변 폰트 마스터로 호환된다.
+    """
+    contours = compile_paths(paths).contours()
+    polygons = [list(zip(c.coords[0::2], c.coords[1::2])) for c in contours]
+    result = []
+    for index, (contour, points) in enumerate(zip(contours, polygons)):
+        if len(points) < 3:
+            result.append(contour)
+            continue
+        area = sum(x0 * y1 - x1 * y0
+                   for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]))
+        sign = (1 if area > 0 else -1) * (-1 if is_hole(index, polygons) else 1)
+        moved = _offset_points(points, amount, sign)
+        coords = array('h', [otRound(v) for point in moved for v in point])
+        result.append(GlyphPath(contour.ops, coords))
+    return GlyphPath.join(result)
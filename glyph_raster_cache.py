@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+글리프 비트맵 캐시 - 같은 음절을 다시 그릴 때 래스터화 대신 비트맵 복사만 함
+- 키: (폰트 해시, 글리프 번호, 양자화한 픽셀 크기, 가로 서브픽셀 위치)
+  (크기는 1/SIZE_STEPS 픽셀 단위로 맞춰 그리므로 비슷한 크기끼리 항목을 나눠 씀)
+- RasterCache: 프로세스 안 LRU (OrderedDict), 비트맵 바이트 합계로 메모리 한도 유지
+- SharedRasterCache: multiprocessing.shared_memory 위의 캐시
+  - 집합 연관(set-associative) 색인이 크기 등급별 칸 배열의 칸을 가리킴
+  - 비트맵은 들어가는 가장 작은 등급(256B ~ 16KB)에 저장, 등급 안에서 가장 오래 안 쓴
+    칸부터 교체 (LRU) - 대부분 1KB 미만인 글리프 비트맵이 큰 칸을 낭비하지 않음
+  - 여러 워커 프로세스가 한 캐시를 같이 쓰고 잠금 하나로 조회 / 저장을 보호
+  - 같은 키를 여러 워커가 동시에 저장하면 기존 행을 다시 씀 (중복 저장 없음)
+  - 가장 큰 등급보다 큰 비트맵은 저장하지 않음 (oversize 로 집계)
+- 두 캐시 모두 적중 / 실패 / 교체 횟수를 stats() 로 제공
+"""
+
+import os
+from bisect import bisect_left
+from collections import OrderedDict
+from multiprocessing import Lock, shared_memory
+
+import numpy as np
+
+# 캐시 키 크기 단위 (픽셀당)
+SIZE_STEPS = 4
+
+# 프로세스 안 캐시 최대 용량 (MB)
+RASTER_CACHE_MAX_MB = float(os.environ.get('FONT_RASTER_CACHE_MB', '32'))
+
+# 공유 캐시 칸 크기 등급 (바이트, 가장 큰 등급은 약 128px 글리프까지) / 색인 집합당 행 수
+SLOT_CLASSES = (256, 512, 1024, 2048, 4096, 8192, 16384)
+WAYS = 8
+
+# 항목 하나의 대략적인 부가 비용 (키 튜플, ndarray 객체)
+_ENTRY_OVERHEAD = 200
+
+# 공유 메모리 카운터 / 메타데이터 열
+_HITS, _MISSES, _STORES, _EVICTIONS, _OVERSIZE, _TICK = range(6)
+_COUNTERS = 8
+_FONT, _GID, _SIZE, _SUBPIXEL, _USED, _HEIGHT, _WIDTH, _LEFT, _TOP, _CLASS, _SLOT = range(11)
+_META = 11
+
+
+def font_id(sha256):
+    """폰트 파일 SHA-256 → 캐시 키용 63비트 정수"""
+    return int(sha256[:15], 16)
+
+
+def quantize_size(size):
+    """(크기 키, 그릴 크기) - 크기를 1/SIZE_STEPS 픽셀로 반올림"""
+    steps = int(round(size * SIZE_STEPS))
+    return steps, steps / SIZE_STEPS
+
+
+def _hit_rate(hits, misses):
+    return hits / (hits + misses) if hits + misses else 0.0
+
+
+# ============================================
+# 프로세스 안 LRU
+# ============================================
+
+class RasterCache:
+    """키 → (비트맵, 왼쪽, 위) LRU - 비트맵 바이트 합계가 max_bytes 를 넘으면 오래된 것부터 제거"""
+
+    def __init__(self, max_bytes=None):
+        if max_bytes is None:
+            max_bytes = int(RASTER_CACHE_MAX_MB * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        bitmap = entry[0]
+        size = bitmap.nbytes + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[0].nbytes + _ENTRY_OVERHEAD
+        bitmap.flags.writeable = False
+        self._entries[key] = entry
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (evicted, _, _) = self._entries.popitem(last=False)
+            self.bytes -= evicted.nbytes + _ENTRY_OVERHEAD
+            self.evictions += 1
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': _hit_rate(self.hits, self.misses),
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+
+# ============================================
+# 공유 메모리 (여러 프로세스)
+# ============================================
+
+class SharedRasterCache:
+    """공유 메모리 캐시 - create() 로 만들고 워커에서는 attach(spec) 로 연결
+
+    색인: 집합 연관 표 (집합 수 × WAYS 행) 가 키 → (크기 등급, 칸 번호) 를 가리킴
+    비트맵: 크기 등급(SLOT_CLASSES)마다 칸 배열 하나 - 비트맵이 들어가는 가장 작은 등급에 저장
+    메모리 구조: 카운터 int64[8] | 색인 int64[행 수, 11]
+                 | 등급마다 (주인 행 int64[칸 수], 사용 시각 int64[칸 수], 비트맵 uint8[칸 수, 칸 크기])
+    """
+
+    def __init__(self, shm, sets, ways, classes, counts, lock, owner=False):
+        self.shm = shm
+        self.sets = sets
+        self.ways = ways
+        self.classes = tuple(classes)
+        self.counts = tuple(counts)
+        self.lock = lock
+        self.owner = owner
+        buf = shm.buf
+        self.counters = np.ndarray((_COUNTERS,), dtype=np.int64, buffer=buf)
+        offset = self.counters.nbytes
+        self.meta = np.ndarray((sets * ways, _META), dtype=np.int64, buffer=buf, offset=offset)
+        offset += self.meta.nbytes
+        # 등급별 (칸 주인 색인 행 + 1 (0 = 빈 칸), 칸 사용 시각, 비트맵)
+        self.slots = []
+        for slot_bytes, count in zip(self.classes, self.counts):
+            owners = np.ndarray((count,), dtype=np.int64, buffer=buf, offset=offset)
+            offset += owners.nbytes
+            used = np.ndarray((count,), dtype=np.int64, buffer=buf, offset=offset)
+            offset += used.nbytes
+            data = np.ndarray((count, slot_bytes), dtype=np.uint8, buffer=buf, offset=offset)
+            offset += data.nbytes
+            self.slots.append((owners, used, data))
+
+    @staticmethod
+    def _size(sets, ways, classes, counts):
+        return ((_COUNTERS + sets * ways * _META) * 8
+                + sum(count * (16 + slot_bytes) for slot_bytes, count in zip(classes, counts)))
+
+    @classmethod
+    def create(cls, max_bytes=None, classes=SLOT_CLASSES, ways=WAYS):
+        """비트맵 영역이 max_bytes 이하가 되도록 등급마다 같은 바이트씩 나눠 새 공유 메모리 생성"""
+        if max_bytes is None:
+            max_bytes = int(RASTER_CACHE_MAX_MB * 1024 * 1024)
+        share = max_bytes // len(classes)
+        counts = [max(1, share // slot_bytes) for slot_bytes in classes]
+        sets = max(1, -(-sum(counts) // ways))
+        size = cls._size(sets, ways, classes, counts)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        shm.buf[:size] = bytes(size)
+        return cls(shm, sets, ways, classes, counts, Lock(), owner=True)
+
+    @property
+    def spec(self):
+        """워커 프로세스 초기화 인자 (ProcessPoolExecutor initargs 로 전달)"""
+        return self.shm.name, self.sets, self.ways, self.classes, self.counts, self.lock
+
+    @classmethod
+    def attach(cls, spec):
+        name, sets, ways, classes, counts, lock = spec
+        return cls(shared_memory.SharedMemory(name=name), sets, ways, classes, counts, lock)
+
+    def close(self):
+        """연결 해제 (만든 프로세스는 공유 메모리도 삭제)"""
+        self.counters = self.meta = self.slots = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def _rows(self, key):
+        start = hash(key) % self.sets * self.ways
+        return start, start + self.ways
+
+    def _find(self, key, start, end):
+        font, gid, size, subpixel = key
+        meta = self.meta
+        for row in range(start, end):
+            m = meta[row]
+            if (m[_USED] and m[_FONT] == font and m[_GID] == gid
+                    and m[_SIZE] == size and m[_SUBPIXEL] == subpixel):
+                return row
+        return None
+
+    def _tick(self):
+        self.counters[_TICK] += 1
+        return self.counters[_TICK]
+
+    def _release(self, row):
+        """색인 행과 그 행이 쓰던 칸을 비움"""
+        m = self.meta[row]
+        owners, used, _ = self.slots[m[_CLASS]]
+        owners[m[_SLOT]] = 0
+        used[m[_SLOT]] = 0
+        m[_USED] = 0
+
+    def get(self, key):
+        start, end = self._rows(key)
+        with self.lock:
+            row = self._find(key, start, end)
+            if row is None:
+                self.counters[_MISSES] += 1
+                return None
+            m = self.meta[row]
+            tick = self._tick()
+            m[_USED] = tick
+            _, used, data = self.slots[m[_CLASS]]
+            used[m[_SLOT]] = tick
+            height, width = int(m[_HEIGHT]), int(m[_WIDTH])
+            bitmap = data[m[_SLOT], :height * width].reshape(height, width).copy()
+            self.counters[_HITS] += 1
+            return bitmap, int(m[_LEFT]), int(m[_TOP])
+
+    def put(self, key, entry):
+        bitmap, left, top = entry
+        height, width = bitmap.shape
+        size_class = bisect_left(self.classes, bitmap.nbytes)
+        if size_class == len(self.classes):
+            with self.lock:
+                self.counters[_OVERSIZE] += 1
+            return
+        start, end = self._rows(key)
+        owners, used, data = self.slots[size_class]
+        with self.lock:
+            # 같은 키가 이미 있으면 (여러 워커가 동시에 실패한 경우) 그 행을 다시 씀
+            row = self._find(key, start, end)
+            if row is None:
+                ticks = self.meta[start:end, _USED]
+                row = start + int(np.argmin(ticks))
+                if ticks[row - start]:
+                    self.counters[_EVICTIONS] += 1
+            if self.meta[row, _USED]:
+                self._release(row)
+            # 등급 안에서 빈 칸 (사용 시각 0) 이나 가장 오래 안 쓴 칸
+            slot = int(np.argmin(used))
+            if owners[slot]:
+                self.meta[owners[slot] - 1, _USED] = 0
+                self.counters[_EVICTIONS] += 1
+            tick = self._tick()
+            self.meta[row] = (*key, tick, height, width, left, top, size_class, slot)
+            owners[slot] = row + 1
+            used[slot] = tick
+            data[slot, :bitmap.nbytes] = bitmap.reshape(-1)
+            self.counters[_STORES] += 1
+
+    def stats(self):
+        with self.lock:
+            counters = self.counters.tolist()
+            live = self.meta[:, _USED] > 0
+            entries = int(np.count_nonzero(live))
+            stored = int((self.meta[:, _HEIGHT] * self.meta[:, _WIDTH])[live].sum())
+        return {
+            'hits': counters[_HITS],
+            'misses': counters[_MISSES],
+            'hit_rate': _hit_rate(counters[_HITS], counters[_MISSES]),
+            'evictions': counters[_EVICTIONS],
+            'oversize': counters[_OVERSIZE],
+            'entries': entries,
+            'bytes': stored,
+            'max_bytes': sum(c * n for c, n in zip(self.classes, self.counts)),
+        }
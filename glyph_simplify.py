@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+윤곽선 단순화 - 모양을 허용 오차(폰트 단위) 안에서 유지하며 점 개수를 줄임
+- 일직선 위의 점: 두 직선 사이의 on-curve 점이 앞뒤 점을 잇는 선분에서 오차 안이면 제거
+  (이미 지운 점들도 모두 새 선분에서 오차 안에 있어야 함)
+- 평평한 곡선: 제어점 하나짜리 2차 곡선이 현(弦)에서 오차 안이면 직선으로
+- 암시적 on-curve 점: 연속한 2차 곡선 사이의 on-curve 점이 양쪽 제어점의 중점과
+  오차 안이면 제거 (TrueType 은 두 off-curve 점 사이의 중점을 on-curve 로 해석)
+- 3차 곡선이 있거나 열린 윤곽선은 그대로 둠
+"""
+
+import math
+
+from glyph_path import GlyphPath, build_contour, compile_paths, contour_nodes, tt_glyph
+
+
+def _distance_to_segment(p, a, b):
+    """점 p 와 선분 ab 의 거리 (선분 밖으로 투영되면 끝점까지의 거리)"""
+    ax, ay = a
+    dx, dy = b[0] - ax, b[1] - ay
+    length2 = dx * dx + dy * dy
+    if not length2:
+        return math.hypot(p[0] - ax, p[1] - ay)
+    t = max(0.0, min(1.0, ((p[0] - ax) * dx + (p[1] - ay) * dy) / length2))
+    return math.hypot(p[0] - ax - t * dx, p[1] - ay - t * dy)
+
+
+def _within(points, a, b, tolerance):
+    return all(_distance_to_segment(p, a, b) <= tolerance for p in points)
+
+
+# ============================================
+# 윤곽선 하나
+# ============================================
+
+def _simplify_nodes(nodes, tolerance):
+    """노드 목록에서 지울 수 있는 점을 반복해서 제거
+
+    removed[i] 는 노드 i 에서 다음 노드로 가는 구간에 합쳐진 원래 점 목록.
+    """
+    removed = [[] for _ in nodes]
+    on_curve = sum(on for _, on in nodes)
+    changed = True
+    while changed and len(nodes) > 3:
+        changed = False
+        i = 0
+        while i < len(nodes) and len(nodes) > 3:
+            n = len(nodes)
+            prev_i, next_i = (i - 1) % n, (i + 1) % n
+            (a, a_on), (p, p_on), (b, b_on) = nodes[prev_i], nodes[i], nodes[next_i]
+            drop = False
+            if p_on and a_on and b_on:
+                # 두 직선 사이의 점 (겹친 점 포함)
+                drop = _within([p] + removed[prev_i] + removed[i], a, b, tolerance)
+            elif not p_on and a_on and b_on:
+                # 제어점 하나짜리 곡선 - 곡선과 현의 최대 거리는 제어점 거리의 절반
+                drop = (not removed[prev_i]
+                        and _distance_to_segment(p, a, b) / 2 <= tolerance)
+            elif p_on and not a_on and not b_on and on_curve > 1:
+                # 두 곡선 사이의 점 - 제어점 중점으로 암시 (시작점이 될 on-curve 점 하나는 남김)
+                mid = ((a[0] + b[0]) / 2, (a[1] + b[1]) / 2)
+                drop = math.hypot(p[0] - mid[0], p[1] - mid[1]) <= tolerance
+            if drop:
+                merged = removed[prev_i] + ([p] if p_on else []) + removed[i]
+                del nodes[i]
+                del removed[i]
+                removed[(i - 1) % len(nodes)] = merged
+                on_curve -= p_on
+                changed = True
+            else:
+                i += 1
+    return nodes
+
+
+def simplify_path(paths, tolerance):
+    """경로를 단순화한 GlyphPath (opcode / 좌표 버퍼 새로 생성)
+
+    tolerance: 원래 윤곽선에서 벗어날 수 있는 최대 거리 (폰트 단위, 0 이면 정확히
+    일직선 / 중점인 점만 제거)
+    """
+    result = []
+    for contour in compile_paths(paths).contours():
+        nodes = contour_nodes(contour)
+        if nodes is None or not any(on for _, on in nodes):
+            result.append(contour)
+            continue
+        result.append(build_contour(_simplify_nodes(nodes, tolerance)))
+    return GlyphPath.join(result)
+
+
+# ============================================
+# 글리프 dict
+# ============================================
+
+def glyf_points(paths):
+    """glyf 에 저장되는 점 개수 (tt_glyph 기준)"""
+    return len(tt_glyph(compile_paths(paths)).coordinates)
+
+
+def simplify_glyphs(glyphs, tolerance):
+    """(단순화한 글리프 dict, {글리프: (원래 점 수, 줄어든 점 수)}) - 점이 줄어든 글리프만 보고
+
+    합성 글리프와 점이 줄지 않는 글리프는 원래 객체를 그대로 쓴다.
+    """
+    simplified = {}
+    report = {}
+    for name, glyph in glyphs.items():
+        paths = glyph.get('paths')
+        if 'components' in glyph or not paths:
+            simplified[name] = glyph
+            continue
+        path = simplify_path(paths, tolerance)
+        before, after = glyf_points(paths), glyf_points(path)
+        if after < before:
+            simplified[name] = dict(glyph, paths=path)
+            report[name] = (before, before - after)
+        else:
+            simplified[name] = glyph
+    return simplified, report
+
+
+def format_report(report, limit=8):
+    """보고서 요약 한 줄 + 점이 많이 줄어든 글리프 목록"""
+    before = sum(total for total, _ in report.values())
+    removed = sum(count for _, count in report.values())
+    lines = [f"글리프 {len(report):,}개에서 점 {removed:,}개 제거"
+             + (f" ({removed / before:.0%})" if before else "")]
+    top = sorted(report.items(), key=lambda item: -item[1][1])[:limit]
+    if top:
+        lines.append(', '.join(f"{name} -{count}/{total}" for name, (total, count) in top))
+    return lines
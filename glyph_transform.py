@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+NumPy 윤곽선 변환 엔진 - 파생 스타일(기울임 / 좁게 / 넓게 / 굵게) 생성
+- 글리프 dict 의 모든 윤곽선 좌표를 (N, 2) 배열 하나로 모아 아핀 변환을 한 번에 적용
+- 합성 글리프(한글 음절 등)는 구성 요소 변환만 바꿈 (서로 다른 변환 행렬 표 하나를 일괄 계산)
+- 획 굵기 변형(glyph_path.embolden 과 같은 규칙)과 폭 조절도 배열 연산으로 처리
+  (구성 요소로 축소되는 자모는 축소된 좌표계에서 두껍게 해 음절에서도 같은 굵기가 되게 함)
+- 결과는 다시 글리프 dict (GlyphPath) 로 되돌려 build_font 에 그대로 넘김
+"""
+
+import argparse
+import math
+import os
+import time
+from array import array
+
+import numpy as np
+
+from glyph_path import GlyphPath, compile_paths, contour_lengths, is_hole
+
+# 파생 스타일 프리셋 (derive 인자)
+STYLE_PRESETS = {
+    'Oblique': {'slant': 12},
+    'Condensed': {'scale': (0.82, 1.0)},
+    'Expanded': {'scale': (1.18, 1.0)},
+    'Light': {'stroke': -10},
+    'Bold': {'stroke': 16},
+    'BoldOblique': {'stroke': 16, 'slant': 12},
+    'CondensedBold': {'scale': (0.82, 1.0), 'stroke': 14},
+    'Wide': {'scale': (1.18, 1.0), 'tracking': 40},
+}
+
+# 파생 스타일을 만들 생성기: 폰트 이름 → (모듈, 생성 함수)
+SOURCES = {
+    'GeoRound': ('create_fonts', 'create_geometric_font'),
+    'SharpEdge': ('create_unique_fonts', 'create_sharp_font'),
+    'BubblePop': ('create_unique_fonts', 'create_bubble_font'),
+}
+OUTPUT_DIR = os.path.join('fonts', 'derived')
+
+# 뾰족한 모서리에서 획 굵기 변형이 늘어나는 최대 배율 (glyph_path.embolden 과 같음)
+_MITER_LIMIT = 2.0
+
+
+def slant(degrees):
+    """기준선(y=0) 기준 기울임 변환 (xx, xy, yx, yy, dx, dy)"""
+    return (1.0, 0.0, math.tan(math.radians(degrees)), 1.0, 0.0, 0.0)
+
+
+def scale(sx, sy=None):
+    """원점 기준 크기 변환"""
+    return (sx, 0.0, 0.0, sx if sy is None else sy, 0.0, 0.0)
+
+
+def _matrix3(transform):
+    """(xx, xy, yx, yy, dx, dy) → 행 벡터용 3x3 행렬 ([x, y, 1] @ m)"""
+    xx, xy, yx, yy, dx, dy = transform
+    return np.array([[xx, xy, 0.0], [yx, yy, 0.0], [dx, dy, 1.0]])
+
+
+# ============================================
+# 글리프 구조 (모든 변형이 공유)
+# ============================================
+
+class _Structure:
+    """좌표와 무관한 글리프 구성 - 이름, opcode, 좌표 구간, 구성 요소, 이웃 점"""
+
+    def __init__(self, glyphs):
+        self.names = list(glyphs)
+        self.ops = {}
+        self.slices = {}
+        chunks = []
+        start = 0
+        # 구성 요소는 평탄화: 기준 글리프 이름, 변환 행렬 번호, 소유 글리프 번호, 글리프별 구간
+        matrices = {}
+        self.flat_bases = []
+        flat_matrices = []
+        flat_owners = []
+        self.spans = {}
+        for index, (name, glyph) in enumerate(glyphs.items()):
+            if 'components' in glyph:
+                self.spans[name] = (len(self.flat_bases),
+                                    len(self.flat_bases) + len(glyph['components']))
+                for base, transform in glyph['components']:
+                    self.flat_bases.append(base)
+                    flat_matrices.append(matrices.setdefault(tuple(transform), len(matrices)))
+                    flat_owners.append(index)
+                continue
+            path = compile_paths(glyph.get('paths', []))
+            count = len(path.coords) // 2
+            self.ops[name] = path.ops
+            self.slices[name] = (start, start + count)
+            chunks.append(path.coords.tobytes())
+            start += count
+        self.coords = np.frombuffer(b''.join(chunks), dtype=np.int16).reshape(-1, 2)
+        self.matrices = np.array([_matrix3(t) for t in matrices]).reshape(-1, 3, 3)
+        self.flat_matrices = np.array(flat_matrices, dtype=np.intp)
+        self.flat_owners = np.array(flat_owners, dtype=np.intp)
+
+        # 폭과 여백을 조절할 글리프 - 다른 글리프의 구성 요소로 쓰이지 않는 글리프
+        referenced = set(self.flat_bases)
+        self.spacing = np.array([name not in referenced for name in self.names])
+        self.simple_spacing = np.array([name in self.slices and name not in referenced
+                                        for name in self.names])
+        self.spacing_points = np.zeros(len(self.coords), dtype=bool)
+        for name, (a, b) in self.slices.items():
+            if name not in referenced:
+                self.spacing_points[a:b] = True
+        # 구성 요소로 쓰이는 단순 글리프: (점 구간, 참조하는 평탄화 구성 요소 번호)
+        uses = {}
+        for flat, base in enumerate(self.flat_bases):
+            if base in self.slices:
+                uses.setdefault(base, []).append(flat)
+        self.component_uses = [(self.slices[base], np.array(flat, dtype=np.intp))
+                               for base, flat in uses.items()]
+        self._neighbors = None
+
+    def neighbors(self):
+        """(앞 점, 뒤 점, 잉크 쪽 부호, 유효 여부) - 같은 위치의 점은 건너뛴 이웃
+
+        윤곽선 방향과 구멍 여부는 원래 좌표에서 한 번만 구한다 (가역 아핀 변환은
+        포함 관계를 바꾸지 않고, 방향은 행렬식 부호로 보정).
+        """
+        if self._neighbors is not None:
+            return self._neighbors
+        n = len(self.coords)
+        prev = np.arange(n)
+        following = np.arange(n)
+        sign = np.zeros(n)
+        valid = np.zeros(n, dtype=bool)
+        points = [tuple(p) for p in self.coords.tolist()]
+        for name, (a, _) in self.slices.items():
+            # 윤곽선 경계는 opcode 로 구하고 좌표는 전역 배열에서 읽음
+            offset = a
+            polygons = []
+            for contour in contour_lengths(self.ops[name]):
+                polygons.append(points[offset:offset + contour])
+                offset += contour
+            offset = a
+            for index, polygon in enumerate(polygons):
+                m = len(polygon)
+                if m >= 3:
+                    area = sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1)
+                               in zip(polygon, polygon[1:] + polygon[:1]))
+                    contour_sign = (1 if area > 0 else -1) * (-1 if is_hole(index, polygons) else 1)
+                    for i, point in enumerate(polygon):
+                        p = next((k for k in range(1, m) if polygon[(i - k) % m] != point), None)
+                        if p is None:
+                            continue
+                        q = next(k for k in range(1, m) if polygon[(i + k) % m] != point)
+                        prev[offset + i] = offset + (i - p) % m
+                        following[offset + i] = offset + (i + q) % m
+                        sign[offset + i] = contour_sign
+                        valid[offset + i] = True
+                offset += m
+        self._neighbors = (prev, following, sign, valid)
+        return self._neighbors
+
+
+# ============================================
+# 변환 엔진
+# ============================================
+
+class OutlineArray:
+    """글리프 dict 전체를 배열로 들고 있는 변형 상태 (연산마다 새 객체 반환)
+
+    coords: 모든 단순 글리프 점 (N, 2) float64
+    widths: 글리프별 전진 폭
+    matrices: 서로 다른 구성 요소 변환 (K, 3, 3)
+    shifts: 합성 글리프별 추가 이동 (트래킹 여백)
+    """
+
+    def __init__(self, structure, coords, widths, matrices, shifts, flip=1):
+        self.structure = structure
+        self.coords = coords
+        self.widths = widths
+        self.matrices = matrices
+        self.shifts = shifts
+        self.flip = flip
+
+    @classmethod
+    def from_glyphs(cls, glyphs):
+        structure = _Structure(glyphs)
+        widths = np.array([glyphs[name]['width'] for name in structure.names], dtype=float)
+        return cls(structure, structure.coords.astype(float), widths,
+                   structure.matrices.copy(), np.zeros((len(widths), 2)))
+
+    def _replace(self, **changes):
+        state = dict(structure=self.structure, coords=self.coords, widths=self.widths,
+                     matrices=self.matrices, shifts=self.shifts, flip=self.flip)
+        state.update(changes)
+        return OutlineArray(**state)
+
+    def transform(self, transform):
+        """아핀 변환 (xx, xy, yx, yy, dx, dy) - 폭은 가로 배율(xx)만큼 조절
+
+        합성 글리프는 기준 글리프도 같이 변환되므로 구성 요소 변환 T 를 M·T·M⁻¹ 로 바꾼다.
+        """
+        m = _matrix3(transform)
+        det = transform[0] * transform[3] - transform[1] * transform[2]
+        if abs(det) < 1e-12:
+            raise ValueError(f"역변환이 없는 변환은 쓸 수 없습니다: {transform}")
+        linear = m[:2, :2]
+        coords = self.coords @ linear + m[2, :2]
+        matrices = np.linalg.inv(m) @ self.matrices @ m
+        return self._replace(coords=coords, widths=self.widths * transform[0],
+                             matrices=matrices, shifts=self.shifts @ linear,
+                             flip=self.flip * (1 if det > 0 else -1))
+
+    def _point_scales(self):
+        """점별 (x, y) 축소 비율 - 구성 요소로 쓰이는 글리프는 참조 변환 배율의 기하 평균
+
+        hangul.design_scales 처럼 자모마다 대표 배율 하나를 쓴다 (배치마다 조금씩 다름).
+        """
+        structure = self.structure
+        scales = np.ones((len(self.coords), 2))
+        if not structure.component_uses:
+            return scales
+        linear = self.matrices[:, :2, :2]
+        # 행 벡터 규칙이라 x 배율은 0행, y 배율은 1행의 길이
+        logs = np.log(np.maximum(np.hypot(linear[:, :, 0], linear[:, :, 1]), 1e-3))
+        flat_logs = logs[structure.flat_matrices]
+        for (a, b), flat in structure.component_uses:
+            scales[a:b] = np.exp(flat_logs[flat].mean(axis=0))
+        return scales
+
+    def embolden(self, amount, adjust_width=True):
+        """윤곽선을 잉크 쪽으로 amount 만큼 두껍게 (음수면 얇게) - glyph_path.embolden 과 같은 규칙
+
+        adjust_width: 다른 글리프가 참조하지 않는 단순 글리프는 폭을 2 * amount 늘리고
+        amount 만큼 오른쪽으로 옮겨 양쪽 여백을 유지 (구성 요소용 자모 등은 제자리에서 변형).
+        구성 요소로 축소되어 쓰이는 글리프는 축소된 좌표계에서 amount 만큼 두껍게 한 뒤
+        되돌려, 합성 글리프에서도 단순 글리프와 같은 굵기만큼 늘어나게 한다.
+        """
+        prev, following, sign, valid = self.structure.neighbors()
+        scales = self._point_scales()
+        p = self.coords * scales
+        sign = sign * self.flip
+
+        def normals(a, b):
+            d = b - a
+            length = np.hypot(d[:, 0], d[:, 1])
+            length[length == 0] = 1.0
+            return np.stack([d[:, 1], -d[:, 0]], axis=1) * (sign / length)[:, None]
+
+        n1 = normals(p[prev], p)
+        n2 = normals(p, p[following])
+        m = n1 + n2
+        length = np.hypot(m[:, 0], m[:, 1])
+        reverse = length < 1e-9
+        m[reverse] = n1[reverse]
+        length[reverse] = 1.0
+        m /= length[:, None]
+        cos = np.maximum((m * n1).sum(axis=1), 1 / _MITER_LIMIT)
+        offset = m * (amount / cos)[:, None]
+        offset[~valid] = 0.0
+        coords = self.coords + offset / scales
+
+        widths = self.widths
+        if adjust_width:
+            coords[self.structure.spacing_points, 0] += amount
+            widths = widths + 2 * amount * self.structure.simple_spacing
+        return self._replace(coords=coords, widths=widths)
+
+    def track(self, amount):
+        """참조되지 않는 글리프의 폭을 amount 만큼 늘리고 내용은 amount / 2 만큼 옮김"""
+        structure = self.structure
+        spacing = structure.spacing
+        coords = self.coords.copy()
+        coords[structure.spacing_points, 0] += amount / 2
+        shifts = self.shifts.copy()
+        shifts[spacing, 0] += amount / 2
+        return self._replace(coords=coords, widths=self.widths + amount * spacing,
+                             shifts=shifts)
+
+    def to_glyphs(self):
+        """글리프 dict (단순 글리프는 GlyphPath, 합성 글리프는 구성 요소 목록) 로 되돌림"""
+        structure = self.structure
+        coords = np.clip(np.rint(self.coords), -32768, 32767).astype(np.int16)
+        widths = np.rint(self.widths).astype(int).tolist()
+        m = self.matrices
+        table = np.stack([m[:, 0, 0], m[:, 0, 1], m[:, 1, 0], m[:, 1, 1],
+                          m[:, 2, 0], m[:, 2, 1]], axis=1)
+
+        # 구성 요소는 평탄화한 배열로 한 번에 만들고 글리프별 구간으로 나눔
+        if self.shifts.any():
+            rows = table[structure.flat_matrices]
+            rows[:, 4:] += self.shifts[structure.flat_owners]
+            flat = list(zip(structure.flat_bases, map(tuple, rows.tolist())))
+        else:
+            transforms = list(map(tuple, table.tolist()))
+            flat = list(zip(structure.flat_bases,
+                            map(transforms.__getitem__, structure.flat_matrices.tolist())))
+
+        glyphs = {}
+        for index, name in enumerate(structure.names):
+            span = structure.spans.get(name)
+            if span is None:
+                a, b = structure.slices[name]
+                glyph_coords = array('h')
+                glyph_coords.frombytes(coords[a:b].tobytes())
+                glyphs[name] = {'width': widths[index],
+                                'paths': GlyphPath(structure.ops[name], glyph_coords)}
+            else:
+                glyphs[name] = {'width': widths[index], 'components': flat[span[0]:span[1]]}
+        return glyphs
+
+
+def derive(outlines, slant_degrees=0, scale_xy=(1.0, 1.0), stroke=0, tracking=0,
+           to_glyphs=True):
+    """파생 스타일 하나 - 크기 → 획 굵기 → 기울임 → 자간 순서로 적용한 글리프 dict
+
+    to_glyphs=False 면 글리프 dict 대신 OutlineArray 를 반환 (이어서 변환할 때)
+    """
+    if scale_xy != (1.0, 1.0):
+        outlines = outlines.transform(scale(*scale_xy))
+    if stroke:
+        outlines = outlines.embolden(stroke)
+    if slant_degrees:
+        outlines = outlines.transform(slant(slant_degrees))
+    if tracking:
+        outlines = outlines.track(tracking)
+    return outlines.to_glyphs() if to_glyphs else outlines
+
+
+def derive_preset(outlines, preset):
+    options = STYLE_PRESETS[preset]
+    return derive(outlines, slant_degrees=options.get('slant', 0),
+                  scale_xy=options.get('scale', (1.0, 1.0)),
+                  stroke=options.get('stroke', 0), tracking=options.get('tracking', 0))
+
+
+def main():
+    import importlib
+
+    parser = argparse.ArgumentParser(description='파생 스타일 폰트 생성 (NumPy 변환 엔진)')
+    parser.add_argument('--fonts', nargs='+', choices=list(SOURCES), default=list(SOURCES))
+    parser.add_argument('--styles', nargs='+', choices=list(STYLE_PRESETS),
+                        default=list(STYLE_PRESETS))
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help='출력 디렉터리')
+    parser.add_argument('--formats', nargs='+', default=['ttf'],
+                        choices=('ttf', 'woff', 'woff2'))
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  파생 스타일 폰트 생성")
+    print("=" * 60)
+    print()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for font_name in args.fonts:
+        module_name, generator = SOURCES[font_name]
+        module = importlib.import_module(module_name)
+        started = time.perf_counter()
+        outlines = OutlineArray.from_glyphs(getattr(module, generator)())
+        variants = {style: derive_preset(outlines, style) for style in args.styles}
+        print(f"⚙️  {font_name}: {len(variants)}개 스타일 변형 "
+              f"{(time.perf_counter() - started) * 1000:.0f}ms")
+        for style, glyphs in variants.items():
+            output_path = os.path.join(args.output_dir, f'{font_name}{style}-Regular.ttf')
+            module.build_font(glyphs, f'{font_name}{style}', f'{font_name} {style}',
+                              output_path, formats=args.formats)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,635 @@
+#!/usr/bin/env python3
+"""
+한글 음절 생성기 - 자모 합성 방식
+- 초성 19 / 중성 21 / 종성 27 자모를 획 골격으로 정의하고 스타일별(round / sharp) 윤곽선으로 렌더링
+- 완성형 11,172 음절은 윤곽선을 복사하지 않고 자모 글리프를 위치별 변환(크기 + 이동)으로
+  참조하는 TrueType 합성 글리프로 생성
+"""
+
+import math
+
+from fontTools.feaLib.builder import addOpenTypeFeaturesFromString
+from fontTools.otlLib.builder import buildLookup, buildMultipleSubstSubtable
+from fontTools.ttLib.tables import otTables
+
+# 유니코드 음절 조합 순서
+INITIALS = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+MEDIALS = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+FINALS = 'ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ'  # 종성 없음(0번) 제외
+
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_COUNT = len(INITIALS) * len(MEDIALS) * (len(FINALS) + 1)   # 11,172
+
+# 호환용 자모 U+3131~U+3163 (단독으로 쓰는 ㄱ, ㅏ 등)
+COMPAT_JAMO_BASE = 0x3131
+COMPAT_CONSONANTS = 'ㄱㄲㄳㄴㄵㄶㄷㄸㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅃㅄㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+
+HANGUL_WIDTH = 1000
+# 음절이 차지하는 영역 (x0, y0, x1, y1)
+SYLLABLE_BOX = (60, -80, 940, 780)
+# 자모 골격 좌표계 (0~1000 정사각형) - 합성 시 위치별 영역으로 축소
+CANVAS = 1000
+# 자모 글리프 자체의 좌표 영역 - 캔버스를 em 상자(폭 1000, 800 ~ -200) 안으로 줄여 담아
+# 획 굵기만큼 캔버스 밖으로 나온 윤곽선도 폰트 메트릭(head / hhea)을 넘지 않게 함
+JAMO_BOX = (100, -100, 900, 700)
+
+# 스타일별 획 굵기 절반 (최종 음절 크기 기준 단위)
+STYLES = {
+    'round': {'half_width': 32},
+    'sharp': {'half_width': 30},
+}
+
+VERTICAL_VOWELS = set('ㅏㅐㅑㅒㅓㅔㅕㅖㅣ')
+HORIZONTAL_VOWELS = set('ㅗㅛㅜㅠㅡ')
+
+
+# ============================================
+# 자모 골격 (획 중심선)
+# ============================================
+
+# ('line', [(x, y), ...]) 꺾은선 획 / ('ring', (cx, cy), (rx, ry)) 고리
+_SKELETONS = {
+    # 자음
+    'ㄱ': [('line', [(100, 900), (880, 900), (880, 100)])],
+    'ㄴ': [('line', [(120, 900), (120, 100), (900, 100)])],
+    'ㄷ': [('line', [(900, 900), (120, 900), (120, 100), (900, 100)])],
+    'ㄹ': [('line', [(100, 900), (880, 900), (880, 500), (120, 500), (120, 100),
+                     (900, 100)])],
+    'ㅁ': [('line', [(120, 900), (880, 900), (880, 100), (120, 100), (120, 900)])],
+    'ㅂ': [('line', [(120, 920), (120, 100), (880, 100), (880, 920)]),
+           ('line', [(120, 500), (880, 500)])],
+    'ㅅ': [('line', [(500, 920), (100, 100)]),
+           ('line', [(500, 920), (900, 100)])],
+    'ㅇ': [('ring', (500, 500), (380, 380))],
+    'ㅈ': [('line', [(120, 900), (880, 900)]),
+           ('line', [(500, 900), (100, 100)]),
+           ('line', [(500, 900), (900, 100)])],
+    'ㅊ': [('line', [(500, 1000), (500, 880)]),
+           ('line', [(120, 780), (880, 780)]),
+           ('line', [(500, 780), (100, 100)]),
+           ('line', [(500, 780), (900, 100)])],
+    'ㅋ': [('line', [(100, 900), (880, 900), (880, 100)]),
+           ('line', [(100, 500), (880, 500)])],
+    'ㅌ': [('line', [(880, 900), (120, 900), (120, 100), (900, 100)]),
+           ('line', [(120, 500), (860, 500)])],
+    'ㅍ': [('line', [(100, 900), (900, 900)]),
+           ('line', [(100, 100), (900, 100)]),
+           ('line', [(340, 900), (340, 100)]),
+           ('line', [(660, 900), (660, 100)])],
+    'ㅎ': [('line', [(500, 1000), (500, 900)]),
+           ('line', [(150, 800), (850, 800)]),
+           ('ring', (500, 330), (270, 270))],
+
+    # 세로 모음 (초성 오른쪽)
+    'ㅣ': [('line', [(500, 950), (500, 50)])],
+    'ㅏ': [('line', [(400, 950), (400, 50)]),
+           ('line', [(400, 500), (850, 500)])],
+    'ㅑ': [('line', [(400, 950), (400, 50)]),
+           ('line', [(400, 640), (850, 640)]),
+           ('line', [(400, 360), (850, 360)])],
+    'ㅓ': [('line', [(600, 950), (600, 50)]),
+           ('line', [(150, 500), (600, 500)])],
+    'ㅕ': [('line', [(600, 950), (600, 50)]),
+           ('line', [(150, 640), (600, 640)]),
+           ('line', [(150, 360), (600, 360)])],
+    'ㅐ': [('line', [(300, 950), (300, 50)]),
+           ('line', [(750, 950), (750, 50)]),
+           ('line', [(300, 500), (750, 500)])],
+    'ㅒ': [('line', [(300, 950), (300, 50)]),
+           ('line', [(750, 950), (750, 50)]),
+           ('line', [(300, 640), (750, 640)]),
+           ('line', [(300, 360), (750, 360)])],
+    'ㅔ': [('line', [(400, 950), (400, 50)]),
+           ('line', [(800, 950), (800, 50)]),
+           ('line', [(80, 500), (400, 500)])],
+    'ㅖ': [('line', [(400, 950), (400, 50)]),
+           ('line', [(800, 950), (800, 50)]),
+           ('line', [(80, 640), (400, 640)]),
+           ('line', [(80, 360), (400, 360)])],
+
+    # 가로 모음 (초성 아래)
+    'ㅡ': [('line', [(50, 500), (950, 500)])],
+    'ㅗ': [('line', [(50, 300), (950, 300)]),
+           ('line', [(500, 300), (500, 800)])],
+    'ㅛ': [('line', [(50, 300), (950, 300)]),
+           ('line', [(350, 300), (350, 800)]),
+           ('line', [(650, 300), (650, 800)])],
+    'ㅜ': [('line', [(50, 700), (950, 700)]),
+           ('line', [(500, 700), (500, 150)])],
+    'ㅠ': [('line', [(50, 700), (950, 700)]),
+           ('line', [(350, 700), (350, 150)]),
+           ('line', [(650, 700), (650, 150)])],
+}
+
+# 겹자음 / 겹받침 - 두 자음을 좌우 반씩
+_DOUBLE_CONSONANTS = {
+    'ㄲ': 'ㄱㄱ', 'ㄸ': 'ㄷㄷ', 'ㅃ': 'ㅂㅂ', 'ㅆ': 'ㅅㅅ', 'ㅉ': 'ㅈㅈ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ',
+    'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ', 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ',
+    'ㅄ': 'ㅂㅅ',
+}
+# 섞임 모음 - 가로 모음은 왼쪽 아래, 세로 모음은 오른쪽
+_MIXED_VOWELS = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ',
+    'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+
+
+def _place(strokes, box):
+    """골격을 캔버스 안의 box (x0, y0, x1, y1) 로 축소 배치"""
+    x0, y0, x1, y1 = box
+    sx = (x1 - x0) / CANVAS
+    sy = (y1 - y0) / CANVAS
+    placed = []
+    for stroke in strokes:
+        if stroke[0] == 'line':
+            placed.append(('line', [(x0 + x * sx, y0 + y * sy) for x, y in stroke[1]]))
+        else:
+            (cx, cy), (rx, ry) = stroke[1], stroke[2]
+            placed.append(('ring', (x0 + cx * sx, y0 + cy * sy), (rx * sx, ry * sy)))
+    return placed
+
+
+def skeleton(jamo):
+    """자모 하나의 획 골격 (겹자음/섞임 모음은 기본 자모를 배치해 구성)"""
+    if jamo in _DOUBLE_CONSONANTS:
+        left, right = _DOUBLE_CONSONANTS[jamo]
+        return (_place(skeleton(left), (0, 0, 480, 1000))
+                + _place(skeleton(right), (520, 0, 1000, 1000)))
+    if jamo in _MIXED_VOWELS:
+        horizontal, vertical = _MIXED_VOWELS[jamo]
+        return (_place(skeleton(horizontal), (0, 0, 640, 460))
+                + _place(skeleton(vertical), (560, 0, 1000, 1000)))
+    return _SKELETONS[jamo]
+
+
+def vowel_type(medial):
+    if medial in VERTICAL_VOWELS:
+        return 'vertical'
+    if medial in HORIZONTAL_VOWELS:
+        return 'horizontal'
+    return 'mixed'
+
+
+# ============================================
+# 음절 배치 (위치별 변환)
+# ============================================
+
+# (모음 종류, 받침 유무) → 자모 위치별 영역 (음절 영역에 대한 비율)
+_FINAL_BOX = (0.12, 0.0, 0.88, 0.34)
+LAYOUTS = {
+    ('vertical', False): {'initial': (0.0, 0.1, 0.6, 0.9),
+                          'medial': (0.56, 0.0, 1.0, 1.0)},
+    ('vertical', True): {'initial': (0.0, 0.46, 0.6, 1.0),
+                         'medial': (0.56, 0.38, 1.0, 1.0),
+                         'final': _FINAL_BOX},
+    ('horizontal', False): {'initial': (0.12, 0.44, 0.88, 1.0),
+                            'medial': (0.0, 0.0, 1.0, 0.42)},
+    ('horizontal', True): {'initial': (0.18, 0.66, 0.82, 1.0),
+                           'medial': (0.0, 0.38, 1.0, 0.64),
+                           'final': _FINAL_BOX},
+    ('mixed', False): {'initial': (0.0, 0.48, 0.58, 1.0),
+                       'medial': (0.0, 0.0, 1.0, 1.0)},
+    ('mixed', True): {'initial': (0.0, 0.68, 0.58, 1.0),
+                      'medial': (0.0, 0.38, 1.0, 1.0),
+                      'final': _FINAL_BOX},
+}
+
+
+def box_transform(rel_box, outer=SYLLABLE_BOX):
+    """자모 글리프(JAMO_BOX 좌표)를 outer 안의 비율 영역으로 옮기는 (xx, xy, yx, yy, dx, dy)"""
+    ox0, oy0, ox1, oy1 = outer
+    w = ox1 - ox0
+    h = oy1 - oy0
+    rx0, ry0, rx1, ry1 = rel_box
+    jx0, jy0, jx1, jy1 = JAMO_BOX
+    sx = (rx1 - rx0) * w / (jx1 - jx0)
+    sy = (ry1 - ry0) * h / (jy1 - jy0)
+    return (sx, 0, 0, sy, ox0 + rx0 * w - jx0 * sx, oy0 + ry0 * h - jy0 * sy)
+
+
+def _design_scale(boxes):
+    """여러 배치에서 쓰이는 자모의 캔버스 대비 대표 축소 비율 (x, y 각각 기하 평균)"""
+    transforms = [box_transform(box) for box in boxes]
+    jx0, jy0, jx1, jy1 = JAMO_BOX
+    sx = math.exp(sum(math.log(t[0]) for t in transforms) / len(transforms))
+    sy = math.exp(sum(math.log(t[3]) for t in transforms) / len(transforms))
+    return sx * (jx1 - jx0) / CANVAS, sy * (jy1 - jy0) / CANVAS
+
+
+def design_scales():
+    """자모 글리프별 설계 축소 비율 - 이 비율로 줄었을 때 획 굵기가 고르게 보이도록 렌더링"""
+    scales = {}
+    initial = _design_scale([layout['initial'] for layout in LAYOUTS.values()])
+    for jamo in INITIALS:
+        scales[('initial', jamo)] = initial
+    for jamo in MEDIALS:
+        kind = vowel_type(jamo)
+        scales[('medial', jamo)] = _design_scale(
+            [LAYOUTS[(kind, has_final)]['medial'] for has_final in (False, True)])
+    final = _design_scale([_FINAL_BOX])
+    for jamo in FINALS:
+        scales[('final', jamo)] = final
+    return scales
+
+
+# ============================================
+# 골격 → 윤곽선 렌더링
+# ============================================
+
+def _clockwise(points):
+    """TrueType 바깥 윤곽선 방향(시계 방향)으로 정렬"""
+    area = sum(x0 * y1 - x1 * y0
+               for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]))
+    return points[::-1] if area > 0 else points
+
+
+def _polygon(points):
+    points = _clockwise(points)
+    return ([('moveTo', points[0])] + [('lineTo', p) for p in points[1:]]
+            + [('closePath', None)])
+
+
+def _ellipse(cx, cy, rx, ry, clockwise=True):
+    """2차 곡선 8개로 근사한 타원"""
+    sign = -1 if clockwise else 1
+    k = 1 / math.cos(math.pi / 8)
+    on = [(cx + rx * math.cos(sign * i * math.pi / 4),
+           cy + ry * math.sin(sign * i * math.pi / 4)) for i in range(8)]
+    off = [(cx + rx * k * math.cos(sign * (i + 0.5) * math.pi / 4),
+            cy + ry * k * math.sin(sign * (i + 0.5) * math.pi / 4)) for i in range(8)]
+    path = [('moveTo', on[0])]
+    for i in range(8):
+        path.append(('qCurveTo', off[i], on[(i + 1) % 8]))
+    path.append(('closePath', None))
+    return path
+
+
+def _octagon(cx, cy, rx, ry, clockwise=True):
+    sign = -1 if clockwise else 1
+    points = [(cx + rx * math.cos(sign * (i + 0.5) * math.pi / 4),
+               cy + ry * math.sin(sign * (i + 0.5) * math.pi / 4)) for i in range(8)]
+    return ([('moveTo', points[0])] + [('lineTo', p) for p in points[1:]]
+            + [('closePath', None)])
+
+
+def _segment(p, q, half, extend):
+    """p→q 획 하나의 사각형 (extend: 양 끝을 획 굵기 절반만큼 늘림)"""
+    dx, dy = q[0] - p[0], q[1] - p[1]
+    length = math.hypot(dx, dy) or 1
+    ux, uy = dx / length, dy / length
+    nx, ny = -uy * half, ux * half
+    ex, ey = (ux * half, uy * half) if extend else (0, 0)
+    p = (p[0] - ex, p[1] - ey)
+    q = (q[0] + ex, q[1] + ey)
+    return _polygon([(p[0] + nx, p[1] + ny), (q[0] + nx, q[1] + ny),
+                     (q[0] - nx, q[1] - ny), (p[0] - nx, p[1] - ny)])
+
+
+def render(strokes, style, scale, stroke=0):
+    """골격을 스타일 윤곽선(튜플 경로 리스트)으로 렌더링
+
+    scale (sx, sy) 로 줄어든 좌표계에서 같은 굵기로 그린 뒤 JAMO_BOX 좌표로 옮겨,
+    합성 글리프에서 축소되었을 때 가로/세로 획 굵기가 같아지게 한다.
+    stroke 는 획 굵기 절반에 더할 값 (점 구조는 그대로라 가변 폰트 마스터끼리 호환).
+    """
+    half = STYLES[style]['half_width'] + stroke
+    sx, sy = scale
+    paths = []
+    for stroke in strokes:
+        if stroke[0] == 'line':
+            points = [(x * sx, y * sy) for x, y in stroke[1]]
+            for p, q in zip(points, points[1:]):
+                paths.append(_segment(p, q, half, extend=(style == 'sharp')))
+            if style == 'round':
+                # 획 끝과 꺾이는 곳을 둥글게
+                for x, y in points:
+                    paths.append(_ellipse(x, y, half, half))
+        else:
+            (cx, cy), (rx, ry) = stroke[1], stroke[2]
+            cx, cy, rx, ry = cx * sx, cy * sy, rx * sx, ry * sy
+            shape = _ellipse if style == 'round' else _octagon
+            paths.append(shape(cx, cy, rx + half, ry + half, clockwise=True))
+            paths.append(shape(cx, cy, rx - half, ry - half, clockwise=False))
+
+    # 캔버스 좌표로 되돌려 JAMO_BOX 로 옮기고 정수로 반올림
+    jx0, jy0, jx1, jy1 = JAMO_BOX
+    kx = (jx1 - jx0) / CANVAS / sx
+    ky = (jy1 - jy0) / CANVAS / sy
+    result = []
+    for path in paths:
+        converted = []
+        for item in path:
+            if item[0] == 'closePath':
+                converted.append(item)
+            else:
+                converted.append((item[0],) + tuple(
+                    (round(jx0 + x * kx), round(jy0 + y * ky)) for x, y in item[1:]))
+        result.append(converted)
+    return result
+
+
+# ============================================
+# 글리프 / cmap 생성
+# ============================================
+
+def initial_name(i):
+    return f'uni{0x1100 + i:04X}'
+
+
+def medial_name(v):
+    return f'uni{0x1161 + v:04X}'
+
+
+def final_name(t):
+    """t: 1~27 (0 은 받침 없음)"""
+    return f'uni{0x11A7 + t:04X}'
+
+
+def base_name(name):
+    """합성에 쓰는 자모 윤곽선 글리프 이름 (uni1100.base) - cmap 이 없는 글리프라
+    유니코드 값으로 읽히는 이름을 쓰지 않음"""
+    return f'{name}.base'
+
+
+def syllable_name(code):
+    return f'uni{code:04X}'
+
+
+def decompose(code):
+    """완성형 음절 코드 → (초성, 중성, 종성) 인덱스"""
+    index = code - SYLLABLE_BASE
+    return (index // (len(MEDIALS) * (len(FINALS) + 1)),
+            index // (len(FINALS) + 1) % len(MEDIALS),
+            index % (len(FINALS) + 1))
+
+
+def create_jamo_glyphs(style, stroke=0):
+    """초성/중성/종성 자모 글리프 (음절 합성의 기준 윤곽선, cmap 에는 넣지 않음)"""
+    scales = design_scales()
+    glyphs = {}
+    for i, jamo in enumerate(INITIALS):
+        glyphs[base_name(initial_name(i))] = {
+            'width': CANVAS,
+            'paths': render(skeleton(jamo), style, scales[('initial', jamo)], stroke)}
+    for v, jamo in enumerate(MEDIALS):
+        glyphs[base_name(medial_name(v))] = {
+            'width': CANVAS,
+            'paths': render(skeleton(jamo), style, scales[('medial', jamo)], stroke)}
+    for t, jamo in enumerate(FINALS, 1):
+        glyphs[base_name(final_name(t))] = {
+            'width': CANVAS,
+            'paths': render(skeleton(jamo), style, scales[('final', jamo)], stroke)}
+    return glyphs
+
+
+def create_syllable_glyphs():
+    """완성형 음절 11,172자 - 자모 글리프를 참조하는 합성 글리프"""
+    # 배치별 변환은 모든 음절이 같은 튜플을 공유
+    transforms = {key: {role: box_transform(box) for role, box in layout.items()}
+                  for key, layout in LAYOUTS.items()}
+    kinds = [vowel_type(jamo) for jamo in MEDIALS]
+    glyphs = {}
+    for index in range(SYLLABLE_COUNT):
+        code = SYLLABLE_BASE + index
+        i, v, t = decompose(code)
+        layout = transforms[(kinds[v], t > 0)]
+        components = [(base_name(initial_name(i)), layout['initial']),
+                      (base_name(medial_name(v)), layout['medial'])]
+        if t:
+            components.append((base_name(final_name(t)), layout['final']))
+        glyphs[syllable_name(code)] = {'width': HANGUL_WIDTH, 'components': components}
+    return glyphs
+
+
+def create_compat_jamo_glyphs():
+    """단독 자모 (ㄱ, ㅏ …) - 자모 글리프 하나를 음절 크기로 배치한 합성 글리프"""
+    glyphs = {}
+    consonant_box = box_transform((0.15, 0.1, 0.85, 0.9))
+    for offset, jamo in enumerate(COMPAT_CONSONANTS):
+        if jamo in INITIALS:
+            base = initial_name(INITIALS.index(jamo))
+        else:
+            base = final_name(FINALS.index(jamo) + 1)
+        glyphs[syllable_name(COMPAT_JAMO_BASE + offset)] = {
+            'width': HANGUL_WIDTH, 'components': [(base_name(base), consonant_box)]}
+    vowel_boxes = {
+        'vertical': box_transform((0.3, 0.0, 0.74, 1.0)),
+        'horizontal': box_transform((0.0, 0.3, 1.0, 0.72)),
+        'mixed': box_transform((0.1, 0.0, 0.9, 1.0)),
+    }
+    for v, jamo in enumerate(MEDIALS):
+        code = COMPAT_JAMO_BASE + len(COMPAT_CONSONANTS) + v
+        glyphs[syllable_name(code)] = {
+            'width': HANGUL_WIDTH,
+            'components': [(base_name(medial_name(v)), vowel_boxes[vowel_type(jamo)])]}
+    return glyphs
+
+
+def create_hangul_glyphs(style, stroke=0):
+    """style ('round' / 'sharp') 한글 글리프 전체 (자모 + 단독 자모 + 완성형 음절)
+
+    stroke: 획 굵기 절반에 더할 값 (render 참고)
+    """
+    glyphs = create_jamo_glyphs(style, stroke)
+    glyphs.update(create_compat_jamo_glyphs())
+    glyphs.update(create_syllable_glyphs())
+    return glyphs
+
+
+def create_hangul_cmap():
+    """한글 글리프 이름 → 유니코드 (create_basic_cmap 과 같은 방향)"""
+    cmap = {}
+    for offset in range(len(COMPAT_CONSONANTS) + len(MEDIALS)):
+        cmap[syllable_name(COMPAT_JAMO_BASE + offset)] = COMPAT_JAMO_BASE + offset
+    for code in range(SYLLABLE_BASE, SYLLABLE_BASE + SYLLABLE_COUNT):
+        cmap[syllable_name(code)] = code
+    # 첫가끝 자모 U+1100~ → 위치별 기본 형태 (자모 조합 모드에만 있는 글리프)
+    for i in range(len(INITIALS)):
+        cmap[positional_name(initial_name(i), *DEFAULT_LAYOUT)] = 0x1100 + i
+    for v, jamo in enumerate(MEDIALS):
+        cmap[positional_name(medial_name(v), vowel_type(jamo), False)] = 0x1161 + v
+    for t in range(1, len(FINALS) + 1):
+        cmap[positional_final_name(t)] = 0x11A7 + t
+    return cmap
+
+
+# ============================================
+# 자모 조합 모드 (OpenType GSUB)
+# ============================================
+
+# precomposed: 음절마다 합성 글리프 / jamo: 위치별 자모 + GSUB 로 렌더링 시 조합
+HANGUL_MODES = ('precomposed', 'jamo')
+
+_KIND_SUFFIX = {'vertical': 'v', 'horizontal': 'h', 'mixed': 'm'}
+# 첫가끝 자모가 cmap 으로 처음 가리키는 초성 배치
+DEFAULT_LAYOUT = ('vertical', False)
+
+
+def check_mode(mode):
+    """한글 출력 방식 검증"""
+    if mode not in HANGUL_MODES:
+        raise ValueError(f"지원하지 않는 한글 출력 방식: {mode} "
+                         f"(가능: {', '.join(HANGUL_MODES)})")
+    return mode
+
+
+def _layout_suffix(kind, has_final):
+    return _KIND_SUFFIX[kind] + ('t' if has_final else '')
+
+
+def positional_name(base, kind, has_final):
+    """배치별 자모 글리프 이름 (uni1100.v, uni1161.ht …)"""
+    return f'{base}.{_layout_suffix(kind, has_final)}'
+
+
+def positional_final_name(t):
+    # 종성 영역은 모든 배치에서 같으므로 형태가 하나뿐
+    return f'{final_name(t)}.t'
+
+
+def _shifted(transform):
+    """폭 0 글리프용 - 앞 초성 글리프 위에 겹치도록 한 글자 폭만큼 왼쪽으로"""
+    xx, xy, yx, yy, dx, dy = transform
+    return (xx, xy, yx, yy, dx - HANGUL_WIDTH, dy)
+
+
+def create_positional_glyphs():
+    """위치별 자모 - 초성은 음절 폭을 갖고 중성/종성은 폭 0 으로 앞 초성 위에 겹침"""
+    transforms = {key: {role: box_transform(box) for role, box in layout.items()}
+                  for key, layout in LAYOUTS.items()}
+    glyphs = {}
+    for (kind, has_final), layout in transforms.items():
+        for i in range(len(INITIALS)):
+            glyphs[positional_name(initial_name(i), kind, has_final)] = {
+                'width': HANGUL_WIDTH,
+                'components': [(base_name(initial_name(i)), layout['initial'])]}
+    for v, jamo in enumerate(MEDIALS):
+        kind = vowel_type(jamo)
+        for has_final in (False, True):
+            glyphs[positional_name(medial_name(v), kind, has_final)] = {
+                'width': 0,
+                'components': [(base_name(medial_name(v)),
+                                _shifted(transforms[(kind, has_final)]['medial']))]}
+    final = _shifted(box_transform(_FINAL_BOX))
+    for t in range(1, len(FINALS) + 1):
+        glyphs[positional_final_name(t)] = {
+            'width': 0, 'components': [(base_name(final_name(t)), final)]}
+    return glyphs
+
+
+def jamo_mode_glyphs(glyphs):
+    """완성형 음절을 윤곽선 없는 자리표시 글리프로 바꾸고 위치별 자모를 추가
+
+    음절 글리프는 cmap 과 ccmp 분해의 입력으로만 쓰인다. 음절마다 분해 결과가 달라
+    글리프 하나씩은 있어야 하지만 윤곽선은 없고, 이름은 post format 3 으로 저장하지
+    않는다 (font_builder). 자리표시 글리프는 폭이 모두 같아 hmtx 끝부분 압축이
+    적용되도록 글리프 순서 맨 뒤에 둔다.
+    """
+    syllables = {syllable_name(code)
+                 for code in range(SYLLABLE_BASE, SYLLABLE_BASE + SYLLABLE_COUNT)}
+    result = {name: glyph for name, glyph in glyphs.items() if name not in syllables}
+    if len(result) == len(glyphs):
+        return glyphs
+    result.update(create_positional_glyphs())
+    placeholder = {'width': HANGUL_WIDTH, 'paths': []}
+    for code in range(SYLLABLE_BASE, SYLLABLE_BASE + SYLLABLE_COUNT):
+        result[syllable_name(code)] = placeholder
+    return result
+
+
+def _glyph_class(names):
+    return '[' + ' '.join(names) + ']'
+
+
+def syllable_decomposition():
+    """음절 → 위치별 (초성, 중성[, 종성]) 글리프 이름 (ccmp 다중 치환 규칙)"""
+    kinds = [vowel_type(jamo) for jamo in MEDIALS]
+    mapping = {}
+    for code in range(SYLLABLE_BASE, SYLLABLE_BASE + SYLLABLE_COUNT):
+        i, v, t = decompose(code)
+        parts = [positional_name(initial_name(i), kinds[v], t > 0),
+                 positional_name(medial_name(v), kinds[v], t > 0)]
+        if t:
+            parts.append(positional_final_name(t))
+        mapping[syllable_name(code)] = parts
+    return mapping
+
+
+def create_jamo_features():
+    """첫가끝 자모 입력용 GSUB (feaLib 문법)
+
+    ljmo : 초성을 뒤따르는 중성 종류와 종성 유무에 맞는 형태로 교체
+    vjmo : 종성이 뒤따르는 중성을 받침용 형태로 교체
+    종성 형태는 하나뿐이라 tjmo 는 필요 없음 (cmap 이 바로 위치별 종성을 가리킴)
+    """
+    kinds = [vowel_type(jamo) for jamo in MEDIALS]
+    lines = ['languagesystem DFLT dflt;', 'languagesystem hang dflt;', '']
+
+    # 첫가끝 자모 입력 - cmap 이 가리키는 기본 형태(세로 모음, 받침 없음)에서 출발
+    initials = [initial_name(i) for i in range(len(INITIALS))]
+    medials = [(medial_name(v), kinds[v]) for v in range(len(MEDIALS))]
+    default_initials = _glyph_class(positional_name(n, *DEFAULT_LAYOUT) for n in initials)
+    default_medials = _glyph_class(positional_name(n, k, False) for n, k in medials)
+    finals = _glyph_class(positional_final_name(t) for t in range(1, len(FINALS) + 1))
+
+    layouts = [key for key in LAYOUTS if key != DEFAULT_LAYOUT]
+    for key in layouts:
+        lookup = f'ljmo_{_layout_suffix(*key)}'
+        lines += [f'lookup {lookup} {{',
+                  f'    sub {default_initials} by '
+                  f'{_glyph_class(positional_name(n, *key) for n in initials)};',
+                  f'}} {lookup};']
+    lines += ['lookup vjmo_t {',
+              f'    sub {default_medials} by '
+              f'{_glyph_class(positional_name(n, k, True) for n, k in medials)};',
+              '} vjmo_t;', '']
+
+    lines.append('feature ljmo {')
+    # 종성이 있는 배치를 먼저 검사 (앞선 규칙이 맞으면 뒤 규칙은 건너뜀)
+    for kind, has_final in sorted(layouts, key=lambda key: not key[1]):
+        vowels = _glyph_class(positional_name(n, k, f) for n, k in medials
+                              if k == kind for f in (False, True))
+        context = f'{vowels} {finals}' if has_final else vowels
+        lines.append(f"    sub {default_initials}' "
+                     f"lookup ljmo_{_layout_suffix(kind, has_final)} {context};")
+    lines += ['} ljmo;', '',
+              'feature vjmo {',
+              f"    sub {default_medials}' lookup vjmo_t {finals};",
+              '} vjmo;']
+    return '\n'.join(lines) + '\n'
+
+
+def setup_jamo_gsub(font):
+    """자모 조합 모드 GSUB - ljmo/vjmo 는 feaLib 로 컴파일하고 음절 분해(ccmp)는 직접 추가
+
+    음절 분해 규칙 11,172개를 feaLib 로 넣으면 규칙을 하나 더할 때마다 기존 규칙
+    전체를 검사해 수십 초가 걸리므로 다중 치환 lookup 을 otlLib 로 한 번에 만든다.
+    """
+    addOpenTypeFeaturesFromString(font, create_jamo_features())
+    gsub = font['GSUB'].table
+
+    lookups = gsub.LookupList.Lookup
+    lookups.append(buildLookup([buildMultipleSubstSubtable(syllable_decomposition())]))
+    gsub.LookupList.LookupCount = len(lookups)
+
+    feature = otTables.Feature()
+    feature.FeatureParams = None
+    feature.LookupListIndex = [len(lookups) - 1]
+    feature.LookupCount = 1
+    record = otTables.FeatureRecord()
+    record.FeatureTag = 'ccmp'
+    record.Feature = feature
+
+    # FeatureList 는 태그 순이어야 하므로 끼워 넣은 자리 뒤의 기능 번호를 한 칸씩 민다
+    records = gsub.FeatureList.FeatureRecord
+    index = sum(1 for r in records if r.FeatureTag < record.FeatureTag)
+    records.insert(index, record)
+    gsub.FeatureList.FeatureCount = len(records)
+    for script in gsub.ScriptList.ScriptRecord:
+        langsyses = [script.Script.DefaultLangSys]
+        langsyses += [r.LangSys for r in script.Script.LangSysRecord]
+        for langsys in filter(None, langsyses):
+            langsys.FeatureIndex = sorted(
+                [index] + [i + (i >= index) for i in langsys.FeatureIndex])
+            langsys.FeatureCount = len(langsys.FeatureIndex)
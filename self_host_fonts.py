@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+자체 호스팅 @font-face 스타일시트 생성기
+- css/*.css 에서 실제로 쓰는 font-family / font-weight 를 읽고 fonts/ 의 TTF 와 연결
+- 폰트를 WOFF2(기본)로 변환해 내용 해시가 들어간 파일 이름으로 저장 (장기 캐시용)
+- OS/2 굵기/스타일로 @font-face 생성, 첫 화면에 보이는 패밀리는 <link rel=preload> 태그 출력
+- 가변 폰트(fvar wght 축, fonts/variable/)는 굵기 범위로 선언하고 범위 안의 정적 파일 대신 사용
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from fontTools import version as FONTTOOLS_VERSION
+from fontTools.ttLib import TTFont
+
+import font_export
+import variable_fonts
+from cli_options import positive_int
+
+FONT_DIR = 'fonts'
+CSS_FILES = [os.path.join('css', 'fonts.css'), os.path.join('css', 'style.css')]
+OUTPUT_DIR = os.path.join('fonts', 'web')
+STYLESHEET_NAME = 'font-face.css'
+PRELOAD_NAME = 'preload.html'
+
+# 첫 화면(갤러리 상단 카드)에 쓰이는 패밀리 수 - CSS 에 처음 나오는 순서 기준
+DEFAULT_PRELOAD = 2
+
+FORMAT_NAMES = {'ttf': 'truetype', 'woff': 'woff', 'woff2': 'woff2'}
+WEIGHT_KEYWORDS = {'normal': 400, 'bold': 700}
+# 상대 / 전역 키워드 - 부모 굵기를 알 수 없으므로 normal(400) 기준으로 풂
+# (bolder / lighter 는 CSS Fonts 의 상대 굵기 표에서 400 일 때 값)
+RELATIVE_WEIGHTS = {'bolder': 700, 'lighter': 100,
+                    'inherit': 400, 'initial': 400, 'unset': 400, 'revert': 400}
+
+_RULE_RE = re.compile(r'([^{}]*)\{([^{}]*)\}')
+_FAMILY_RE = re.compile(r'font-family\s*:\s*([^;]+)')
+_WEIGHT_RE = re.compile(r'font-weight\s*:\s*(\w+)')
+
+
+def _normalize(name):
+    return re.sub(r'[^0-9a-z]', '', name.lower())
+
+
+# ============================================
+# CSS 에서 사용 중인 폰트 수집
+# ============================================
+
+def css_weight(value):
+    """font-weight 값 → 숫자 굵기 (var() 등 알 수 없는 값이면 None)"""
+    value = value.lower()
+    weight = WEIGHT_KEYWORDS.get(value) or RELATIVE_WEIGHTS.get(value)
+    if weight is None and value.isdigit():
+        weight = int(value)
+    return weight
+
+
+def css_font_usage(css_paths):
+    """CSS 규칙에서 (패밀리, 굵기) 목록을 처음 나온 순서대로 반환
+
+    굵기를 알 수 없는 규칙(font-weight: var(--w) 등)은 건너뛴다.
+    """
+    usage = []
+    for css_path in css_paths:
+        with open(css_path, encoding='utf-8') as f:
+            css = re.sub(r'/\*.*?\*/', '', f.read(), flags=re.S)
+        for _, body in _RULE_RE.findall(css):
+            family = _FAMILY_RE.search(body)
+            if not family:
+                continue
+            # 대체 폰트 목록 중 첫 번째만 사용
+            name = family.group(1).split(',')[0].strip().strip('\'"')
+            weight = _WEIGHT_RE.search(body)
+            weight = css_weight(weight.group(1) if weight else 'normal')
+            if weight is None:
+                continue
+            if (name, weight) not in usage:
+                usage.append((name, weight))
+    return usage
+
+
+# ============================================
+# 폰트 파일 정보
+# ============================================
+
+def font_files(*dirs):
+    """디렉터리들의 TTF 경로 (가변 폰트는 fonts/ 가 아니라 variable_fonts.OUTPUT_DIR 에 있음)"""
+    return sorted(path for directory in dirs
+                  for path in glob.glob(os.path.join(directory, '*.ttf')))
+
+
+def read_font_info(font_path):
+    """@font-face 에 필요한 정보 (이름 후보, 굵기, 스타일)"""
+    font = TTFont(font_path, lazy=True)
+    name = font['name']
+    os2 = font['OS/2']
+    stem = os.path.splitext(os.path.basename(font_path))[0]
+    names = {stem.split('-')[0]}
+    for name_id in (16, 1):
+        value = name.getDebugName(name_id)
+        if value:
+            names.add(value)
+    info = {
+        'path': font_path,
+        'stem': stem,
+        'names': sorted(_normalize(n) for n in names),
+        'weight': os2.usWeightClass,
+        'weight_range': None,
+        'style': 'italic' if os2.fsSelection & 1 else 'normal',
+    }
+    if 'fvar' in font:
+        for axis in font['fvar'].axes:
+            if axis.axisTag == 'wght':
+                info['weight_range'] = (int(axis.minValue), int(axis.maxValue))
+    font.close()
+    return info
+
+
+def match_families(families, font_infos):
+    """CSS 패밀리 이름 → 폰트 파일 목록 (공백/대소문자 무시, 파일 이름도 비교)
+
+    'Nanum Pen Script' 처럼 이름 테이블('Nanum Pen')과 CSS 이름이 다른 경우가 있어
+    파일 이름(NanumPenScript-Regular)도 함께 비교한다.
+    """
+    matched = {}
+    for family in families:
+        key = _normalize(family)
+        fonts = [info for info in font_infos if key in info['names']]
+        # 가변 폰트 굵기 범위 안의 같은 스타일 정적 파일은 내려받을 필요가 없음
+        ranges = [(info['style'], info['weight_range']) for info in fonts
+                  if info['weight_range']]
+        fonts = [info for info in fonts if info['weight_range'] or not any(
+            style == info['style'] and low <= info['weight'] <= high
+            for style, (low, high) in ranges)]
+        matched[family] = sorted(fonts, key=lambda info: (info['weight'], info['style']))
+    return matched
+
+
+# ============================================
+# 해시 파일 생성 (워커 프로세스)
+# ============================================
+
+def export_font(font_path, output_dir, fmt, previous=None):
+    """폰트를 fmt 로 변환해 '<이름>.<해시>.<확장자>' 로 저장 (원본이 같으면 재사용)"""
+    started = time.perf_counter()
+    stem = os.path.splitext(os.path.basename(font_path))[0]
+    result = {'stem': stem, 'error': None, 'reused': False}
+    try:
+        with open(font_path, 'rb') as f:
+            data = f.read()
+        source_hash = hashlib.sha256(
+            data + f'{fmt}:{FONTTOOLS_VERSION}'.encode()).hexdigest()
+        if (previous and previous['source'] == source_hash
+                and os.path.exists(os.path.join(output_dir, previous['file']))):
+            result.update(previous, reused=True)
+        else:
+            out = font_export.convert(data, fmt)
+            file_name = f'{stem}.{hashlib.sha256(out).hexdigest()[:10]}.{fmt}'
+            with open(os.path.join(output_dir, file_name), 'wb') as f:
+                f.write(out)
+            result.update(source=source_hash, file=file_name, bytes=len(out))
+        result['source_bytes'] = len(data)
+    except Exception:
+        result['error'] = traceback.format_exc()
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def export_all(font_paths, output_dir, fmt, manifest, jobs=None):
+    """여러 폰트를 병렬 변환 - {파일 이름(stem): 결과}"""
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = []
+        for path in sorted(font_paths, key=os.path.getsize, reverse=True):
+            stem = os.path.splitext(os.path.basename(path))[0]
+            futures.append(executor.submit(export_font, path, output_dir, fmt,
+                                           manifest.get(stem)))
+        for future in as_completed(futures):
+            result = future.result()
+            results[result['stem']] = result
+    return results
+
+
+# ============================================
+# 스타일시트 / preload 태그
+# ============================================
+
+def _weight_value(info):
+    """font-weight 값 (가변 폰트는 '최소 최대' 범위)"""
+    if info['weight_range']:
+        return '{} {}'.format(*info['weight_range'])
+    return info['weight']
+
+
+def _weight_distance(info, weight):
+    if info['weight_range']:
+        low, high = info['weight_range']
+        return max(low - weight, 0, weight - high)
+    return abs(info['weight'] - weight)
+
+
+def build_stylesheet(matched, exported, fmt, display, url_prefix):
+    """패밀리별 @font-face 규칙"""
+    lines = ['/* self_host_fonts.py 로 생성 - 직접 수정하지 마세요 */', '']
+    for family, fonts in matched.items():
+        for info in fonts:
+            file_name = exported[info['stem']]['file']
+            lines.extend([
+                '@font-face {',
+                f"    font-family: '{family}';",
+                f"    font-style: {info['style']};",
+                f"    font-weight: {_weight_value(info)};",
+                f'    font-display: {display};',
+                f"    src: url('{url_prefix}{file_name}') format('{FORMAT_NAMES[fmt]}');",
+                '}',
+            ])
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def pick_font(fonts, weight):
+    """요청 굵기에 가장 가까운 파일 (브라우저의 굵기 선택과 비슷하게)"""
+    return min(fonts, key=lambda info: (info['style'] != 'normal',
+                                        _weight_distance(info, weight)))
+
+
+def build_preload_tags(usage, matched, exported, fmt, count, url_prefix):
+    """CSS 에 먼저 나오는 count 개 패밀리의 preload 태그 (패밀리별로 처음 쓰인 굵기)"""
+    tags = []
+    families = set()
+    for family, weight in usage:
+        if not matched.get(family) or family in families:
+            continue
+        if len(families) == count:
+            break
+        families.add(family)
+        info = pick_font(matched[family], weight)
+        href = f"{url_prefix}{exported[info['stem']]['file']}"
+        tags.append(f'<link rel="preload" href="{href}" as="font" '
+                    f'type="font/{fmt}" crossorigin>')
+    return tags
+
+
+def main():
+    parser = argparse.ArgumentParser(description='자체 호스팅 @font-face 스타일시트 생성')
+    parser.add_argument('--fonts-dir', default=FONT_DIR, help='원본 TTF 디렉터리')
+    parser.add_argument('--variable-dir', default=variable_fonts.OUTPUT_DIR,
+                        help='가변 폰트 디렉터리 (variable_fonts.py 출력, 없으면 건너뜀)')
+    parser.add_argument('--css', nargs='+', default=CSS_FILES,
+                        help='font-family 를 읽을 CSS 파일')
+    parser.add_argument('--output-dir', default=OUTPUT_DIR,
+                        help='해시 파일 이름 폰트와 스타일시트 출력 디렉터리')
+    parser.add_argument('--url-prefix',
+                        help='CSS/HTML 에 쓸 폰트 URL 접두사 (기본: 출력 디렉터리 기준 상대 경로)')
+    parser.add_argument('--format', default='woff2', choices=font_export.SUPPORTED_FORMATS,
+                        help='출력 형식 (기본: woff2)')
+    parser.add_argument('--display', default='swap',
+                        choices=['auto', 'block', 'swap', 'fallback', 'optional'],
+                        help='font-display 값')
+    parser.add_argument('--preload', type=int, default=DEFAULT_PRELOAD,
+                        help='preload 할 첫 화면 패밀리 수')
+    parser.add_argument('--all', action='store_true',
+                        help='CSS 에서 쓰지 않는 패밀리도 포함')
+    parser.add_argument('-j', '--jobs', type=positive_int, default=os.cpu_count(),
+                        help='동시에 변환할 폰트 수 (기본: CPU 코어 수)')
+    args = parser.parse_args()
+    fmt = font_export.check_formats([args.format])[0]
+
+    print("=" * 60)
+    print("  자체 호스팅 @font-face 생성")
+    print("=" * 60)
+    print()
+
+    usage = css_font_usage(args.css)
+    font_infos = [read_font_info(p) for p in font_files(args.fonts_dir, args.variable_dir)]
+    families = list(dict.fromkeys(family for family, _ in usage))
+    if args.all:
+        used = {_normalize(f) for f in families}
+        for info in font_infos:
+            if not used.intersection(info['names']):
+                family = TTFont(info['path'], lazy=True)['name'].getBestFamilyName()
+                families.append(family)
+                used.update(info['names'])
+    matched = match_families(families, font_infos)
+
+    for family, fonts in matched.items():
+        if not fonts:
+            print(f"⚠️  {family}: fonts/ 에 파일이 없어 건너뜀")
+            continue
+        missing = sorted(w for w in {w for f, w in usage if f == family}
+                         if all(_weight_distance(info, w) for info in fonts))
+        if missing:
+            print(f"⚠️  {family}: 굵기 {missing} 파일 없음 (가까운 굵기로 대체됨)")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    manifest_path = os.path.join(args.output_dir, 'manifest.json')
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+
+    font_paths = [info['path'] for fonts in matched.values() for info in fonts]
+    started = time.perf_counter()
+    exported = export_all(font_paths, args.output_dir, fmt, manifest, jobs=args.jobs)
+    failed = [r for r in exported.values() if r['error']]
+    for r in failed:
+        print(f"❌ {r['stem']}: 변환 실패")
+        print(r['error'])
+    if failed:
+        return 1
+
+    manifest = {stem: {k: r[k] for k in ('source', 'file', 'bytes')}
+                for stem, r in exported.items()}
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    # 더 이상 쓰지 않는 해시 파일 삭제
+    current = {r['file'] for r in manifest.values()}
+    for path in glob.glob(os.path.join(args.output_dir, f'*.{fmt}')):
+        if os.path.basename(path) not in current:
+            os.remove(path)
+
+    for stem, r in sorted(exported.items()):
+        state = '재사용' if r['reused'] else f"{r['seconds']:.1f}s"
+        print(f"✅ {stem:<28} {r['source_bytes'] / 1024:8,.0f}KB → "
+              f"{r['bytes'] / 1024:7,.0f}KB  {r['file']} ({state})")
+
+    matched = {family: fonts for family, fonts in matched.items() if fonts}
+    css_path = os.path.join(args.output_dir, STYLESHEET_NAME)
+    url_prefix = args.url_prefix if args.url_prefix is not None else ''
+    with open(css_path, 'w', encoding='utf-8') as f:
+        f.write(build_stylesheet(matched, exported, fmt, args.display, url_prefix))
+
+    # HTML 은 보통 사이트 루트에 있으므로 기본 접두사는 출력 디렉터리 경로
+    html_prefix = (args.url_prefix if args.url_prefix is not None
+                   else args.output_dir.replace(os.sep, '/').rstrip('/') + '/')
+    tags = build_preload_tags(usage, matched, exported, fmt, args.preload, html_prefix)
+    tags.append(f'<link rel="stylesheet" href="{html_prefix}{STYLESHEET_NAME}">')
+    preload_path = os.path.join(args.output_dir, PRELOAD_NAME)
+    with open(preload_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(tags) + '\n')
+
+    print()
+    print(f"📁 스타일시트 저장: {css_path}")
+    print(f"📁 <head> 에 넣을 태그: {preload_path}")
+    for tag in tags:
+        print(f"   {tag}")
+    print(f"🎉 {len(matched)}개 패밀리, {len(exported)}개 파일 "
+          f"({time.perf_counter() - started:.1f}s)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+unicode-range 분할 WOFF2 서브셋 파이프라인
+- fonts/ 의 TTF 를 자주 쓰는 글자 순서의 작은 WOFF2 조각(약 100개)으로 나누고
+  조각마다 unicode-range 를 단 @font-face 스타일시트를 생성
+- 브라우저는 페이지에 실제로 나온 글자가 든 조각만 내려받음 (Google Fonts 한국어 방식)
+- 패밀리별로 프로세스 풀에서 병렬 처리, 조각별 매니페스트로 바뀐 조각만 다시 생성
+"""
+
+import argparse
+import glob
+import hashlib
+import io
+import json
+import logging
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from fontTools import subset
+from fontTools import version as FONTTOOLS_VERSION
+from fontTools.ttLib import TTFont
+
+from cli_options import positive_int
+from font_cache import stable_hash
+
+# 서브셋 방식이 바뀌어 이전 조각을 쓸 수 없을 때 올린다
+SUBSET_VERSION = 1
+
+INPUT_DIR = 'fonts'
+OUTPUT_DIR = os.path.join('fonts', 'subset')
+CSS_NAME = 'fonts-subset.css'
+
+# 조각 하나에 넣을 최대 글자 수 (앞쪽 조각일수록 작게 - 자주 쓰는 글자만 받게)
+COMMON_HANGUL_SHARD = 100
+REST_HANGUL_SHARD = 150
+OTHER_SHARD = 400
+
+# Google Fonts 의 latin 조각과 같은 범위
+LATIN_RANGES = [
+    (0x0000, 0x00FF), (0x0131, 0x0131), (0x0152, 0x0153), (0x02BB, 0x02BC),
+    (0x02C6, 0x02C6), (0x02DA, 0x02DA), (0x02DC, 0x02DC), (0x2000, 0x206F),
+    (0x2074, 0x2074), (0x20AC, 0x20AC), (0x2122, 0x2122), (0x2191, 0x2191),
+    (0x2193, 0x2193), (0x2212, 0x2212), (0x2215, 0x2215), (0xFEFF, 0xFEFF),
+    (0xFFFD, 0xFFFD),
+]
+HANGUL_JAMO_RANGES = [
+    (0x1100, 0x11FF), (0x3130, 0x318F), (0xA960, 0xA97F), (0xD7B0, 0xD7FF),
+]
+CJK_SYMBOL_RANGES = [
+    (0x3000, 0x303F), (0x3200, 0x32FF), (0xFF00, 0xFFEF),
+]
+HANJA_RANGES = [
+    (0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAFF),
+]
+HANGUL_SYLLABLES = range(0xAC00, 0xD7A4)
+
+
+# ============================================
+# 조각 계획
+# ============================================
+
+def _expand(ranges):
+    return [cp for start, end in ranges for cp in range(start, end + 1)]
+
+
+def ks_x_1001_hangul():
+    """KS X 1001(EUC-KR) 완성형 2,350자 - 일상 글에 쓰이는 음절 대부분을 포함"""
+    syllables = []
+    for lead in range(0xB0, 0xC9):
+        for trail in range(0xA1, 0xFF):
+            try:
+                syllables.append(ord(bytes((lead, trail)).decode('euc-kr')))
+            except UnicodeDecodeError:
+                pass
+    return syllables
+
+
+def shard_groups():
+    """(조각 이름 접두사, 순서 있는 후보 코드포인트, 조각 크기) - 앞쪽일수록 자주 쓰임
+
+    한글 빈도표가 저장소에 없어서 KS X 1001 2,350자를 '자주 쓰는 음절' 로 보고
+    나머지 8,822자보다 작은 조각으로 먼저 나눈다.
+    """
+    common = ks_x_1001_hangul()
+    common_set = set(common)
+    rest = [cp for cp in HANGUL_SYLLABLES if cp not in common_set]
+    return [
+        ('latin', _expand(LATIN_RANGES), None),
+        ('hangul-jamo', _expand(HANGUL_JAMO_RANGES), None),
+        ('cjk-symbols', _expand(CJK_SYMBOL_RANGES), None),
+        ('hangul-common', common, COMMON_HANGUL_SHARD),
+        ('hangul', rest, REST_HANGUL_SHARD),
+        ('hanja', _expand(HANJA_RANGES), OTHER_SHARD),
+    ]
+
+
+def plan_shards(codepoints):
+    """폰트가 가진 코드포인트를 [(조각 이름, [코드포인트...]), ...] 로 분할"""
+    remaining = set(codepoints)
+    shards = []
+    for prefix, candidates, size in shard_groups():
+        chars = [cp for cp in candidates if cp in remaining]
+        remaining.difference_update(chars)
+        shards.extend(_chunk(prefix, chars, size))
+    # 어느 그룹에도 속하지 않는 글자 (기호, 다른 문자 체계 등)
+    shards.extend(_chunk('misc', sorted(remaining), OTHER_SHARD))
+    return shards
+
+
+def _chunk(prefix, chars, size):
+    if not chars:
+        return []
+    if size is None or len(chars) <= size:
+        return [(prefix, chars)]
+    # 마지막 조각이 너무 작지 않도록 고르게 나눔
+    count = -(-len(chars) // size)
+    step = -(-len(chars) // count)
+    return [(f'{prefix}-{i:02d}', chars[i * step:(i + 1) * step])
+            for i in range(count)]
+
+
+def format_unicode_range(codepoints):
+    """코드포인트 목록을 CSS unicode-range 값으로 (연속 구간은 U+AC00-AC63 형태)"""
+    parts = []
+    cps = sorted(codepoints)
+    i = 0
+    while i < len(cps):
+        j = i
+        while j + 1 < len(cps) and cps[j + 1] == cps[j] + 1:
+            j += 1
+        if i == j:
+            parts.append(f'U+{cps[i]:X}')
+        else:
+            parts.append(f'U+{cps[i]:X}-{cps[j]:X}')
+        i = j + 1
+    return ', '.join(parts)
+
+
+# ============================================
+# 패밀리 하나 처리 (워커 프로세스)
+# ============================================
+
+def font_info(font):
+    """@font-face 에 쓸 패밀리 이름 / 굵기 / 스타일"""
+    os2 = font['OS/2']
+    italic = bool(os2.fsSelection & 1)
+    return {
+        'family': font['name'].getBestFamilyName(),
+        'weight': os2.usWeightClass,
+        'style': 'italic' if italic else 'normal',
+    }
+
+
+def subset_shard(data, codepoints, output_path):
+    """원본 폰트 바이트에서 codepoints 만 남긴 WOFF2 조각 저장"""
+    font = TTFont(io.BytesIO(data), recalcTimestamp=False)
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.notdef_outline = True
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    tmp_path = f'{output_path}.{os.getpid()}.tmp'
+    subset.save_font(font, tmp_path, options)
+    font.close()
+    os.replace(tmp_path, output_path)
+    return os.path.getsize(output_path)
+
+
+def _load_manifest(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(path, manifest):
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def subset_family(font_path, output_dir, force=False):
+    """폰트 하나를 조각으로 나누고 결과(조각 목록, 생성/재사용 수)를 반환"""
+    logging.getLogger('fontTools').setLevel(logging.ERROR)
+    started = time.perf_counter()
+    stem = os.path.splitext(os.path.basename(font_path))[0]
+    family_dir = os.path.join(output_dir, stem)
+    result = {'font': stem, 'source_bytes': os.path.getsize(font_path),
+              'shards': [], 'built': 0, 'reused': 0, 'error': None}
+    try:
+        with open(font_path, 'rb') as f:
+            data = f.read()
+        source_hash = hashlib.sha256(data).hexdigest()
+        font = TTFont(io.BytesIO(data), lazy=True)
+        info = font_info(font)
+        result.update(info)
+        shards = plan_shards(font.getBestCmap())
+        font.close()
+
+        os.makedirs(family_dir, exist_ok=True)
+        manifest_path = os.path.join(family_dir, 'manifest.json')
+        old = {} if force else _load_manifest(manifest_path).get('shards', {})
+        # 스타일시트는 매니페스트로 만들므로 @font-face 정보도 함께 기록
+        manifest = dict(info, source=os.path.basename(font_path), shards={})
+
+        for name, codepoints in shards:
+            file_name = f'{stem}.{name}.woff2'
+            path = os.path.join(family_dir, file_name)
+            key = stable_hash({'version': SUBSET_VERSION, 'fonttools': FONTTOOLS_VERSION,
+                               'source': source_hash, 'codepoints': codepoints})
+            entry = old.get(file_name)
+            if (entry and entry['key'] == key and os.path.exists(path)
+                    and os.path.getsize(path) == entry['bytes']):
+                result['reused'] += 1
+            else:
+                entry = {'key': key, 'bytes': subset_shard(data, codepoints, path)}
+                result['built'] += 1
+            entry['unicode_range'] = format_unicode_range(codepoints)
+            manifest['shards'][file_name] = entry
+            # 조각마다 기록 - 중간에 멈춰도 끝난 조각은 다음 실행에서 재사용
+            _save_manifest(manifest_path, dict(manifest, shards=dict(old, **manifest['shards'])))
+            result['shards'].append((file_name, entry['unicode_range'], entry['bytes']))
+
+        _save_manifest(manifest_path, manifest)
+        # 계획에서 빠진 예전 조각 삭제
+        for path in glob.glob(os.path.join(family_dir, '*.woff2')):
+            if os.path.basename(path) not in manifest['shards']:
+                os.remove(path)
+    except Exception:
+        result['error'] = traceback.format_exc()
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+# ============================================
+# 스타일시트 / 실행
+# ============================================
+
+def load_families(output_dir):
+    """output_dir 아래 패밀리 매니페스트 전부 [(디렉터리 이름, 매니페스트), ...]
+
+    --only 로 일부만 다시 분할해도 스타일시트에 다른 패밀리가 남도록 이번 실행 결과가
+    아니라 매니페스트에서 읽는다. 폰트 정보가 없는 (예전 형식) 매니페스트는 건너뜀.
+    """
+    families = []
+    for path in sorted(glob.glob(os.path.join(output_dir, '*', 'manifest.json'))):
+        manifest = _load_manifest(path)
+        if manifest.get('shards') and 'family' in manifest:
+            families.append((os.path.basename(os.path.dirname(path)), manifest))
+    return families
+
+
+def write_stylesheet(css_path, output_dir):
+    """output_dir 의 모든 패밀리 조각으로 @font-face 규칙 생성 (url 은 CSS 파일 기준 상대 경로)"""
+    css_dir = os.path.dirname(os.path.abspath(css_path))
+    lines = ['/* subset_fonts.py 로 생성 - 직접 수정하지 마세요 */', '']
+    for stem, manifest in load_families(output_dir):
+        family_dir = os.path.join(output_dir, stem)
+        rel_dir = os.path.relpath(family_dir, css_dir)
+        lines.append(f"/* {stem} */")
+        for file_name, entry in manifest['shards'].items():
+            if not os.path.exists(os.path.join(family_dir, file_name)):
+                continue
+            url = f'{rel_dir}/{file_name}'.replace(os.sep, '/')
+            lines.extend([
+                '@font-face {',
+                f"    font-family: '{manifest['family']}';",
+                f"    font-style: {manifest['style']};",
+                f"    font-weight: {manifest['weight']};",
+                '    font-display: swap;',
+                f"    src: url('{url}') format('woff2');",
+                f"    unicode-range: {entry['unicode_range']};",
+                '}',
+            ])
+        lines.append('')
+    with open(css_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+
+
+def subset_all(font_paths, output_dir, jobs=None, force=False):
+    """여러 폰트를 병렬로 분할 (큰 폰트부터 시작해 마지막에 혼자 남는 작업을 줄임)"""
+    font_paths = sorted(font_paths, key=os.path.getsize, reverse=True)
+    if jobs == 1:
+        results = [subset_family(p, output_dir, force) for p in font_paths]
+    else:
+        results = []
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(subset_family, p, output_dir, force)
+                       for p in font_paths]
+            for future in as_completed(futures):
+                results.append(future.result())
+    results.sort(key=lambda r: r['font'])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='폰트를 unicode-range WOFF2 조각으로 분할')
+    parser.add_argument('--input-dir', default=INPUT_DIR, help='원본 TTF 디렉터리')
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help='조각 출력 디렉터리')
+    parser.add_argument('--css', help=f'스타일시트 경로 (기본: 출력 디렉터리/{CSS_NAME})')
+    parser.add_argument('--only', nargs='+', metavar='FONT',
+                        help='지정한 파일만 처리 (예: PoorStory-Regular)')
+    parser.add_argument('-j', '--jobs', type=positive_int, default=os.cpu_count(),
+                        help='동시에 처리할 폰트 수 (기본: CPU 코어 수)')
+    parser.add_argument('--force', action='store_true',
+                        help='매니페스트를 무시하고 모든 조각을 다시 생성')
+    args = parser.parse_args()
+
+    font_paths = sorted(glob.glob(os.path.join(args.input_dir, '*.ttf')))
+    if args.only:
+        font_paths = [p for p in font_paths
+                      if os.path.splitext(os.path.basename(p))[0] in args.only]
+    css_path = args.css or os.path.join(args.output_dir, CSS_NAME)
+
+    print("=" * 60)
+    print(f"  WOFF2 조각 분할 - {len(font_paths)}개 폰트, jobs={args.jobs}")
+    print("=" * 60)
+    print()
+
+    started = time.perf_counter()
+    os.makedirs(args.output_dir, exist_ok=True)
+    results = subset_all(font_paths, args.output_dir, jobs=args.jobs, force=args.force)
+    elapsed = time.perf_counter() - started
+
+    failed = [r for r in results if r['error']]
+    total_source = total_shards = 0
+    for r in results:
+        if r['error']:
+            print(f"❌ {r['font']}: 분할 실패")
+            print(r['error'])
+            continue
+        shard_bytes = sum(size for _, _, size in r['shards'])
+        total_source += r['source_bytes']
+        total_shards += shard_bytes
+        print(f"✅ {r['font']:<28} {len(r['shards']):>3}개 조각 "
+              f"(생성 {r['built']}, 재사용 {r['reused']})  "
+              f"{r['source_bytes'] / 1024:8,.0f}KB → {shard_bytes / 1024:7,.0f}KB  "
+              f"{r['seconds']:.1f}s")
+
+    write_stylesheet(css_path, args.output_dir)
+    print()
+    print(f"📁 스타일시트 저장: {css_path}")
+    if total_source:
+        print(f"🎉 {len(results) - len(failed)}/{len(results)}개 폰트 완료 - "
+              f"TTF {total_source / 1048576:.1f}MB → WOFF2 조각 합계 "
+              f"{total_shards / 1048576:.1f}MB ({elapsed:.1f}s)")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,134 @@
+"""
+pytest 공통 설정
+- 저장소 최상위 모듈(create_fonts, glyph_path …)을 그대로 import 하도록 경로 추가
+- 빌드 / 글리프 캐시는 세션 임시 디렉터리를 씀
+- outline_distance: 윤곽선 사이 거리 (단순화 / 정규화 허용 오차 검사용)
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from fontTools.pens.basePen import BasePen
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from glyph_path import compile_paths, draw_paths  # noqa: E402
+
+FONT_DIR = os.path.join(ROOT, 'fonts')
+
+# outline_distance 비교 여유 - 곡선을 꺾은선으로 펼친 오차와 정수 좌표 반올림
+EPSILON = 0.75
+
+# 점이 많은 자모 윤곽선은 JAMO_STEP 개마다 하나만 비교 (sample_outlines)
+JAMO_STEP = 5
+
+
+@pytest.fixture(scope='session')
+def geo_glyphs():
+    """GeoRound 글리프 dict (생성은 세션당 한 번, 테스트에서 고치지 말 것)"""
+    import create_fonts
+    return create_fonts.create_geometric_font()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def cache_dir(tmp_path_factory):
+    """빌드 / 글리프 / 메트릭 캐시를 세션 임시 디렉터리로 (저장소의 .font_cache 를 건드리지 않음)
+
+    모듈 범위 픽스처의 빌드도 테스트 함수보다 먼저 실행되므로 세션 범위여야 덮인다.
+    빈 캐시가 필요한 테스트는 각자 CACHE_DIR 을 새 디렉터리로 바꾼다.
+    """
+    import font_cache
+    directory = str(tmp_path_factory.mktemp('font_cache'))
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(font_cache, 'CACHE_DIR', directory)
+        yield directory
+
+
+@pytest.fixture(scope='session')
+def sample_outlines(geo_glyphs):
+    """GeoRound / BubblePop 의 윤곽선 있는 단순 글리프 {생성기:글리프: 경로}"""
+    import create_unique_fonts
+    bubble = create_unique_fonts.create_bubble_font()
+    result = {}
+    for prefix, glyphs in (('geo', geo_glyphs), ('bubble', bubble)):
+        jamo = 0
+        for name, glyph in glyphs.items():
+            if not glyph.get('paths') or not compile_paths(glyph['paths']).coords:
+                continue
+            if name.startswith('uni11'):        # U+1100 자모
+                jamo += 1
+                if jamo % JAMO_STEP != 1:
+                    continue
+            result[f'{prefix}:{name}'] = glyph['paths']
+    return result
+
+
+class _FlattenPen(BasePen):
+    """윤곽선을 꺾은선으로 펼침 (곡선은 SAMPLES 개 구간)"""
+
+    SAMPLES = 16
+
+    def __init__(self):
+        super().__init__(None)
+        self.lines = []
+
+    def _moveTo(self, pt):
+        self.lines.append([pt])
+
+    def _lineTo(self, pt):
+        self.lines[-1].append(pt)
+
+    def _qCurveToOne(self, pt1, pt2):
+        p0 = self.lines[-1][-1]
+        for t in np.linspace(0, 1, self.SAMPLES + 1)[1:]:
+            self.lines[-1].append(tuple((1 - t) ** 2 * np.array(p0) + 2 * (1 - t) * t *
+                                        np.array(pt1) + t * t * np.array(pt2)))
+
+    def _curveToOne(self, pt1, pt2, pt3):
+        p0 = self.lines[-1][-1]
+        for t in np.linspace(0, 1, self.SAMPLES + 1)[1:]:
+            self.lines[-1].append(tuple((1 - t) ** 3 * np.array(p0) +
+                                        3 * (1 - t) ** 2 * t * np.array(pt1) +
+                                        3 * (1 - t) * t * t * np.array(pt2) +
+                                        t ** 3 * np.array(pt3)))
+
+    def _closePath(self):
+        self.lines[-1].append(self.lines[-1][0])
+
+
+def _segments(paths):
+    pen = _FlattenPen()
+    draw_paths(pen, paths)
+    starts = [line[:-1] for line in pen.lines if len(line) > 1]
+    ends = [line[1:] for line in pen.lines if len(line) > 1]
+    return np.concatenate(starts).astype(float), np.concatenate(ends).astype(float)
+
+
+def outline_distance(paths, other, limit=16):
+    """paths 윤곽선 위의 점에서 other 윤곽선까지 거리의 최댓값 (단방향 하우스도르프 거리)
+
+    limit 이하면 정확한 값, limit 보다 멀면 limit 보다 큰 값 (가까운 선분만 비교해 빠르게).
+    """
+    a0, a1 = _segments(paths)
+    # 구간마다 4 단위 이하 간격으로 점을 찍음
+    steps = np.maximum(np.ceil(np.hypot(*(a1 - a0).T) / 4), 1).astype(int)
+    t = np.concatenate([np.arange(n) / n for n in steps])
+    points = np.repeat(a0, steps, axis=0) + t[:, None] * np.repeat(a1 - a0, steps, axis=0)
+    b0, b1 = _segments(other)
+    low, high = np.minimum(b0, b1), np.maximum(b0, b1)
+    worst = 0.0
+    for chunk in np.array_split(points, max(len(points) // 64, 1)):
+        # 경계 상자가 limit 안에 들어오는 선분만 - 나머지는 모든 점에서 limit 보다 멂
+        near = np.all((high >= chunk.min(axis=0) - limit) &
+                      (low <= chunk.max(axis=0) + limit), axis=1)
+        if not near.any():
+            return np.inf
+        s0, d = b0[near], (b1 - b0)[near]
+        length2 = np.maximum((d * d).sum(axis=1), 1e-12)
+        u = np.clip(((chunk[:, None, :] - s0) * d).sum(axis=2) / length2, 0, 1)
+        nearest = s0 + u[:, :, None] * d
+        distance = np.hypot(*(chunk[:, None, :] - nearest).transpose(2, 0, 1)).min(axis=1)
+        worst = max(worst, distance.max())
+    return worst
@@ -0,0 +1,30 @@
+"""build_all_fonts - 병렬 빌드 드라이버"""
+
+import os
+
+import pytest
+
+import build_all_fonts
+
+
+def test_unknown_only_style_rejected(monkeypatch, capsys):
+    """--only 에 없는 스타일 이름이 있으면 0개를 빌드하고 성공하는 대신 사용법 오류"""
+    monkeypatch.setattr('sys.argv', ['build_all_fonts.py', '--only', 'GeoRound', 'NoSuchFont'])
+    with pytest.raises(SystemExit) as exit_info:
+        build_all_fonts.main()
+    assert exit_info.value.code == 2
+    assert 'NoSuchFont' in capsys.readouterr().err
+
+
+def _crash(*args, **kwargs):
+    os._exit(1)
+
+
+def test_dead_worker_reported_as_build_error(monkeypatch):
+    """워커가 죽어도 (BrokenProcessPool) 예외 대신 스타일별 빌드 실패로 보고"""
+    monkeypatch.setattr(build_all_fonts, 'build_style', _crash)
+    styles = [('create_fonts', 'create_geometric_font', 'GeoRound', 'GeoRound', 'x.ttf'),
+              ('create_unique_fonts', 'create_sharp_font', 'SharpEdge', 'SharpEdge', 'y.ttf')]
+    results = build_all_fonts.build_all(styles, jobs=2)
+    assert [r['font'] for r in results] == ['GeoRound', 'SharpEdge']
+    assert all('BrokenProcessPool' in r['error'] for r in results)
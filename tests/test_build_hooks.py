@@ -0,0 +1,40 @@
+"""build_hooks - 단계 타이밍 / 프로파일러 정리"""
+
+import sys
+import tracemalloc
+
+import pytest
+
+import build_hooks
+import font_builder
+
+
+def test_stages_and_total_event():
+    events = []
+    with build_hooks.BuildTimer('Test', events.append, mode='') as timer:
+        timer.stage('a')
+        timer.stage('b')
+        timer.done(skipped=False)
+    assert [e['stage'] for e in events] == ['a', 'b', 'total']
+    assert events[-1]['skipped'] is False
+
+
+def test_tracemalloc_stopped_when_build_raises():
+    """build_font 가 예외로 끝나도 tracemalloc 을 끔 (워커 재사용 대비)"""
+    assert not tracemalloc.is_tracing()
+    with pytest.raises(Exception):
+        with build_hooks.BuildTimer('Test', mode='tracemalloc') as timer:
+            timer.stage('draw')
+            assert tracemalloc.is_tracing()
+            raise RuntimeError('빌드 실패')
+    assert not tracemalloc.is_tracing()
+
+
+def test_profiler_disabled_when_build_raises(monkeypatch, tmp_path):
+    monkeypatch.setattr(build_hooks, 'PROFILE_MODE', 'cprofile')
+    broken = {'.notdef': {'width': 500, 'components': [('missing', (1, 0, 0, 1, 0, 0))]}}
+    with pytest.raises(Exception):
+        font_builder.build_font(broken, 'Broken', 'Broken', str(tmp_path / 'Broken.ttf'),
+                                use_cache=False)
+    # 프로파일러가 남아 있으면 새 프로파일러를 켤 수 없음
+    assert sys.getprofile() is None
@@ -0,0 +1,31 @@
+"""cli_options - 명령행 공용 옵션 형식"""
+
+import argparse
+import importlib
+
+import pytest
+
+from cli_options import positive_int
+
+# -j/--jobs 를 받는 스크립트
+JOB_SCRIPTS = ['build_all_fonts', 'variable_fonts', 'subset_fonts', 'self_host_fonts',
+               'font_catalog', 'font_render']
+
+
+def test_positive_int():
+    assert positive_int('3') == 3
+    for value in ('0', '-2', 'x'):
+        with pytest.raises(argparse.ArgumentTypeError):
+            positive_int(value)
+
+
+@pytest.mark.parametrize('module_name', JOB_SCRIPTS)
+@pytest.mark.parametrize('jobs', ['0', '-1'])
+def test_jobs_must_be_positive(module_name, jobs, monkeypatch, capsys):
+    """프로세스 풀을 만들기 전에 사용법 오류로 끝남"""
+    module = importlib.import_module(module_name)
+    monkeypatch.setattr('sys.argv', [f'{module_name}.py', '-j', jobs])
+    with pytest.raises(SystemExit) as exit_info:
+        module.main()
+    assert exit_info.value.code == 2
+    assert '1 이상의 정수' in capsys.readouterr().err
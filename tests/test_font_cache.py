@@ -0,0 +1,91 @@
+"""font_cache - 빌드 캐시 / 글리프 컴파일 캐시"""
+
+import os
+
+import pytest
+
+import font_builder
+import font_cache
+from glyph_path import compile_paths, tt_glyph
+
+SQUARE = [[('moveTo', (0, 0)), ('lineTo', (400, 0)), ('lineTo', (400, 600)),
+           ('lineTo', (0, 600)), ('closePath',)]]
+GLYPHS = {'.notdef': {'width': 500, 'paths': []},
+          'space': {'width': 250, 'paths': []},
+          'A': {'width': 500, 'paths': SQUARE}}
+
+
+@pytest.fixture
+def fresh_cache(tmp_path, monkeypatch):
+    """테스트 하나만 쓰는 빈 캐시 디렉터리"""
+    monkeypatch.setattr(font_cache, 'CACHE_DIR', str(tmp_path / 'cache'))
+    return tmp_path
+
+
+def _build(path, glyphs=GLYPHS, **options):
+    return font_builder.build_font(glyphs, 'Test', 'Test', str(path), **options)
+
+
+def test_build_cache_hit_and_invalidation(fresh_cache):
+    path = fresh_cache / 'Test-Regular.ttf'
+    assert _build(path)
+    assert not _build(path)
+
+    # 글리프, 빌드 옵션, 출력 파일이 바뀌면 다시 빌드
+    changed = dict(GLYPHS, A=dict(GLYPHS['A'], width=520))
+    assert _build(path, changed)
+    assert _build(path, changed, dedupe=False)
+    assert not _build(path, changed, dedupe=False)
+    os.remove(path)
+    assert _build(path, changed, dedupe=False)
+    assert _build(path, changed, dedupe=False, use_cache=False)
+
+
+def test_build_cache_invalidated_by_builder_source(fresh_cache, monkeypatch):
+    """빌더 모듈 소스가 바뀌면 입력이 같아도 다시 빌드"""
+    path = fresh_cache / 'Test-Regular.ttf'
+    assert _build(path)
+    key = tuple(font_cache.BUILDER_MODULES)
+    monkeypatch.setitem(font_cache._SOURCE_HASHES, key, 'edited')
+    assert _build(path)
+    assert not _build(path)
+
+
+def test_source_hash_covers_every_module():
+    first = font_cache.source_hash(['glyph_path'])
+    assert font_cache.source_hash(['glyph_path']) == first
+    assert font_cache.source_hash(['glyph_path', 'hangul']) != first
+
+
+def test_glyph_cache_hit_and_invalidation(fresh_cache, monkeypatch):
+    cache = font_cache.GlyphCache()
+    assert cache.get(SQUARE) is None
+    glyph = tt_glyph(compile_paths(SQUARE))
+    cache.put(SQUARE, glyph)
+
+    cached = cache.get(SQUARE)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert list(cached.coordinates) == list(glyph.coordinates)
+    assert cached.endPtsOfContours == glyph.endPtsOfContours
+
+    # 글리프를 컴파일하는 glyph_path 가 바뀌면 이전 항목을 쓰지 않음
+    monkeypatch.setitem(font_cache._SOURCE_HASHES, ('glyph_path',), 'edited')
+    assert cache.get(SQUARE) is None
+
+
+def test_glyph_cache_evicts_least_recently_used(fresh_cache):
+    cache = font_cache.GlyphCache()
+    shapes = [[[('moveTo', (0, 0)), ('lineTo', (size, 0)), ('lineTo', (size, size)),
+                ('closePath',)]] for size in (100, 200, 300)]
+    for paths in shapes:
+        cache.put(paths, tt_glyph(compile_paths(paths)))
+    entries = [cache._entry_path(cache.key(paths)) for paths in shapes]
+    for i, entry in enumerate(entries):
+        os.utime(entry, (1000 + i, 1000 + i))
+    os.utime(entries[0], (2000, 2000))      # 가장 먼저 넣었지만 최근에 씀
+
+    cache.max_bytes = os.path.getsize(entries[0]) + os.path.getsize(entries[2])
+    cache.evict()
+    assert cache.get(shapes[0]) is not None
+    assert cache.get(shapes[1]) is None
+    assert cache.get(shapes[2]) is not None
@@ -0,0 +1,74 @@
+"""font_catalog - 증분 색인 갱신 / 조회"""
+
+import os
+import shutil
+
+import pytest
+
+import font_catalog
+from conftest import FONT_DIR
+
+FONTS = ('BubblePop-Regular.ttf', 'Sunflower-Light.ttf', 'Sunflower-Medium.ttf',
+         'Sunflower-Bold.ttf')
+
+
+@pytest.fixture
+def font_dir(tmp_path):
+    directory = tmp_path / 'fonts'
+    directory.mkdir()
+    for name in FONTS:
+        shutil.copy2(os.path.join(FONT_DIR, name), directory / name)
+    return directory
+
+
+def _update(font_dir):
+    return font_catalog.update_catalog(str(font_dir), str(font_dir / 'catalog.json'), jobs=1)
+
+
+def test_incremental_update(font_dir):
+    catalog, stats = _update(font_dir)
+    assert stats == {'reused': 0, 'rehashed': 0, 'read': 4, 'removed': 0}
+    assert list(catalog['fonts']) == sorted(FONTS)
+    assert font_catalog.load_catalog(str(font_dir / 'catalog.json')) == catalog
+
+    assert _update(font_dir)[1] == {'reused': 4, 'rehashed': 0, 'read': 0, 'removed': 0}
+
+    # mtime 만 바뀌면 해시로 확인하고 다시 읽지 않음
+    path = font_dir / 'Sunflower-Light.ttf'
+    os.utime(path, ns=(1, 1))
+    catalog, stats = _update(font_dir)
+    assert stats == {'reused': 3, 'rehashed': 1, 'read': 0, 'removed': 0}
+    assert catalog['fonts']['Sunflower-Light.ttf']['mtime_ns'] == 1
+
+    # 내용이 바뀌면 다시 읽음 (같은 이름에 다른 굵기 파일)
+    shutil.copy(os.path.join(FONT_DIR, 'Gaegu-Bold.ttf'), path)
+    os.utime(path, ns=(1, 1))
+    catalog, stats = _update(font_dir)
+    assert stats == {'reused': 3, 'rehashed': 0, 'read': 1, 'removed': 0}
+    entry = catalog['fonts']['Sunflower-Light.ttf']
+    assert (entry['family'], entry['weight']) == ('Gaegu', 700)
+    assert entry['sha256'] == font_catalog.file_hash(str(path))
+
+    os.remove(font_dir / 'BubblePop-Regular.ttf')
+    catalog, stats = _update(font_dir)
+    assert stats == {'reused': 3, 'rehashed': 0, 'read': 0, 'removed': 1}
+    assert 'BubblePop-Regular.ttf' not in catalog['fonts']
+
+
+def _files(entries):
+    return [entry['file'] for entry in entries]
+
+
+def test_find_fonts(font_dir):
+    catalog, _ = _update(font_dir)
+    entry = catalog['fonts']['BubblePop-Regular.ttf']
+    assert (entry['family'], entry['weight'], entry['style'], entry['outline']) == (
+        'BubblePop', 400, 'normal', 'glyf')
+    assert entry['hangul_syllables'] == 0
+
+    assert _files(font_catalog.find_fonts(catalog, 'sun flower', weight=650)) == [
+        'Sunflower-Bold.ttf', 'Sunflower-Medium.ttf', 'Sunflower-Light.ttf']
+    assert _files(font_catalog.find_fonts(catalog, 'BUBBLEPOP')) == ['BubblePop-Regular.ttf']
+    assert font_catalog.find_fonts(catalog, 'Sunflower', style='italic') == []
+    assert font_catalog.find_fonts(catalog, 'Missing') == []
+    assert len(font_catalog.find_fonts(catalog)) == len(FONTS)
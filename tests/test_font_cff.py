@@ -0,0 +1,49 @@
+"""font_cff - 미리 채운 경계 상자가 fontTools 재계산과 같은지 (CFF / CFF2)"""
+
+import io
+
+import pytest
+from fontTools.ttLib import TTFont
+
+import font_builder
+import hangul
+
+HEAD = ('xMin', 'yMin', 'xMax', 'yMax')
+HHEA = ('advanceWidthMax', 'minLeftSideBearing', 'minRightSideBearing', 'xMaxExtent')
+# 합성 글리프(음절)와 곡선 / 기울어진 획이 섞인 표본
+SYLLABLES = ('uniAC00', 'uniD55C', 'uniAD6C', 'uniD7A3', 'uniC6C5')
+
+
+@pytest.fixture(scope='module')
+def sample_glyphs(geo_glyphs):
+    """GeoRound 에서 한글을 몇 자만 남긴 글리프 dict (CFF 빌드 시간을 줄임)"""
+    syllables = {hangul.syllable_name(hangul.SYLLABLE_BASE + i)
+                 for i in range(hangul.SYLLABLE_COUNT)}
+    return {name: glyph for name, glyph in geo_glyphs.items()
+            if name not in syllables or name in SYLLABLES}
+
+
+def _table_values(font):
+    top = font['CFF2' if 'CFF2' in font else 'CFF '].cff.topDictIndex[0]
+    return ([getattr(font['head'], k) for k in HEAD],
+            {k: getattr(font['hhea'], k) for k in HHEA},
+            [round(v) for v in getattr(top, 'FontBBox', None) or [0, 0, 0, 0]])
+
+
+@pytest.mark.parametrize('outline', ['cff', 'cff2'])
+def test_set_bounds_matches_recalc(sample_glyphs, tmp_path, outline):
+    path = tmp_path / 'Test-Regular.otf'
+    font_builder.build_font(sample_glyphs, 'Test', 'Test', str(path), use_cache=False,
+                            outline=outline, subroutinize=False)
+    font = TTFont(str(path))
+    stored = _table_values(font)
+
+    # 다시 읽은 테이블을 재계산을 켠 채로 저장하면 fontTools 가 CharString 을 실행해 새로 구함
+    font.ensureDecompiled()
+    data = io.BytesIO()
+    font.save(data)
+    recalculated = _table_values(TTFont(io.BytesIO(data.getvalue())))
+    if outline == 'cff2':
+        # CFF2 의 TopDict 에는 FontBBox 가 없음
+        assert stored[2] == recalculated[2] == [0, 0, 0, 0]
+    assert stored == recalculated
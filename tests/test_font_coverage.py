@@ -0,0 +1,41 @@
+"""font_coverage - 블록 비트셋 인코딩"""
+
+import json
+
+import pytest
+
+import font_coverage
+
+HANGUL = range(0xAC00, 0xD7A4)
+
+
+@pytest.mark.parametrize('codepoints', [
+    [],
+    [0],
+    list(range(0x20, 0x7F)),                        # 일부만 찬 블록 하나
+    list(range(0x100, 0x200)),                      # 꽉 찬 블록 하나
+    list(HANGUL),                                   # 꽉 찬 블록 + 양 끝 일부 블록
+    [0x41, 0x1F600, 0x10FFFF],                      # 멀리 떨어진 블록, 마지막 코드포인트
+])
+def test_coverage_round_trip(codepoints):
+    coverage = json.loads(json.dumps(font_coverage.encode_coverage(codepoints)))
+    value = font_coverage.decode_coverage(coverage)
+    assert value == font_coverage.bitset(codepoints)
+    assert list(font_coverage.iter_bits(value)) == sorted(codepoints)
+
+
+def test_coverage_blocks():
+    coverage = font_coverage.encode_coverage(HANGUL)
+    # U+AC00 ~ U+D6FF 는 꽉 찬 블록, U+D700 ~ U+D7A3 는 일부만 참
+    assert coverage['full'] == list(range(0xAC, 0xD7))
+    assert list(coverage['partial']) == ['215']
+    assert font_coverage.encode_coverage([]) == {'full': [], 'partial': {}}
+
+    # 마지막 블록 비트맵은 뒤쪽 0 바이트 없이 저장 (U+41, U+42 → 9번째 바이트 0x06)
+    partial = font_coverage.encode_coverage([0x41, 0x42])['partial']
+    assert partial == {'0': '00' * 8 + '06'}
+    assert font_coverage.encode_coverage([0x41, 0x142])['partial']['0'] == '00' * 8 + '02' + '00' * 23
+
+
+def test_text_codepoints():
+    assert font_coverage.text_codepoints('가\n가 A\t') == {0xAC00, 0x20, 0x41}
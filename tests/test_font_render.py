@@ -0,0 +1,53 @@
+"""font_render - 스캔라인 래스터라이저"""
+
+import numpy as np
+import pytest
+
+from font_render import rasterize
+
+
+def _square(x0, y0, x1, y1, clockwise=False):
+    points = [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+    if clockwise:
+        points.reverse()
+    return [p + q for p, q in zip(points, points[1:] + points[:1])]
+
+
+def test_pixel_aligned_square():
+    coverage = rasterize(_square(1, 1, 3, 3), 4, 4)
+    expected = np.zeros((4, 4))
+    expected[1:3, 1:3] = 1
+    assert coverage.dtype == np.float32
+    np.testing.assert_allclose(coverage, expected, atol=1e-6)
+    # 방향을 뒤집어도 같은 결과 (감김 수의 절댓값)
+    np.testing.assert_allclose(rasterize(_square(1, 1, 3, 3, clockwise=True), 4, 4), expected,
+                               atol=1e-6)
+
+
+def test_unit_square_partial_coverage():
+    """반 픽셀 어긋난 단위 정사각형은 네 픽셀에 1/4 씩 (합은 넓이 1)"""
+    coverage = rasterize(_square(0.5, 0.5, 1.5, 1.5), 3, 3)
+    expected = np.zeros((3, 3))
+    expected[0:2, 0:2] = 0.25
+    np.testing.assert_allclose(coverage, expected, atol=1e-6)
+    assert coverage.sum() == pytest.approx(1.0)
+
+
+def test_nonzero_winding():
+    # 같은 방향으로 겹친 윤곽선은 채워지고 (even-odd 였다면 구멍), 반대 방향은 구멍
+    overlap = rasterize(_square(0, 0, 4, 4) + _square(1, 1, 3, 3), 4, 4)
+    np.testing.assert_allclose(overlap, np.ones((4, 4)), atol=1e-6)
+
+    hole = rasterize(_square(0, 0, 4, 4) + _square(1, 1, 3, 3, clockwise=True), 4, 4)
+    expected = np.ones((4, 4))
+    expected[1:3, 1:3] = 0
+    np.testing.assert_allclose(hole, expected, atol=1e-6)
+
+
+def test_clipped_and_empty():
+    assert not rasterize([], 3, 2).any()
+    # 캔버스 밖으로 나간 부분은 잘림
+    coverage = rasterize(_square(-2, -2, 1, 1), 3, 3)
+    expected = np.zeros((3, 3))
+    expected[0, 0] = 1
+    np.testing.assert_allclose(coverage, expected, atol=1e-6)
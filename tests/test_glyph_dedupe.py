@@ -0,0 +1,81 @@
+"""glyph_dedupe - 반복 윤곽선을 부품 글리프 참조로"""
+
+import pytest
+from fontTools.pens.areaPen import AreaPen
+from fontTools.pens.boundsPen import BoundsPen
+from fontTools.ttLib import TTFont
+
+import font_builder
+import glyph_dedupe
+import glyph_metrics
+import hangul
+
+
+def _build(glyphs, path, dedupe):
+    font_builder.build_font(glyphs, 'GeoRound', 'GeoRound', str(path),
+                            use_cache=False, dedupe=dedupe)
+    return TTFont(str(path))
+
+
+@pytest.fixture(scope='module')
+def fonts(geo_glyphs, tmp_path_factory):
+    """(중복 제거 끔, 켬) GeoRound 빌드"""
+    directory = tmp_path_factory.mktemp('dedupe')
+    return (_build(geo_glyphs, directory / 'plain.ttf', dedupe=False),
+            _build(geo_glyphs, directory / 'deduped.ttf', dedupe=True))
+
+
+def _outline(glyph_set, name):
+    """합성 글리프를 풀어 그린 (넓이, 경계 상자)"""
+    area = AreaPen(glyph_set)
+    bounds = BoundsPen(glyph_set)
+    glyph_set[name].draw(area)
+    glyph_set[name].draw(bounds)
+    return area.value, bounds.bounds
+
+
+def test_parts_appended_after_original_glyphs(geo_glyphs):
+    deduped = glyph_dedupe.dedupe_glyphs(geo_glyphs)
+    added = glyph_dedupe.added_glyphs(deduped)
+    assert added
+    assert list(deduped)[:len(geo_glyphs)] == list(geo_glyphs)
+    assert list(deduped)[len(geo_glyphs):] == added
+
+
+def test_outlines_unchanged(geo_glyphs, fonts):
+    """부품 참조로 바꾼 글리프도 풀어 그리면 넓이 / 경계 상자 / 폭이 원래와 같음"""
+    plain, deduped = fonts
+    simple = [name for name, glyph in geo_glyphs.items() if 'paths' in glyph]
+    syllables = [hangul.syllable_name(code) for code in range(
+        hangul.SYLLABLE_BASE, hangul.SYLLABLE_BASE + hangul.SYLLABLE_COUNT, 97)]
+    changed = [name for name in simple if deduped['glyf'][name].isComposite()]
+    assert changed
+    plain_set, deduped_set = plain.getGlyphSet(), deduped.getGlyphSet()
+    for name in simple + syllables:
+        area, bounds = _outline(deduped_set, name)
+        expected_area, expected_bounds = _outline(plain_set, name)
+        assert area == pytest.approx(expected_area), name
+        assert bounds == expected_bounds, name
+        assert deduped['hmtx'][name] == plain['hmtx'][name], name
+        a, b = plain['glyf'][name], deduped['glyf'][name]
+        assert [getattr(b, k, 0) for k in ('xMin', 'yMin', 'xMax', 'yMax')] == \
+            [getattr(a, k, 0) for k in ('xMin', 'yMin', 'xMax', 'yMax')], name
+    assert plain.getBestCmap() == deduped.getBestCmap()
+
+
+def test_parts_excluded_from_avg_char_width(fonts):
+    plain, deduped = fonts
+    assert len(deduped.getGlyphOrder()) > len(plain.getGlyphOrder())
+    assert deduped['OS/2'].xAvgCharWidth == plain['OS/2'].xAvgCharWidth
+
+
+def test_measure_glyphs_exclude_average():
+    square = [[('moveTo', (0, 0)), ('lineTo', (100, 0)), ('lineTo', (100, 100)),
+              ('lineTo', (0, 100)), ('closePath',)]]
+    glyphs = {'.notdef': {'width': 500, 'paths': []},
+              'a': {'width': 500, 'paths': square},
+              '_part1': {'width': 2000, 'paths': square}}
+    helpers = glyph_dedupe.added_glyphs(glyphs)
+    assert helpers == ['_part1']
+    assert glyph_metrics.measure_glyphs(glyphs).avg_char_width == 1000
+    assert glyph_metrics.measure_glyphs(glyphs, None, helpers).avg_char_width == 500
@@ -0,0 +1,65 @@
+"""glyph_metrics - 미리 계산한 경계 상자 / 폰트 메트릭이 fontTools 재계산과 같은지"""
+
+import pytest
+from fontTools.ttLib import TTFont
+
+import create_unique_fonts
+import font_builder
+import glyph_transform
+
+BOUNDS = ('xMin', 'yMin', 'xMax', 'yMax')
+HHEA = ('advanceWidthMax', 'minLeftSideBearing', 'minRightSideBearing', 'xMaxExtent')
+MAXP = ('numGlyphs', 'maxPoints', 'maxContours', 'maxCompositePoints',
+        'maxCompositeContours', 'maxComponentElements', 'maxComponentDepth')
+
+# 합성 글리프는 fontTools 재계산이 느려 COMPOSITE_STEP 개마다 하나씩 비교
+COMPOSITE_STEP = 29
+
+
+@pytest.fixture(scope='module', params=['geo', 'bubble', 'derived'])
+def font(request, geo_glyphs, tmp_path_factory):
+    if request.param == 'geo':
+        glyphs = geo_glyphs
+    elif request.param == 'bubble':
+        glyphs = create_unique_fonts.create_bubble_font()
+    else:
+        # 기울임 + 획 굵기 변환 - 합성 음절의 변환 행렬에 기울기가 들어감
+        outlines = glyph_transform.OutlineArray.from_glyphs(geo_glyphs)
+        glyphs = glyph_transform.derive(outlines, slant_degrees=12, stroke=16)
+    path = tmp_path_factory.mktemp('metrics') / f'{request.param}.ttf'
+    font_builder.build_font(glyphs, 'Test', 'Test', str(path), use_cache=False)
+    return TTFont(str(path))
+
+
+def test_glyph_bounds_match_recalc(font):
+    glyf = font['glyf']
+    hmtx = font['hmtx']
+    composites = 0
+    for name in font.getGlyphOrder():
+        glyph = glyf[name]
+        if not glyph.numberOfContours:
+            continue
+        if glyph.isComposite():
+            composites += 1
+            if composites % COMPOSITE_STEP != 1:
+                continue
+        stored = [getattr(glyph, k) for k in BOUNDS]
+        glyph.recalcBounds(glyf)
+        assert stored == [getattr(glyph, k) for k in BOUNDS], name
+        assert hmtx[name][1] == glyph.xMin, name
+
+
+def test_font_metrics_match_recalc(font):
+    glyf = font['glyf']
+    boxes = [[getattr(glyf[name], k) for k in BOUNDS]
+             for name in font.getGlyphOrder() if glyf[name].numberOfContours]
+    head = font['head']
+    assert [head.xMin, head.yMin, head.xMax, head.yMax] == [
+        min(b[0] for b in boxes), min(b[1] for b in boxes),
+        max(b[2] for b in boxes), max(b[3] for b in boxes)]
+
+    for tag, fields in (('hhea', HHEA), ('maxp', MAXP)):
+        table = font[tag]
+        stored = {k: getattr(table, k) for k in fields}
+        table.recalc(font)
+        assert stored == {k: getattr(table, k) for k in fields}, tag
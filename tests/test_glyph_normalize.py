@@ -0,0 +1,54 @@
+"""glyph_normalize - 격자 맞춤 / 윤곽선 정규화 / 글리프 순서"""
+
+import math
+
+import pytest
+
+import glyph_normalize
+import hangul
+from conftest import EPSILON, outline_distance
+from glyph_path import compile_paths
+
+
+def test_normalize_contours_keeps_outline(sample_outlines):
+    """방향 / 시작점 정규화는 모양을 바꾸지 않음"""
+    for name, paths in sample_outlines.items():
+        normalized = glyph_normalize.normalize_path(paths, grid=0, contours=True)
+        assert normalized.ops.count(0) == compile_paths(paths).ops.count(0), name
+        if normalized == compile_paths(paths):
+            continue
+        assert outline_distance(normalized, paths) <= EPSILON, name
+        assert outline_distance(paths, normalized) <= EPSILON, name
+
+
+@pytest.mark.parametrize('grid', [2, 8])
+def test_grid_snap_within_tolerance(sample_outlines, grid):
+    """모든 좌표가 격자 위에 있고 점은 축마다 grid 이내로만 움직임"""
+    for name, paths in sample_outlines.items():
+        snapped = glyph_normalize.normalize_path(paths, grid=grid, contours=True)
+        assert all(v % grid == 0 for v in snapped.coords), name
+        assert outline_distance(snapped, paths) <= grid * math.sqrt(2) + EPSILON, name
+
+
+@pytest.mark.parametrize('order', glyph_normalize.GLYPH_ORDERS)
+def test_compression_order_is_permutation(geo_glyphs, order):
+    """.notdef 는 맨 앞에 남고 글리프는 빠지거나 늘지 않음 (음절은 맨 뒤에 정렬)"""
+    glyph_order = ['.notdef'] + [name for name in geo_glyphs if name != '.notdef']
+    cmap = {code: name for name, code in hangul.create_hangul_cmap().items()
+            if name in geo_glyphs}
+    result = glyph_normalize.compression_order(glyph_order, cmap, order)
+    assert result[0] == '.notdef'
+    assert sorted(result) == sorted(glyph_order)
+    if order == 'source':
+        assert result == glyph_order
+        return
+
+    codes = {name: code for code, name in cmap.items()
+             if hangul.SYLLABLE_BASE <= code < hangul.SYLLABLE_BASE + hangul.SYLLABLE_COUNT}
+    tail = result[-len(codes):]
+    assert set(tail) == set(codes)
+    keys = [hangul.decompose(codes[name]) for name in tail]
+    if order == 'initial':
+        assert keys == sorted(keys)
+    else:
+        assert keys == sorted(keys, key=lambda k: (k[1], k[2], k[0]))
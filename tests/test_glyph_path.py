@@ -0,0 +1,79 @@
+"""glyph_path - 배열 기반 경로 / glyf 글리프 생성"""
+
+import pickle
+
+import pytest
+from fontTools.pens.recordingPen import RecordingPen
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+import create_unique_fonts
+from glyph_path import (GlyphPath, build_contour, compile_paths, contour_lengths,
+                        contour_nodes, draw_paths, tt_glyph)
+
+
+@pytest.fixture(scope='module')
+def all_paths(geo_glyphs):
+    """GeoRound / BubblePop 의 단순 글리프 경로 {생성기:글리프: 경로}"""
+    bubble = create_unique_fonts.create_bubble_font()
+    paths = {}
+    for prefix, glyphs in (('geo', geo_glyphs), ('bubble', bubble)):
+        for name, glyph in glyphs.items():
+            if glyph.get('paths'):
+                paths[f'{prefix}:{name}'] = glyph['paths']
+    return paths
+
+
+def _recording(paths):
+    pen = RecordingPen()
+    draw_paths(pen, paths)
+    return pen.value
+
+
+def test_round_trip(all_paths):
+    for name, paths in all_paths.items():
+        compiled = compile_paths(paths)
+        assert compile_paths(compiled) is compiled
+        assert GlyphPath.from_paths(compiled.to_paths()) == compiled, name
+        assert pickle.loads(pickle.dumps(compiled)) == compiled, name
+
+
+def test_draw_matches_tuple_paths(all_paths):
+    """버퍼 재생과 튜플 경로 직접 그리기가 같은 펜 호출을 만듦 (정수 좌표 기준)"""
+    for name, paths in all_paths.items():
+        compiled = compile_paths(paths)
+        assert _recording(compiled) == _recording(compiled.to_paths()), name
+
+
+def test_tt_glyph_matches_tt_glyph_pen(all_paths):
+    for name, paths in all_paths.items():
+        compiled = compile_paths(paths)
+        pen = TTGlyphPen(None)
+        compiled.draw(pen)
+        expected = pen.glyph()
+        glyph = tt_glyph(compiled)
+        assert glyph.numberOfContours == expected.numberOfContours, name
+        if expected.numberOfContours:
+            assert list(glyph.coordinates) == list(expected.coordinates), name
+            assert list(glyph.flags) == list(expected.flags), name
+            assert glyph.endPtsOfContours == expected.endPtsOfContours, name
+        assert glyph.compile(None) == expected.compile(None), name
+
+
+def test_contours_and_lengths(all_paths):
+    for name, paths in all_paths.items():
+        compiled = compile_paths(paths)
+        contours = compiled.contours()
+        assert GlyphPath.join(contours) == compiled, name
+        assert contour_lengths(compiled.ops) == [len(c.coords) // 2 for c in contours], name
+
+
+def test_nodes_round_trip(all_paths):
+    """노드 목록으로 풀었다 다시 만들어도 같은 모양 (시작점과 closePath 직선만 정리)"""
+    for name, paths in all_paths.items():
+        for contour in compile_paths(paths).contours():
+            nodes = contour_nodes(contour)
+            if nodes is None or not any(on for _, on in nodes):
+                continue
+            rebuilt = build_contour(nodes)
+            assert contour_nodes(rebuilt) is not None, name
+            assert sorted(contour_nodes(rebuilt)) == sorted(nodes), name
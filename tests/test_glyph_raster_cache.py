@@ -0,0 +1,107 @@
+"""glyph_raster_cache - 프로세스 안 LRU 와 공유 메모리 캐시"""
+
+import numpy as np
+import pytest
+
+from glyph_raster_cache import (SLOT_CLASSES, RasterCache, SharedRasterCache,
+                                _ENTRY_OVERHEAD, quantize_size)
+
+
+def _entry(height, width, value=7):
+    return np.full((height, width), value, dtype=np.uint8), 1, -height
+
+
+def _key(gid, size=96):
+    return (12345, gid, size, 0)
+
+
+def test_quantize_size():
+    assert quantize_size(12.1) == (48, 12.0)
+    assert quantize_size(12.13) == (49, 12.25)
+
+
+def test_local_lru_evicts_oldest_by_bytes():
+    cache = RasterCache(max_bytes=3 * (100 + _ENTRY_OVERHEAD))
+    for gid in range(3):
+        cache.put(_key(gid), _entry(10, 10))
+    assert cache.get(_key(0)) is not None      # 0 을 최근으로
+    cache.put(_key(3), _entry(10, 10))
+    assert cache.get(_key(1)) is None           # 가장 오래 안 쓴 1 이 빠짐
+    assert cache.get(_key(0)) is not None
+    stats = cache.stats()
+    assert stats['evictions'] == 1
+    assert stats['entries'] == 3
+    assert stats['bytes'] <= stats['max_bytes']
+    assert stats['hits'] == 2 and stats['misses'] == 1
+
+
+def test_local_put_same_key_replaces():
+    cache = RasterCache(max_bytes=10_000)
+    cache.put(_key(0), _entry(10, 10))
+    cache.put(_key(0), _entry(20, 20))
+    assert len(cache) == 1
+    assert cache.stats()['bytes'] == 400 + _ENTRY_OVERHEAD
+    assert cache.get(_key(0))[0].shape == (20, 20)
+
+
+@pytest.fixture
+def shared():
+    cache = SharedRasterCache.create(max_bytes=len(SLOT_CLASSES) * 4096)
+    yield cache
+    cache.close()
+
+
+def test_shared_round_trip_and_attach(shared):
+    bitmap, left, top = _entry(9, 13, value=200)
+    shared.put(_key(1), (bitmap, left, top))
+    got = shared.get(_key(1))
+    assert np.array_equal(got[0], bitmap) and got[1:] == (left, top)
+    # 다른 프로세스처럼 spec 으로 연결해도 같은 항목을 봄
+    other = SharedRasterCache.attach(shared.spec)
+    try:
+        assert np.array_equal(other.get(_key(1))[0], bitmap)
+    finally:
+        other.close()
+    assert shared.stats()['hits'] == 2
+
+
+def test_shared_put_same_key_reuses_row(shared):
+    """여러 워커가 같은 키를 동시에 놓쳐 저장해도 항목은 하나"""
+    shared.put(_key(1), _entry(10, 10))
+    shared.put(_key(1), _entry(30, 30))         # 다른 크기 등급으로 옮겨짐
+    stats = shared.stats()
+    assert stats['entries'] == 1
+    assert stats['bytes'] == 900
+    assert stats['evictions'] == 0
+    assert shared.get(_key(1))[0].shape == (30, 30)
+
+
+def test_shared_small_bitmaps_use_small_slots(shared):
+    """작은 비트맵은 작은 칸에 저장되어 큰 칸 하나 크기만큼 여러 개 들어감"""
+    count = 4096 // SLOT_CLASSES[0]
+    for gid in range(count):
+        shared.put(_key(gid), _entry(10, 20))
+    stats = shared.stats()
+    assert stats['entries'] == count and stats['evictions'] == 0
+    assert all(shared.get(_key(gid)) is not None for gid in range(count))
+
+
+def test_shared_evicts_least_recently_used_in_class(shared):
+    """2KB 등급은 칸 2개 - 셋째 비트맵이 가장 오래 안 쓴 칸을 차지"""
+    assert 2048 in SLOT_CLASSES
+    entry = _entry(40, 50)                      # 2000 바이트 → 2KB 등급
+    shared.put(_key(0), entry)
+    shared.put(_key(1), entry)
+    assert shared.get(_key(0)) is not None
+    shared.put(_key(2), entry)
+    assert shared.get(_key(1)) is None
+    assert shared.get(_key(0)) is not None and shared.get(_key(2)) is not None
+    stats = shared.stats()
+    assert stats['evictions'] == 1 and stats['entries'] == 2
+
+
+def test_shared_oversize_not_stored(shared):
+    shared.put(_key(1), _entry(200, 200))
+    stats = shared.stats()
+    assert stats['oversize'] == 1 and stats['entries'] == 0
+    assert shared.get(_key(1)) is None
@@ -0,0 +1,24 @@
+"""glyph_simplify - 허용 오차 안에서 점 줄이기"""
+
+import pytest
+
+import glyph_simplify
+from conftest import EPSILON, outline_distance
+from glyph_path import compile_paths
+
+
+@pytest.mark.parametrize('tolerance', [0, 4])
+def test_simplify_within_tolerance(sample_outlines, tolerance):
+    before = after = 0
+    for name, paths in sample_outlines.items():
+        simplified = glyph_simplify.simplify_path(paths, tolerance)
+        points = glyph_simplify.glyf_points(simplified)
+        assert points <= glyph_simplify.glyf_points(paths), name
+        before += glyph_simplify.glyf_points(paths)
+        after += points
+        if simplified == compile_paths(paths):
+            continue
+        assert outline_distance(simplified, paths) <= tolerance + EPSILON, name
+        assert outline_distance(paths, simplified) <= tolerance + EPSILON, name
+    if tolerance:
+        assert after < before
@@ -0,0 +1,58 @@
+"""glyph_transform - 파생 스타일 변환"""
+
+import numpy as np
+
+import glyph_transform
+import hangul
+from glyph_metrics import measure_glyphs
+
+STROKE = 16
+
+
+def _growth(before, after, name, shift=0):
+    """글리프 경계 상자의 변마다 늘어난 양 (왼쪽, 아래, 오른쪽, 위)"""
+    a = before.glyph_bounds(name)
+    b = after.glyph_bounds(name)
+    return (a[0] - (b[0] - shift), a[1] - b[1], (b[2] - shift) - a[2], b[3] - a[3])
+
+
+def test_embolden_syllables_match_latin(geo_glyphs):
+    """합성 음절도 라틴 글자와 같은 굵기만큼 두꺼워짐 (자모 축소 비율 보정)"""
+    outlines = glyph_transform.OutlineArray.from_glyphs(geo_glyphs)
+    bold = glyph_transform.derive(outlines, stroke=STROKE)
+    before = measure_glyphs(geo_glyphs)
+    after = measure_glyphs(bold)
+
+    # 단순 글리프는 폭이 2 * stroke 늘고 stroke 만큼 오른쪽으로 옮겨짐
+    for name in ('H', 'l'):
+        assert _growth(before, after, name, shift=STROKE) == (STROKE,) * 4
+        assert bold[name]['width'] == geo_glyphs[name]['width'] + 2 * STROKE
+
+    for name in ('uniAC00', 'uniC774'):
+        left, _, right, _ = _growth(before, after, name)
+        assert abs(left - STROKE) <= 1 and abs(right - STROKE) <= 1
+        assert bold[name]['width'] == geo_glyphs[name]['width']
+
+    # 자모 하나를 여러 배치가 같이 쓰므로 음절 전체의 중앙값으로 비교
+    names = [hangul.syllable_name(code) for code in range(hangul.SYLLABLE_BASE,
+             hangul.SYLLABLE_BASE + hangul.SYLLABLE_COUNT, 7)]
+    growth = np.array([_growth(before, after, name) for name in names])
+    assert abs(np.median(growth[:, [0, 2]]) - STROKE) <= 1
+    assert abs(np.median(growth[:, [1, 3]]) - STROKE) <= 1
+
+
+def test_transform_keeps_composites_in_sync(geo_glyphs):
+    """기울임 변환 후 합성 음절 경계 = 구성 요소를 펼친 윤곽선 경계"""
+    outlines = glyph_transform.OutlineArray.from_glyphs(geo_glyphs)
+    slanted = glyph_transform.derive(outlines, slant_degrees=12)
+    metrics = measure_glyphs(slanted)
+    flat = {}
+    for name in ('uniAC00', 'uniD7A3'):
+        paths = []
+        for base, (xx, xy, yx, yy, dx, dy) in slanted[name]['components']:
+            coords = np.frombuffer(slanted[base]['paths'].coords,
+                                   dtype=np.int16).reshape(-1, 2).astype(float)
+            paths.append(coords @ np.array([[xx, xy], [yx, yy]]) + (dx, dy))
+        points = np.concatenate(paths)
+        flat[name] = (*points.min(axis=0), *points.max(axis=0))
+        assert np.allclose(metrics.glyph_bounds(name), flat[name], atol=1)
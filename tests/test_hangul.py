@@ -0,0 +1,179 @@
+"""hangul - 음절 분해 / 합성 변환 / cmap / 자모 조합 모드 GSUB"""
+
+import io
+
+import pytest
+from fontTools.fontBuilder import FontBuilder
+from fontTools.ttLib import TTFont
+
+import font_builder
+import hangul
+from glyph_metrics import measure_glyphs
+
+
+def test_decompose():
+    # 초성 19, 중성 21, 종성 27 (+ 받침 없음)
+    assert (len(hangul.INITIALS), len(hangul.MEDIALS), len(hangul.FINALS)) == (19, 21, 27)
+    assert hangul.SYLLABLE_COUNT == 19 * 21 * 28 == 11172
+    assert hangul.decompose(0xAC00) == (0, 0, 0)                # 가
+    assert hangul.decompose(0xAC01) == (0, 0, 1)                # 각
+    assert hangul.decompose(0xD7A3) == (18, 20, 27)             # 힣
+    # 한 = ㅎ(18) + ㅏ(0) + ㄴ(4)
+    assert hangul.decompose(ord('한')) == (18, 0, 4)
+    assert hangul.FINALS[4 - 1] == 'ㄴ'
+    codes = {hangul.decompose(code) for code in range(
+        hangul.SYLLABLE_BASE, hangul.SYLLABLE_BASE + hangul.SYLLABLE_COUNT)}
+    assert len(codes) == hangul.SYLLABLE_COUNT
+
+
+@pytest.mark.parametrize('rel_box', [(0, 0, 1, 1), (0.12, 0.0, 0.88, 0.34), (0.56, 0.38, 1.0, 1.0)])
+def test_box_transform_maps_jamo_box(rel_box):
+    """자모 글리프 영역(JAMO_BOX)의 모서리가 음절 영역 안의 비율 위치로 옮겨짐"""
+    xx, xy, yx, yy, dx, dy = hangul.box_transform(rel_box)
+    assert xy == yx == 0
+    jx0, jy0, jx1, jy1 = hangul.JAMO_BOX
+    ox0, oy0, ox1, oy1 = hangul.SYLLABLE_BOX
+    rx0, ry0, rx1, ry1 = rel_box
+    for (jx, jy), (rx, ry) in (((jx0, jy0), (rx0, ry0)), ((jx1, jy1), (rx1, ry1))):
+        assert xx * jx + dx == pytest.approx(ox0 + rx * (ox1 - ox0))
+        assert yy * jy + dy == pytest.approx(oy0 + ry * (oy1 - oy0))
+    # F2Dot14 로 저장할 수 있는 배율
+    assert 0 < xx < 2 and 0 < yy < 2
+
+
+def test_syllable_components():
+    glyphs = hangul.create_syllable_glyphs()
+    # 한 - 받침 있는 세로 모음 배치
+    components = glyphs['uniD55C']['components']
+    layout = hangul.LAYOUTS[('vertical', True)]
+    assert components == [
+        ('uni1112.base', hangul.box_transform(layout['initial'])),
+        ('uni1161.base', hangul.box_transform(layout['medial'])),
+        ('uni11AB.base', hangul.box_transform(layout['final']))]
+    # 구 - 받침 없는 가로 모음 배치
+    assert [base for base, _ in glyphs['uniAD6C']['components']] == [
+        'uni1100.base', 'uni116E.base']
+
+
+def test_jamo_glyphs_within_font_metrics():
+    """합성 기준 자모 글리프는 유니코드로 읽히지 않는 이름을 쓰고 em 상자 안에 있음"""
+    for style in hangul.STYLES:
+        glyphs = hangul.create_jamo_glyphs(style)
+        assert all(name.endswith('.base') for name in glyphs)
+        metrics = measure_glyphs(glyphs)
+        for name in glyphs:
+            x0, y0, x1, y1 = metrics.glyph_bounds(name)
+            assert 0 <= x0 and x1 <= hangul.CANVAS, (style, name)
+            assert font_builder.DESCENDER <= y0 and y1 <= font_builder.ASCENDER, (style, name)
+
+
+def test_cmap_covers_syllables():
+    cmap = hangul.create_hangul_cmap()
+    codes = set(cmap.values())
+    assert set(range(0xAC00, 0xD7A4)) <= codes
+    assert set(range(0x3131, 0x3164)) <= codes
+    assert len(codes) == len(cmap)
+    glyphs = hangul.create_hangul_glyphs('round')
+    glyphs.update(hangul.create_positional_glyphs())
+    assert all(name in glyphs for name in cmap)
+    assert not any(name.endswith('.base') for name in cmap)
+
+
+# ============================================
+# 자모 조합 모드 GSUB
+# ============================================
+
+@pytest.fixture(scope='module')
+def jamo_font():
+    """setup_jamo_gsub 를 적용해 저장했다 다시 읽은 폰트 (윤곽선 없이 cmap / GSUB 만)"""
+    glyphs = hangul.jamo_mode_glyphs(hangul.create_hangul_glyphs('round'))
+    fb = FontBuilder(font_builder.UNITS_PER_EM)
+    fb.setupGlyphOrder(['.notdef'] + list(glyphs))
+    fb.setupCharacterMap({code: name for name, code in hangul.create_hangul_cmap().items()
+                          if name in glyphs})
+    fb.setupPost()
+    hangul.setup_jamo_gsub(fb.font)
+    data = io.BytesIO()
+    fb.save(data)
+    return TTFont(io.BytesIO(data.getvalue()))
+
+
+def _apply_lookup(lookups, index, glyphs):
+    """lookup 하나를 글리프 열에 적용 (자모 GSUB 에 쓰는 단일 / 다중 / 연쇄 문맥 치환만)"""
+    lookup = lookups[index]
+    result = []
+    i = 0
+    while i < len(glyphs):
+        glyph = glyphs[i]
+        replaced = None
+        for sub in lookup.SubTable:
+            if lookup.LookupType == 1 and glyph in sub.mapping:
+                replaced = [sub.mapping[glyph]]
+            elif lookup.LookupType == 2 and glyph in sub.mapping:
+                replaced = list(sub.mapping[glyph])
+            elif lookup.LookupType == 6:
+                assert sub.Format == 3
+                ahead = glyphs[i + 1:i + 1 + len(sub.LookAheadCoverage)]
+                if (glyph in sub.InputCoverage[0].glyphs and not sub.BacktrackCoverage
+                        and len(ahead) == len(sub.LookAheadCoverage)
+                        and all(g in c.glyphs for g, c in zip(ahead, sub.LookAheadCoverage))):
+                    replaced = [glyph]
+                    for record in sub.SubstLookupRecord:
+                        replaced = _apply_lookup(lookups, record.LookupListIndex, replaced)
+            if replaced is not None:
+                break
+        result.extend(replaced if replaced is not None else [glyph])
+        i += 1
+    return result
+
+
+def shape(font, text, script='hang'):
+    """cmap → ccmp → ljmo / vjmo 순서로 GSUB 를 적용한 글리프 이름 열"""
+    gsub = font['GSUB'].table
+    cmap = font.getBestCmap()
+    record = next(r for r in gsub.ScriptList.ScriptRecord if r.ScriptTag == script)
+    features = [gsub.FeatureList.FeatureRecord[i]
+                for i in record.Script.DefaultLangSys.FeatureIndex]
+    glyphs = [cmap[ord(char)] for char in text]
+    for stage in (('ccmp',), ('ljmo', 'vjmo')):
+        indices = sorted(i for f in features if f.FeatureTag in stage
+                         for i in f.Feature.LookupListIndex)
+        for index in indices:
+            glyphs = _apply_lookup(gsub.LookupList.Lookup, index, glyphs)
+    return glyphs
+
+
+@pytest.mark.parametrize('script', ['DFLT', 'hang'])
+def test_jamo_gsub_decomposes_syllables(jamo_font, script):
+    assert shape(jamo_font, '한글', script) == [
+        'uni1112.vt', 'uni1161.vt', 'uni11AB.t',
+        'uni1100.ht', 'uni1173.ht', 'uni11AF.t']
+    assert shape(jamo_font, '가과', script) == [
+        'uni1100.v', 'uni1161.v', 'uni1100.m', 'uni116A.m']
+
+
+def test_jamo_gsub_conjoining_jamo(jamo_font):
+    """첫가끝 자모 입력은 ljmo / vjmo 로 음절 분해 결과와 같은 형태가 됨"""
+    assert shape(jamo_font, '\u1112\u1161\u11AB\u1100\u1173') == [
+        'uni1112.vt', 'uni1161.vt', 'uni11AB.t', 'uni1100.h', 'uni1173.h']
+
+
+def test_jamo_gsub_feature_list_sorted(jamo_font):
+    gsub = jamo_font['GSUB'].table
+    tags = [r.FeatureTag for r in gsub.FeatureList.FeatureRecord]
+    assert tags == sorted(tags) == ['ccmp', 'ljmo', 'vjmo']
+    for record in gsub.ScriptList.ScriptRecord:
+        assert record.Script.DefaultLangSys.FeatureIndex == [0, 1, 2]
+
+
+def test_jamo_mode_font_has_no_glyph_names(tmp_path):
+    """자모 조합 모드는 자리표시 음절 이름을 저장하지 않음 (post format 3)"""
+    glyphs = {'.notdef': {'width': 500, 'paths': []}, 'space': {'width': 250, 'paths': []}}
+    glyphs.update(hangul.create_hangul_glyphs('round'))
+    for mode, post_format in (('precomposed', 2), ('jamo', 3)):
+        path = tmp_path / f'{mode}.ttf'
+        font_builder.build_font(glyphs, 'Test', 'Test', str(path), use_cache=False,
+                                hangul_mode=mode)
+        font = TTFont(str(path))
+        assert font['post'].formatType == post_format
+        assert font.getBestCmap()[0xD7A3]
@@ -0,0 +1,25 @@
+"""self_host_fonts - CSS 에서 쓰는 폰트 수집"""
+
+import self_host_fonts
+
+
+def test_css_weight_keywords(tmp_path):
+    css = tmp_path / 'style.css'
+    css.write_text("""
+        h1 { font-family: 'GeoRound', sans-serif; font-weight: bold; }
+        h2 { font-family: GeoRound; font-weight: bolder; }
+        h3 { font-family: GeoRound; font-weight: lighter; }
+        p { font-family: "SharpEdge"; font-weight: inherit; }
+        em { font-family: SharpEdge; font-weight: 300; }
+        b { font-family: BubblePop; font-weight: var(--w); }
+        /* a { font-family: Hidden; } */
+    """, encoding='utf-8')
+    assert self_host_fonts.css_font_usage([str(css)]) == [
+        ('GeoRound', 700), ('GeoRound', 100), ('SharpEdge', 400), ('SharpEdge', 300)]
+
+
+def test_css_weight():
+    assert self_host_fonts.css_weight('Normal') == 400
+    assert self_host_fonts.css_weight('initial') == 400
+    assert self_host_fonts.css_weight('650') == 650
+    assert self_host_fonts.css_weight('var') is None
@@ -0,0 +1,49 @@
+"""subset_fonts - 조각 계획 / 스타일시트"""
+
+import sys
+
+import font_builder
+import subset_fonts
+
+SQUARE = [[('moveTo', (0, 0)), ('lineTo', (400, 0)), ('lineTo', (400, 600)),
+           ('lineTo', (0, 600)), ('closePath',)]]
+
+
+def _build(path, family):
+    glyphs = {'.notdef': {'width': 500, 'paths': []},
+              'space': {'width': 250, 'paths': []},
+              'A': {'width': 500, 'paths': SQUARE},
+              'uniAC00': {'width': 1000, 'paths': SQUARE}}
+    font_builder.build_font(glyphs, family, family, str(path), use_cache=False)
+
+
+def _run(monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', ['subset_fonts.py', '-j', '1', *args])
+    return subset_fonts.main()
+
+
+def test_plan_shards():
+    # U+AC03 은 KS X 1001 에 없는 음절
+    shards = dict(subset_fonts.plan_shards([0x41, 0x1100, 0xAC00, 0xAC03, 0x4E00, 0x2603]))
+    assert shards == {'latin': [0x41], 'hangul-jamo': [0x1100], 'hangul-common': [0xAC00],
+                      'hangul': [0xAC03], 'hanja': [0x4E00], 'misc': [0x2603]}
+    assert subset_fonts.format_unicode_range([0xAC02, 0x41, 0xAC00, 0xAC01]) == 'U+41, U+AC00-AC02'
+
+
+def test_only_rerun_keeps_other_families(tmp_path, monkeypatch):
+    """--only 로 한 패밀리만 다시 분할해도 다른 패밀리의 @font-face 가 남음"""
+    input_dir = tmp_path / 'fonts'
+    input_dir.mkdir()
+    _build(input_dir / 'First-Regular.ttf', 'First')
+    _build(input_dir / 'Second-Regular.ttf', 'Second')
+    output_dir = tmp_path / 'subset'
+    options = ['--input-dir', str(input_dir), '--output-dir', str(output_dir)]
+    css_path = output_dir / subset_fonts.CSS_NAME
+
+    assert _run(monkeypatch, *options) == 0
+    full = css_path.read_text(encoding='utf-8')
+    assert "font-family: 'First'" in full and "font-family: 'Second'" in full
+    assert "url('First-Regular/First-Regular.latin.woff2')" in full
+
+    assert _run(monkeypatch, *options, '--only', 'Second-Regular') == 0
+    assert css_path.read_text(encoding='utf-8') == full
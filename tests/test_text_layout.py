@@ -0,0 +1,84 @@
+"""text_layout - 줄바꿈과 상자 크기 맞춤"""
+
+import os
+
+import pytest
+
+import text_layout
+from conftest import FONT_DIR
+
+FONT = os.path.join(FONT_DIR, 'NanumGothic-Regular.ttf')
+CAPTIONS = ['ab  ', '가나다 ', '  lead', 'a\n\nb', '   ', '', 'x  \n  y',
+            '오늘 새로운 한글 폰트가 출시되었습니다 (한정판)', 'Korean fonts for the web']
+
+
+@pytest.fixture(scope='module')
+def prepared():
+    return text_layout.PreparedText(CAPTIONS, FONT)
+
+
+@pytest.mark.parametrize('word_break', text_layout.WORD_BREAKS)
+def test_lines_do_not_depend_on_batch(word_break):
+    """캡션 하나씩 준비한 결과 = 묶어서 준비한 결과 (순서를 바꿔도 같음)"""
+    batch = text_layout.PreparedText(CAPTIONS, FONT, word_break)
+    reversed_batch = text_layout.PreparedText(CAPTIONS[::-1], FONT, word_break)
+    for width in (300, 2000, 8000):
+        for i, text in enumerate(CAPTIONS):
+            alone = text_layout.PreparedText([text], FONT, word_break).lines(0, width)
+            assert batch.lines(i, width) == alone
+            assert reversed_batch.lines(len(CAPTIONS) - 1 - i, width) == alone
+
+
+def test_batch_api_order_independent():
+    assert text_layout.break_lines(['ab  '], FONT, 20, 400) == \
+        text_layout.break_lines(['ab  ', 'c'], FONT, 20, 400)[:1]
+    assert text_layout.fit_sizes(['가나다 '], FONT, 60, 30)[0] == \
+        text_layout.fit_sizes(['가나다 ', 'c'], FONT, 60, 30)[0]
+
+
+def test_trailing_spaces_not_measured(prepared):
+    assert prepared.lines(0, 8000)[0][2] == text_layout.PreparedText(['ab'], FONT).lines(0, 8000)[0][2]
+
+
+def test_leading_spaces_skipped(prepared):
+    """줄 첫머리 공백은 줄에 넣지 않음 - 공백만 있는 줄이 생기지 않음"""
+    assert prepared.lines(2, 2000) == [(2, 6, 1938)]
+    assert prepared.lines(4, 2000) == [(3, 3, 0)]
+    assert prepared.lines(6, 2000)[1][0] == 6
+
+
+def test_forced_breaks_keep_empty_lines(prepared):
+    lines = prepared.lines(3, 8000)
+    assert [(a, b) for a, b, _ in lines] == [(0, 2), (2, 3), (3, 4)]
+    assert lines[1][2] == 0
+
+
+def test_word_breaks():
+    text = '오늘 새로운 한글 폰트가 출시되었습니다'
+    width = 7000
+    for word_break in text_layout.WORD_BREAKS:
+        lines = text_layout.PreparedText([text], FONT, word_break).lines(0, width)
+        assert all(w <= width for _, _, w in lines)
+        assert lines[0][0] == 0 and lines[-1][1] == len(text)
+        if word_break == 'keep-all':
+            # 공백 뒤에서만 나눔
+            assert all(b == len(text) or text[b - 1] == ' ' for _, b, _ in lines)
+
+
+def test_no_break_before_closing_punctuation():
+    text = '가나다라마바사아자차카타파하)'
+    # '하)' 도 안 들어가는 폭에서는 글자 단위로 나뉘므로 그보다 넓은 폭만
+    for width in range(1500, 14000, 500):
+        lines = text_layout.PreparedText([text], FONT).lines(0, width)
+        assert all(text[a] != ')' for a, _, _ in lines)
+
+
+def test_fit_size_is_largest_fitting(prepared):
+    width, height = 200, 60
+    index = 7
+    size = prepared.fit_size(index, width, height)
+    assert prepared.fits(index, size, width, height)
+    assert not prepared.fits(index, size + 0.5, width, height)
+    assert prepared.fit_size(index, width, height * 2) >= size
+    # 최소 크기도 안 들어가면 min_size
+    assert prepared.fit_size(index, 5, 5) == 8
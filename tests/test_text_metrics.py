@@ -0,0 +1,75 @@
+"""text_metrics - 글자 폭 / GPOS 커닝 / 문자열 경계"""
+
+import numpy as np
+import pytest
+from fontTools.feaLib.builder import addOpenTypeFeaturesFromString
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+
+import text_metrics
+
+WIDTHS = {'.notdef': 500, 'space': 250, 'A': 600, 'V': 580, 'T': 560, 'o': 520, 'a': 510}
+CMAP = {0x20: 'space', 0x41: 'A', 0x56: 'V', 0x54: 'T', 0x6F: 'o', 0x61: 'a'}
+# 쌍 하나(PairPos format 1)와 클래스 쌍(format 2)
+FEATURES = """
+feature kern {
+    pos A V -80;
+    @LEFT = [T];
+    @RIGHT = [o a];
+    pos @LEFT @RIGHT -40;
+} kern;
+"""
+
+
+@pytest.fixture(scope='module')
+def font_path(tmp_path_factory):
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(list(WIDTHS))
+    fb.setupCharacterMap(CMAP)
+    fb.setupGlyf({name: TTGlyphPen(None).glyph() for name in WIDTHS})
+    fb.setupHorizontalMetrics({name: (width, 0) for name, width in WIDTHS.items()})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupOS2()
+    fb.setupPost()
+    addOpenTypeFeaturesFromString(fb.font, FEATURES)
+    path = tmp_path_factory.mktemp('metrics') / 'Kern-Regular.ttf'
+    fb.save(str(path))
+    return str(path)
+
+
+def test_kerning_pairs_both_formats(font_path):
+    font = TTFont(font_path)
+    formats = {sub.Format for lookup in font['GPOS'].table.LookupList.Lookup
+               for sub in lookup.SubTable}
+    assert formats == {1, 2}
+    gid = font.getGlyphID
+    assert text_metrics.kerning_pairs(font) == {
+        (gid('A'), gid('V')): -80, (gid('T'), gid('o')): -40, (gid('T'), gid('a')): -40}
+
+
+def test_measure_kerning(font_path):
+    widths = text_metrics.measure(['AV', 'To', 'Ta', 'VA', 'A V', 'AVTo'], font_path, 1000)
+    assert widths.tolist() == [600 + 580 - 80, 560 + 520 - 40, 560 + 510 - 40, 580 + 600,
+                               600 + 250 + 580, 600 + 580 - 80 + 560 + 520 - 40]
+    unkerned = text_metrics.measure(['AV', 'To'], font_path, 1000, kerning=False)
+    assert unkerned.tolist() == [1180, 1080]
+
+
+def test_kerning_does_not_cross_strings(font_path):
+    """이어 붙인 문자열 사이('A' 다음 'V')에는 커닝을 넣지 않음 (빈 문자열 포함)"""
+    widths = text_metrics.measure(['A', 'V', 'T', '', 'o', 'AV'], font_path, 1000)
+    assert widths.tolist() == [600, 580, 560, 0, 520, 1100]
+
+
+def test_measure_empty(font_path):
+    assert text_metrics.measure([''], font_path, 16).tolist() == [0]
+    assert text_metrics.measure(['', ''], font_path, 16).tolist() == [0, 0]
+    assert len(text_metrics.measure([], font_path, 16)) == 0
+
+
+def test_measure_scales_and_missing(font_path):
+    # 16px: 1000 단위 = 16px, cmap 에 없는 글자는 .notdef 폭
+    assert text_metrics.measure(['A가'], font_path, 16) == pytest.approx([(600 + 500) * 0.016])
+    metrics = text_metrics.get_metrics(font_path)
+    assert metrics.missing(np.array([0x41, 0xAC00, 0x10FFFF])).tolist() == [False, True, True]
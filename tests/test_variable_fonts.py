@@ -0,0 +1,56 @@
+"""variable_fonts - GeoRound 굵기 마스터 호환성 / 가변 폰트 축, 셀프 호스팅 연결"""
+
+import os
+
+import pytest
+from fontTools.ttLib import TTFont
+
+import self_host_fonts
+import variable_fonts
+from conftest import FONT_DIR
+
+
+@pytest.fixture(scope='module')
+def georound_vf(tmp_path_factory):
+    """GEOROUND_MASTERS 로 마스터를 빌드해 병합한 가변 폰트 경로와 마스터 경로"""
+    tmp = tmp_path_factory.mktemp('variable')
+    masters = {weight: variable_fonts.build_master(stroke, str(tmp / f'GeoRound-{weight}.ttf'))
+               for weight, stroke in variable_fonts.GEOROUND_MASTERS.items()}
+    variable_dir = tmp / 'variable'
+    variable_dir.mkdir()
+    path = str(variable_dir / os.path.basename(variable_fonts.GEOROUND_OUTPUT))
+    variable_fonts.build_variable_font(masters, 'GeoRound').save(path)
+    return path, masters
+
+
+def test_masters_compatible(georound_vf):
+    _, masters = georound_vf
+    fonts = [TTFont(path) for path in masters.values()]
+    assert variable_fonts.incompatible_glyphs(fonts) == []
+    # 획 굵기만 달라지므로 굵은 마스터일수록 윤곽선이 바깥으로 커짐
+    xmax = [font['glyf']['H'].xMax for font in fonts]
+    assert xmax == sorted(xmax) and len(set(xmax)) == len(xmax)
+
+
+def test_fvar_weight_axis(georound_vf):
+    path, _ = georound_vf
+    font = TTFont(path)
+    weights = sorted(variable_fonts.GEOROUND_MASTERS)
+    [axis] = font['fvar'].axes
+    assert (axis.axisTag, axis.minValue, axis.defaultValue, axis.maxValue) == (
+        'wght', weights[0], 400, weights[-1])
+    assert [i.coordinates['wght'] for i in font['fvar'].instances] == [300, 400, 500, 600, 700]
+    assert 'gvar' in font and 'HVAR' in font
+
+
+def test_self_host_uses_variable_font(georound_vf):
+    """셀프 호스팅은 fonts/variable/ 의 가변 폰트를 찾아 굵기 범위 안의 정적 파일 대신 씀"""
+    path, _ = georound_vf
+    static = os.path.join(FONT_DIR, 'GeoRound-Regular.ttf')
+    paths = self_host_fonts.font_files(FONT_DIR, os.path.dirname(path))
+    assert path in paths and static in paths
+
+    infos = [self_host_fonts.read_font_info(p) for p in (static, path)]
+    assert infos[1]['weight_range'] == (300, 700)
+    matched = self_host_fonts.match_families(['GeoRound'], infos)
+    assert [info['path'] for info in matched['GeoRound']] == [path]
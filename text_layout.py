@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+한글 / 라틴 혼합 줄바꿈과 글자 크기 맞춤 - text_metrics 의 폭 배열 위에서 동작
+- 줄바꿈 방식 (CSS word-break 와 같은 이름)
+  - normal: 공백 뒤와 한글 / 한자 / 가나 글자 사이에서 줄바꿈, 라틴 단어는 유지
+  - keep-all: 공백(과 하이픈) 뒤에서만 줄바꿈 - 한글 어절도 나누지 않음
+  - break-all: 라틴 단어를 포함해 모든 글자 사이에서 줄바꿈
+- 닫는 문장 부호(. , ) 」 등) 앞과 여는 괄호 뒤에서는 나누지 않음, '\\n' 은 강제 줄바꿈
+- 줄 첫머리 / 끝 공백은 폭에서 제외, 한 줄에 안 들어가는 단어는 글자 단위로 나눔
+- 폭이 크기에 비례하므로 폰트 단위로 한 번 측정해 두고, 크기 이분 탐색은
+  줄바꿈(누적 폭 배열에서 bisect)만 다시 함
+- 캡션 수천 개를 한 번에 준비(NumPy)한 뒤 캡션마다 줄 단위 bisect 로 처리
+"""
+
+import argparse
+import sys
+import time
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+import text_metrics
+
+WORD_BREAKS = ('normal', 'keep-all', 'break-all')
+
+# 글자 사이에서 나눌 수 있는 문자 범위 (한글 음절 / 자모, 한자, 가나, 전각 기호)
+_BREAKABLE_RANGES = [
+    (0x1100, 0x11FF), (0x2E80, 0x2FDF), (0x3000, 0x303F), (0x3040, 0x30FF),
+    (0x3130, 0x318F), (0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xA960, 0xA97F),
+    (0xAC00, 0xD7AF), (0xF900, 0xFAFF), (0xFF00, 0xFFEF),
+]
+_SPACES = ' \t　'
+_HYPHENS = '-‐–—'
+# 이 문자 앞에서는 나누지 않음 (줄 첫머리 금지)
+_NO_BREAK_BEFORE = ',.!?:;)]}%’”、。〉》」』】…！），．：；？'
+# 이 문자 뒤에서는 나누지 않음 (줄 끝 금지)
+_NO_BREAK_AFTER = '([{‘“〈《「『【（'
+
+
+def check_word_break(word_break):
+    if word_break not in WORD_BREAKS:
+        raise ValueError(f"알 수 없는 줄바꿈 방식: {word_break} (가능: {', '.join(WORD_BREAKS)})")
+    return word_break
+
+
+def _member(codes, chars):
+    return np.isin(codes, [ord(ch) for ch in chars])
+
+
+def _breakable(codes):
+    result = np.zeros(len(codes), dtype=bool)
+    for start, end in _BREAKABLE_RANGES:
+        result |= (codes >= start) & (codes <= end)
+    return result
+
+
+# ============================================
+# 배치 준비 (NumPy)
+# ============================================
+
+class PreparedText:
+    """캡션 목록을 폰트 단위 누적 폭과 줄바꿈 후보 위치로 변환한 것
+
+    위치는 모든 캡션을 이어 붙인 글자 배열의 번호 (i 는 글자 i 앞).
+    cum[i]: 글자 i 앞까지의 누적 폭, trim[i]: 글자 i 앞의 공백을 뺀 누적 폭.
+    nonspace[i]: i 부터 처음 나오는 공백 아닌 글자 위치 (줄 첫머리 공백 건너뛰기).
+    breaks: 줄바꿈 후보 위치, forced: 강제 줄바꿈 위치 ('\\n' 뒤).
+    """
+
+    def __init__(self, strings, font, word_break='normal', kerning=True):
+        check_word_break(word_break)
+        self.strings = list(strings)
+        self.metrics = text_metrics.get_metrics(font)
+        codes, starts, lengths = text_metrics.encode(self.strings)
+        self.starts = starts.tolist()
+        self.ends = (starts + lengths).tolist()
+
+        widths = self.metrics.char_advances(codes, starts, kerning)
+        control = codes < 0x20
+        widths[control] = 0
+        cum = np.zeros(len(codes) + 1, dtype=np.int64)
+        np.cumsum(widths, out=cum[1:])
+
+        # 줄 끝 공백 제외: trim[i] = 글자 i 앞의 마지막 공백 아닌 글자까지의 누적 폭
+        # (캡션 시작을 넘어가지 않음 - 시작 위치는 앞 캡션의 끝이기도 하므로 그 다음부터 적용)
+        space = _member(codes, _SPACES) | control
+        index = np.arange(len(codes) + 1)
+        last = np.where(np.concatenate(([True], ~space)), index, 0)
+        caption_start = np.zeros(len(codes) + 1, dtype=np.int64)
+        caption_start[starts[lengths > 0] + 1] = starts[lengths > 0]
+        last = np.maximum.accumulate(np.maximum(last, caption_start))
+        trim = cum[last]
+
+        # 줄 첫머리 공백 건너뛰기: nonspace[i] = i 부터 처음 나오는 공백 아닌 글자 위치
+        stop_here = np.concatenate((~_member(codes, _SPACES), [True]))
+        nonspace = np.where(stop_here, index, len(codes))
+        nonspace = np.minimum.accumulate(nonspace[::-1])[::-1]
+
+        # 줄바꿈 후보: 글자 i-1 과 i 사이 (같은 캡션 안)
+        prev, cur = codes[:-1], codes[1:]
+        prev_space, cur_space = space[:-1], space[1:]
+        if word_break == 'break-all':
+            allowed = ~cur_space
+        else:
+            allowed = prev_space & ~cur_space
+            allowed |= _member(prev, _HYPHENS) & ~cur_space
+            if word_break == 'normal':
+                breakable = _breakable(codes)
+                allowed |= (breakable[:-1] | breakable[1:]) & ~prev_space & ~cur_space
+        allowed &= ~_member(cur, _NO_BREAK_BEFORE) & ~_member(prev, _NO_BREAK_AFTER)
+        forced = prev == ord('\n')
+        allowed |= forced
+        inside = np.ones(len(allowed), dtype=bool)
+        first = starts[(lengths > 0) & (starts > 0)] - 1
+        inside[first] = False
+        positions = np.flatnonzero(allowed & inside) + 1
+
+        self.cum = cum.tolist()
+        self.trim = trim.tolist()
+        self.nonspace = nonspace.tolist()
+        self.breaks = positions.tolist()
+        self.break_trim = trim[positions].tolist()
+        self.forced = (np.flatnonzero(forced & inside) + 1).tolist()
+        info = self.metrics.info
+        self.units_per_em = info['units_per_em']
+        self.natural_line = (info['ascender'] - info['descender'] + info['line_gap']) / self.units_per_em
+
+    def __len__(self):
+        return len(self.strings)
+
+    def lines(self, index, width_units):
+        """캡션 index 를 폭 width_units(폰트 단위)로 줄바꿈 - [(시작, 끝, 폭)] (위치는 캡션 안 기준)
+
+        줄 첫머리 공백은 줄에서 빼므로 공백만 있는 줄은 생기지 않는다.
+        """
+        start, end = self.starts[index], self.ends[index]
+        cum, trim, breaks, break_trim, forced, nonspace = (
+            self.cum, self.trim, self.breaks, self.break_trim, self.forced, self.nonspace)
+        lo = bisect_right(breaks, start)
+        hi = bisect_left(breaks, end)
+        f = bisect_right(forced, start)
+        result = []
+        a = start
+        while True:
+            a = min(nonspace[a], end)
+            # 다음 강제 줄바꿈 (또는 캡션 끝) 까지만 탐색
+            while f < len(forced) and forced[f] <= a:
+                f += 1
+            stop = forced[f] if f < len(forced) and forced[f] < end else end
+            limit = cum[a] + width_units
+            if trim[stop] <= limit:
+                b = stop
+            else:
+                lo = bisect_right(breaks, a, lo, hi)
+                k = bisect_right(break_trim, limit, lo, bisect_left(breaks, stop, lo, hi)) - 1
+                if k >= lo:
+                    b = breaks[k]
+                else:
+                    # 후보 위치에서 나눌 수 없으면 글자 단위로 (적어도 한 글자)
+                    b = max(a + 1, bisect_right(cum, limit, a, stop + 1) - 1)
+            result.append((a - start, b - start, max(trim[b] - cum[a], 0)))
+            if b >= end:
+                break
+            a = b
+        return result
+
+    def line_count(self, index, width_units):
+        """줄 수와 가장 넓은 줄 폭 (폰트 단위)"""
+        lines = self.lines(index, width_units)
+        return len(lines), max(w for _, _, w in lines)
+
+    def fits(self, index, size, width, height, line_height=None, max_lines=None):
+        """캡션 index 가 size(px) 에서 width × height 상자에 들어가는지"""
+        width_units = width * self.units_per_em / size
+        count, widest = self.line_count(index, width_units)
+        if widest > width_units or (max_lines and count > max_lines):
+            return False
+        return count * (line_height or self.natural_line) * size <= height
+
+    def fit_size(self, index, width, height, min_size=8, max_size=200, step=0.5,
+                 line_height=None, max_lines=None):
+        """상자에 들어가는 가장 큰 크기 (step 단위, 최소 크기도 안 들어가면 min_size)"""
+        lo, hi = 0, int((max_size - min_size) / step)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.fits(index, min_size + mid * step, width, height, line_height, max_lines):
+                lo = mid
+            else:
+                hi = mid - 1
+        return min_size + lo * step
+
+
+# ============================================
+# 배치 API
+# ============================================
+
+def break_lines(strings, font, size, width, word_break='normal', kerning=True):
+    """캡션마다 [(줄 문자열, 폭 px)] 목록"""
+    prepared = PreparedText(strings, font, word_break, kerning)
+    width_units = width * prepared.units_per_em / size
+    scale = size / prepared.units_per_em
+    result = []
+    for index, text in enumerate(prepared.strings):
+        result.append([(text[a:b].rstrip(_SPACES + '\n\r'), w * scale)
+                       for a, b, w in prepared.lines(index, width_units)])
+    return result
+
+
+def fit_sizes(strings, font, width, height, word_break='normal', min_size=8, max_size=200,
+              step=0.5, line_height=None, max_lines=None, kerning=True):
+    """캡션마다 width × height 상자에 들어가는 가장 큰 글자 크기 (px, float64 배열)
+
+    line_height: 글자 크기 대비 줄 높이 배수 (기본: 폰트 hhea 의 ascender - descender + lineGap)
+    """
+    prepared = PreparedText(strings, font, word_break, kerning)
+    return np.array([prepared.fit_size(i, width, height, min_size, max_size, step,
+                                       line_height, max_lines)
+                     for i in range(len(prepared))])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='한글 / 라틴 줄바꿈과 상자 크기 맞춤')
+    parser.add_argument('strings', nargs='*', help='캡션 (없으면 --file 또는 표준 입력의 줄)')
+    parser.add_argument('--file', help='한 줄에 캡션 하나인 텍스트 파일')
+    parser.add_argument('--font', default='NanumGothic-Regular.ttf', help='폰트 파일 이름 또는 경로')
+    parser.add_argument('--width', type=float, default=320, help='상자 폭 (px)')
+    parser.add_argument('--height', type=float, help='상자 높이 (px) - 주면 크기 맞춤')
+    parser.add_argument('--size', type=float, default=16, help='줄바꿈할 글자 크기 (px)')
+    parser.add_argument('--word-break', default='normal', choices=WORD_BREAKS)
+    parser.add_argument('--max-lines', type=int, help='크기 맞춤 시 최대 줄 수')
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, encoding='utf-8') as f:
+            strings = f.read().splitlines()
+    else:
+        strings = args.strings or sys.stdin.read().splitlines()
+
+    started = time.perf_counter()
+    if args.height:
+        sizes = fit_sizes(strings, args.font, args.width, args.height, args.word_break,
+                          max_lines=args.max_lines)
+        elapsed = time.perf_counter() - started
+        for text, size in zip(strings[:20], sizes):
+            print(f"🔠 {size:>6.1f}px  {text[:60]}")
+    else:
+        layouts = break_lines(strings, args.font, args.size, args.width, args.word_break)
+        elapsed = time.perf_counter() - started
+        for text, lines in zip(strings[:20], layouts):
+            print(f"📝 {text[:60]}")
+            for line, width in lines:
+                print(f"   {width:>7.1f}px | {line}")
+    print(f"⏱️  캡션 {len(strings):,}개 {elapsed * 1000:.1f}ms "
+          f"({len(strings) / max(elapsed, 1e-9) * 60:,.0f}개/분)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+텍스트 폭 측정 - 브라우저 없이 서버에서 글 폭을 재는 배치 API (말줄임, 배너 줄 맞춤용)
+- 폰트마다 cmap 을 코드포인트 → 글리프 번호 배열로, hmtx 를 글리프 번호 → 폭 배열로 만듦
+- 두 배열과 커닝 쌍은 폰트 해시별 .npy 캐시에 저장하고 np.load(mmap_mode='r') 로 매핑
+- measure(strings, font, size): 문자열 수천 개를 UTF-32 배열 하나로 이어 붙여
+  글자 폭 조회 / 커닝 / 문자열별 합(reduceat)을 한 번에 계산
+- 커닝: GPOS 'kern' 기능의 쌍 조정(PairPos) 또는 kern 테이블 (끌 수 있음)
+- fonts/ 의 생성 폰트(GeoRound / SharpEdge / BubblePop)와 한글 폰트 모두 같은 방식
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+from fontTools.ttLib import TTFont
+
+import font_cache
+import font_catalog
+
+# 캐시 파일 구조가 바뀌어 이전 캐시를 쓸 수 없을 때 올린다
+METRICS_VERSION = 1
+
+_ARRAYS = ('glyph_ids', 'advances', 'kern_keys', 'kern_values')
+
+
+# ============================================
+# 커닝 쌍
+# ============================================
+
+def _pair_values(subtable, glyph_ids):
+    """PairPos 서브테이블 → {(왼쪽 글리프 번호, 오른쪽 글리프 번호): x 폭 조정}"""
+    pairs = {}
+    if subtable.Format == 1:
+        for first, pair_set in zip(subtable.Coverage.glyphs, subtable.PairSet):
+            for record in pair_set.PairValueRecord:
+                value = getattr(record.Value1, 'XAdvance', 0) if record.Value1 else 0
+                if value:
+                    pairs.setdefault((glyph_ids[first], glyph_ids[record.SecondGlyph]), value)
+    elif subtable.Format == 2:
+        class1 = {}
+        for glyph in subtable.Coverage.glyphs:
+            class1.setdefault(subtable.ClassDef1.classDefs.get(glyph, 0), []).append(glyph)
+        class2 = {}
+        for glyph, cls in subtable.ClassDef2.classDefs.items():
+            class2.setdefault(cls, []).append(glyph)
+        # 오른쪽 클래스 0 은 ClassDef2 에 없는 모든 글리프
+        class2[0] = [glyph for glyph in glyph_ids if glyph not in subtable.ClassDef2.classDefs]
+        for c1, record in enumerate(subtable.Class1Record):
+            for c2, value_record in enumerate(record.Class2Record):
+                value = getattr(value_record.Value1, 'XAdvance', 0) if value_record.Value1 else 0
+                if not value:
+                    continue
+                for first in class1.get(c1, []):
+                    for second in class2.get(c2, []):
+                        pairs.setdefault((glyph_ids[first], glyph_ids[second]), value)
+    return pairs
+
+
+def kerning_pairs(font):
+    """{(왼쪽, 오른쪽 글리프 번호): 폭 조정(폰트 단위)} - GPOS kern 기능, 없으면 kern 테이블"""
+    glyph_ids = {name: i for i, name in enumerate(font.getGlyphOrder())}
+    pairs = {}
+    if 'GPOS' in font:
+        table = font['GPOS'].table
+        indices = sorted({index for record in (table.FeatureList.FeatureRecord
+                                               if table.FeatureList else [])
+                          if record.FeatureTag == 'kern'
+                          for index in record.Feature.LookupListIndex})
+        for index in indices:
+            lookup = table.LookupList.Lookup[index]
+            found = {}
+            for subtable in lookup.SubTable:
+                if lookup.LookupType == 9:
+                    subtable = subtable.ExtSubTable
+                if subtable.LookupType != 2:
+                    continue
+                # 한 룩업 안에서는 먼저 나온 서브테이블이 우선, 룩업끼리는 더해짐
+                for pair, value in _pair_values(subtable, glyph_ids).items():
+                    found.setdefault(pair, value)
+            for pair, value in found.items():
+                pairs[pair] = pairs.get(pair, 0) + value
+    elif 'kern' in font:
+        for table in font['kern'].kernTables:
+            if getattr(table, 'coverage', 1) & 1 and hasattr(table, 'kernTable'):
+                for (first, second), value in table.kernTable.items():
+                    if value and first in glyph_ids and second in glyph_ids:
+                        pairs.setdefault((glyph_ids[first], glyph_ids[second]), value)
+    return pairs
+
+
+# ============================================
+# 폰트 하나의 메트릭 배열
+# ============================================
+
+class FontMetrics:
+    """코드포인트 → 글리프 번호 / 글리프 번호 → 폭 배열 (캐시에서 읽으면 메모리 매핑)
+
+    glyph_ids: uint16, 길이 = 최대 코드포인트 + 1 (없는 문자는 0 = .notdef)
+    advances: uint16, 길이 = 글리프 수
+    kern_keys / kern_values: (왼쪽 << 16 | 오른쪽) 정렬 배열과 폭 조정 (폰트 단위)
+    sha256: 폰트 파일 해시 (load 로 읽었을 때만)
+    """
+
+    def __init__(self, name, info, glyph_ids, advances, kern_keys, kern_values, sha256=None):
+        self.name = name
+        self.sha256 = sha256
+        self.info = info
+        self.units_per_em = info['units_per_em']
+        self.glyph_ids = glyph_ids
+        self.advances = advances
+        self.kern_keys = kern_keys
+        self.kern_values = kern_values
+
+    @classmethod
+    def from_font(cls, path):
+        """폰트 파일에서 cmap / hmtx / 커닝을 읽어 배열 생성"""
+        font = TTFont(path, lazy=True)
+        try:
+            order = font.getGlyphOrder()
+            glyph_index = {name: i for i, name in enumerate(order)}
+            cmap = font.getBestCmap() or {}
+            glyph_ids = np.zeros(max(cmap, default=0) + 1, dtype=np.uint16)
+            if cmap:
+                codes = np.fromiter(cmap.keys(), dtype=np.int64, count=len(cmap))
+                glyph_ids[codes] = [glyph_index[name] for name in cmap.values()]
+            hmtx = font['hmtx'].metrics
+            advances = np.array([hmtx[name][0] for name in order], dtype=np.uint16)
+            pairs = kerning_pairs(font)
+            kern_keys = np.array(sorted(left << 16 | right for left, right in pairs),
+                                 dtype=np.uint32)
+            kern_values = np.array([pairs[key >> 16, key & 0xFFFF] for key in kern_keys.tolist()],
+                                   dtype=np.int16)
+            hhea = font['hhea']
+            info = {
+                'units_per_em': font['head'].unitsPerEm,
+                'ascender': hhea.ascent,
+                'descender': hhea.descent,
+                'line_gap': hhea.lineGap,
+            }
+        finally:
+            font.close()
+        return cls(os.path.basename(path), info, glyph_ids, advances, kern_keys, kern_values)
+
+    @classmethod
+    def load(cls, path, sha256=None, cache_dir=None):
+        """폰트 해시별 캐시에서 메모리 매핑으로 읽음 (없으면 만들어 저장)"""
+        sha256 = sha256 or font_catalog.file_hash(path)
+        directory = os.path.join(cache_dir or font_cache.CACHE_DIR, 'metrics',
+                                 f'v{METRICS_VERSION}-{sha256[:32]}')
+        try:
+            with open(os.path.join(directory, 'info.json'), encoding='utf-8') as f:
+                info = json.load(f)
+            arrays = [np.load(os.path.join(directory, f'{key}.npy'), mmap_mode='r')
+                      for key in _ARRAYS]
+            return cls(os.path.basename(path), info, *arrays, sha256=sha256)
+        except (OSError, ValueError):
+            pass
+        metrics = cls.from_font(path)
+        metrics.sha256 = sha256
+        metrics.save(directory)
+        return metrics
+
+    def save(self, directory):
+        """.npy 배열과 info.json 을 임시 디렉터리에 쓴 뒤 이름을 바꿔 원자적으로 저장"""
+        tmp_dir = f'{directory}.{os.getpid()}.tmp'
+        os.makedirs(tmp_dir, exist_ok=True)
+        for key in _ARRAYS:
+            np.save(os.path.join(tmp_dir, f'{key}.npy'), getattr(self, key))
+        with open(os.path.join(tmp_dir, 'info.json'), 'w', encoding='utf-8') as f:
+            json.dump(self.info, f)
+        try:
+            os.replace(tmp_dir, directory)
+        except OSError:
+            # 다른 프로세스가 먼저 저장함
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def lookup(self, codes):
+        """코드포인트 배열 → 글리프 번호 배열 (cmap 에 없으면 0)"""
+        codes = np.asarray(codes, dtype=np.int64)
+        inside = codes < len(self.glyph_ids)
+        return np.where(inside, self.glyph_ids[np.where(inside, codes, 0)], 0)
+
+    def char_advances(self, codes, starts=None, kerning=True):
+        """글자별 폭 (폰트 단위, int64) - 다음 글자와의 커닝을 왼쪽 글자에 더함
+
+        starts: 이어 붙인 문자열들의 시작 위치 (문자열 경계를 넘는 커닝은 빼기 위함)
+        """
+        gids = self.lookup(codes)
+        widths = self.advances[gids].astype(np.int64)
+        if kerning and len(self.kern_keys) and len(gids) > 1:
+            keys = gids[:-1].astype(np.uint32) << 16 | gids[1:]
+            pos = np.minimum(np.searchsorted(self.kern_keys, keys), len(self.kern_keys) - 1)
+            kern = np.where(self.kern_keys[pos] == keys, self.kern_values[pos], 0)
+            if starts is not None and len(starts):
+                boundary = np.asarray(starts, dtype=np.int64) - 1
+                kern[boundary[(boundary >= 0) & (boundary < len(kern))]] = 0
+            widths[:-1] += kern
+        return widths
+
+    def measure(self, strings, size, kerning=True):
+        """문자열 목록의 폭 (px, float64 배열) - size 는 em 크기(px)"""
+        codes, starts, lengths = encode(strings)
+        units = np.zeros(len(lengths), dtype=np.int64)
+        if len(codes):
+            widths = self.char_advances(codes, starts, kerning)
+            filled = lengths > 0
+            units[filled] = np.add.reduceat(widths, starts[filled])
+        return units * (size / self.units_per_em)
+
+    def missing(self, codes):
+        """cmap 에 없는 코드포인트 표시 (bool 배열)"""
+        return self.lookup(codes) == 0
+
+
+# ============================================
+# 배치 API
+# ============================================
+
+def encode(strings):
+    """문자열 목록 → (코드포인트 배열, 시작 위치, 길이) - UTF-32 로 한 번에 변환"""
+    lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+    starts = np.zeros(len(lengths), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    data = ''.join(strings).encode('utf-32-le', 'surrogatepass')
+    return np.frombuffer(data, dtype=np.uint32).astype(np.int64), starts, lengths
+
+
+_LOADED = {}
+
+
+def get_metrics(font, font_dir=font_catalog.FONT_DIR):
+    """FontMetrics, 폰트 경로, 또는 fonts/ 의 파일 이름 → FontMetrics (프로세스 안에서 재사용)"""
+    if isinstance(font, FontMetrics):
+        return font
+    path = font if os.path.exists(font) else os.path.join(font_dir, font)
+    key = os.path.abspath(path)
+    metrics = _LOADED.get(key)
+    if metrics is None:
+        metrics = _LOADED[key] = FontMetrics.load(path)
+    return metrics
+
+
+def load_fonts(font_dir=font_catalog.FONT_DIR, catalog_path=font_catalog.CATALOG_PATH):
+    """fonts/ 의 모든 폰트 메트릭 {파일 이름: FontMetrics} - 해시는 카탈로그 색인에서"""
+    catalog, _ = font_catalog.update_catalog(font_dir, catalog_path)
+    for file_name, entry in catalog['fonts'].items():
+        path = os.path.abspath(os.path.join(font_dir, file_name))
+        if path not in _LOADED:
+            _LOADED[path] = FontMetrics.load(path, entry['sha256'])
+    return {file_name: _LOADED[os.path.abspath(os.path.join(font_dir, file_name))]
+            for file_name in catalog['fonts']}
+
+
+def measure(strings, font, size, kerning=True):
+    """문자열 목록을 font 로 size(px) 크기에 조판했을 때의 폭 (px, float64 배열)"""
+    return get_metrics(font).measure(strings, size, kerning)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='폰트별 텍스트 폭 측정 (hmtx / cmap 배열)')
+    parser.add_argument('strings', nargs='*', help='측정할 문자열 (없으면 --file 또는 표준 입력의 줄)')
+    parser.add_argument('--file', help='한 줄에 문자열 하나인 텍스트 파일')
+    parser.add_argument('--font', nargs='+', help='폰트 파일 이름 또는 경로 (기본: fonts/ 전체)')
+    parser.add_argument('--size', type=float, default=16, help='em 크기 (px)')
+    parser.add_argument('--no-kerning', action='store_true', help='커닝 쌍을 적용하지 않음')
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, encoding='utf-8') as f:
+            strings = f.read().splitlines()
+    else:
+        strings = args.strings or sys.stdin.read().splitlines()
+
+    started = time.perf_counter()
+    fonts = ({name: get_metrics(name) for name in args.font} if args.font else load_fonts())
+    loaded = time.perf_counter() - started
+
+    for name, metrics in fonts.items():
+        started = time.perf_counter()
+        widths = metrics.measure(strings, args.size, not args.no_kerning)
+        elapsed = time.perf_counter() - started
+        print(f"📏 {name} ({args.size:g}px, 문자열 {len(strings):,}개, {elapsed * 1000:.2f}ms)")
+        for text, width in list(zip(strings, widths))[:10]:
+            print(f"   {width:>9.1f}px  {text[:60]}")
+    print(f"📦 메트릭 {len(fonts)}개 로드 {loaded * 1000:.0f}ms")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
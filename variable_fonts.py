@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+가변 폰트(wght 축) 빌더
+- GeoRound: 획 굵기 매개변수(stroke)로 굵기별 마스터를 생성해 가변 폰트 하나로 병합
+- 정적 굵기 파일(fonts/GothicA1-Bold.ttf 등)은 모든 글리프의 윤곽선이 호환될 때만 병합
+- fontTools.varLib 로 fvar/gvar/HVAR/MVAR/STAT 생성
+  (gvar 델타는 IUP 로 보간되는 점을 생략해 최적화)
+- 결과는 빌드 산출물이므로 fonts/variable/ 에 저장 (fonts/ 를 훑는 카탈로그 / 서브셋 /
+  셀프 호스팅 / 렌더링 스크립트가 정적 폰트로 잘못 읽지 않도록)
+"""
+
+import argparse
+import glob
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from fontTools import varLib
+from fontTools.designspaceLib import (
+    AxisDescriptor, DesignSpaceDocument, InstanceDescriptor, SourceDescriptor)
+from fontTools.ttLib import TTFont
+
+import font_export
+from cli_options import positive_int
+
+FONT_DIR = 'fonts'
+OUTPUT_DIR = os.path.join(FONT_DIR, 'variable')
+
+# GeoRound 마스터: {wght: 획 굵기 증감 (한쪽 기준 단위)}
+GEOROUND_MASTERS = {300: -12, 400: 0, 700: 16}
+GEOROUND_OUTPUT = os.path.join(OUTPUT_DIR, 'GeoRound-VF.ttf')
+
+# OS/2 usWeightClass → 스타일 이름 (fvar 이름 있는 인스턴스)
+WEIGHT_NAMES = {
+    100: 'Thin', 200: 'ExtraLight', 300: 'Light', 400: 'Regular', 500: 'Medium',
+    600: 'SemiBold', 700: 'Bold', 800: 'ExtraBold', 900: 'Black',
+}
+
+# 병합 결과를 보고할 때 비교하는 테이블
+VARIATION_TABLES = ('glyf', 'gvar', 'HVAR', 'MVAR')
+
+
+# ============================================
+# 마스터 호환성 검사
+# ============================================
+
+def _outline_signature(glyf, name):
+    """gvar 델타를 공유할 수 있는지 판단하는 윤곽선 구조 (좌표 제외)"""
+    glyph = glyf[name]
+    if glyph.isComposite():
+        return ('composite', tuple(c.glyphName for c in glyph.components))
+    if glyph.numberOfContours <= 0:
+        return ('empty',)
+    return ('simple', tuple(glyph.endPtsOfContours), bytes(f & 1 for f in glyph.flags))
+
+
+def incompatible_glyphs(fonts):
+    """마스터 TTFont 목록에서 점 구조가 서로 다른 글리프 이름 목록 (글리프 집합 차이 포함)"""
+    glyph_sets = [set(font.getGlyphOrder()) for font in fonts]
+    common = set.intersection(*glyph_sets)
+    bad = sorted(set.union(*glyph_sets) - common)
+    glyf_tables = [font['glyf'] for font in fonts]
+    for name in fonts[0].getGlyphOrder():
+        if name in common and len({_outline_signature(glyf, name)
+                                   for glyf in glyf_tables}) > 1:
+            bad.append(name)
+    return bad
+
+
+# ============================================
+# 가변 폰트 병합
+# ============================================
+
+def build_variable_font(masters, family_name, optimize=True):
+    """{wght: 마스터 TTF 경로} → 가변 TTFont (기본 마스터는 400 에 가장 가까운 굵기)
+
+    optimize: gvar 델타에 IUP 최적화 적용 (varLib.build 의 optimize)
+    """
+    weights = sorted(masters)
+    default = min(weights, key=lambda w: (abs(w - 400), w))
+
+    fonts = {weight: TTFont(masters[weight]) for weight in weights}
+    bad = incompatible_glyphs(list(fonts.values()))
+    if bad:
+        total = len(fonts[default].getGlyphOrder())
+        raise ValueError(f"{family_name}: 윤곽선이 호환되지 않는 글리프 "
+                         f"{len(bad):,}/{total:,}개 (예: {', '.join(bad[:5])})")
+
+    doc = DesignSpaceDocument()
+    axis = AxisDescriptor()
+    axis.name, axis.tag = 'Weight', 'wght'
+    axis.minimum, axis.default, axis.maximum = weights[0], default, weights[-1]
+    doc.addAxis(axis)
+    for weight in weights:
+        source = SourceDescriptor()
+        source.path = masters[weight]
+        source.font = fonts[weight]
+        source.location = {'Weight': weight}
+        source.familyName = family_name
+        doc.addSource(source)
+    for weight, style in WEIGHT_NAMES.items():
+        if weights[0] <= weight <= weights[-1]:
+            instance = InstanceDescriptor()
+            instance.familyName = family_name
+            instance.styleName = style
+            instance.location = {'Weight': weight}
+            doc.addInstance(instance)
+
+    vf, _, _ = varLib.build(doc, optimize=optimize)
+    for font in fonts.values():
+        font.close()
+    return vf
+
+
+def _table_sizes(path):
+    font = TTFont(path, lazy=True)
+    sizes = {tag: font.reader.tables[tag].length
+             for tag in VARIATION_TABLES if tag in font.reader}
+    font.close()
+    return sizes
+
+
+def save_variable_font(vf, output_path, formats, master_paths):
+    """가변 폰트를 형식별로 저장하고 정적 마스터 합계와 크기 비교 출력"""
+    sizes = font_export.save_formats(vf, output_path, formats)
+    static_total = sum(os.path.getsize(path) for path in master_paths)
+    for fmt, (path, size) in sizes.items():
+        print(f"✅ {path}: {size:,} bytes")
+    sfnt_path = sizes[formats[0]][0]
+    tables = '  '.join(f"{tag}={size:,}" for tag, size in _table_sizes(sfnt_path).items())
+    print(f"   {tables}")
+    sfnt_size = sizes[formats[0]][1]
+    print(f"   정적 {len(master_paths)}개 합계 {static_total:,} bytes → 가변 1개 "
+          f"{sfnt_size:,} bytes ({(sfnt_size - static_total) / static_total * 100:+.0f}%)")
+    return sizes
+
+
+# ============================================
+# GeoRound (생성기 마스터)
+# ============================================
+
+def build_master(stroke, output_path):
+    """워커 프로세스에서 GeoRound 마스터 하나를 빌드
+
+    가변 폰트 마스터끼리는 글리프 구성이 같아야 하므로 윤곽선 중복 제거
+    (부품 글리프 선택이 굵기마다 달라질 수 있음)와 빌드 캐시를 끈다.
+    """
+    import create_fonts
+    glyphs = create_fonts.create_geometric_font(stroke)
+    create_fonts.build_font(glyphs, 'GeoRound', 'GeoRound', output_path,
+                            use_cache=False, dedupe=False)
+    return output_path
+
+
+def build_georound(output_path=GEOROUND_OUTPUT, formats=('ttf',), optimize=True,
+                   jobs=None, masters=GEOROUND_MASTERS):
+    """GeoRound 굵기별 마스터를 병렬로 빌드해 가변 폰트로 병합"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {weight: os.path.join(tmp, f'GeoRound-{weight}.ttf') for weight in masters}
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for future in [executor.submit(build_master, masters[weight], path)
+                           for weight, path in paths.items()]:
+                future.result()
+        vf = build_variable_font(paths, 'GeoRound', optimize=optimize)
+        return save_variable_font(vf, output_path, formats, list(paths.values()))
+
+
+# ============================================
+# 정적 굵기 파일 병합
+# ============================================
+
+def static_families(font_dir=FONT_DIR):
+    """fonts/ 에서 굵기 파일이 2개 이상인 패밀리 - {패밀리: {wght: 경로}}"""
+    families = {}
+    for path in sorted(glob.glob(os.path.join(font_dir, '*-*.ttf'))):
+        stem = os.path.splitext(os.path.basename(path))[0]
+        family, style = stem.split('-', 1)
+        if style == 'VF':
+            continue
+        font = TTFont(path, lazy=True)
+        weight = font['OS/2'].usWeightClass
+        font.close()
+        families.setdefault(family, {})[weight] = path
+    return {family: paths for family, paths in families.items() if len(paths) > 1}
+
+
+def check_family(paths):
+    """(호환되지 않는 글리프 수, 전체 글리프 수)"""
+    fonts = [TTFont(path) for path in paths.values()]
+    bad = incompatible_glyphs(fonts)
+    total = len(fonts[0].getGlyphOrder())
+    for font in fonts:
+        font.close()
+    return len(bad), total
+
+
+def merge_family(family, paths, output_dir=OUTPUT_DIR, formats=('ttf',), optimize=True):
+    """정적 굵기 파일을 가변 폰트 하나로 병합 (윤곽선이 호환되지 않으면 ValueError)"""
+    vf = build_variable_font(paths, family, optimize=optimize)
+    output_path = os.path.join(output_dir, f'{family}-VF.ttf')
+    return save_variable_font(vf, output_path, formats, list(paths.values()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가변 폰트(wght 축) 빌드')
+    parser.add_argument('--merge', nargs='+', metavar='FAMILY',
+                        help='fonts/ 의 정적 굵기 파일을 병합할 패밀리 (예: GothicA1)')
+    parser.add_argument('--check', action='store_true',
+                        help='정적 굵기 패밀리의 마스터 호환성만 검사')
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help='출력 디렉터리')
+    parser.add_argument('--formats', nargs='+', default=['ttf'],
+                        choices=('ttf', 'woff', 'woff2'),
+                        help='출력 형식 (예: --formats ttf woff2)')
+    parser.add_argument('--no-optimize', action='store_true',
+                        help='gvar 델타 IUP 최적화를 건너뜀 (비교용)')
+    parser.add_argument('-j', '--jobs', type=positive_int, default=os.cpu_count(),
+                        help='마스터 빌드 프로세스 수 (기본: CPU 코어 수)')
+    args = parser.parse_args()
+    formats = font_export.check_formats(args.formats)
+    optimize = not args.no_optimize
+
+    print("=" * 60)
+    print("  가변 폰트(wght) 빌드")
+    print("=" * 60)
+    print()
+
+    if args.check:
+        for family, paths in static_families().items():
+            bad, total = check_family(paths)
+            state = '✅ 병합 가능' if not bad else f'⚠️  호환되지 않는 글리프 {bad:,}/{total:,}개'
+            print(f"{family:<16} {sorted(paths)}  {state}")
+        return 0
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    started = time.perf_counter()
+    failed = 0
+    if args.merge:
+        families = static_families()
+        for family in args.merge:
+            if family not in families:
+                print(f"⚠️  {family}: 굵기 파일이 2개 이상인 패밀리가 아님")
+                failed += 1
+                continue
+            print(f"🔀 {family} {sorted(families[family])} 병합 중...")
+            try:
+                merge_family(family, families[family], args.output_dir, formats, optimize)
+            except ValueError as e:
+                print(f"❌ {e}")
+                failed += 1
+    else:
+        print(f"🔀 GeoRound 마스터 {sorted(GEOROUND_MASTERS)} 빌드 및 병합 중...")
+        build_georound(os.path.join(args.output_dir, os.path.basename(GEOROUND_OUTPUT)),
+                       formats, optimize, args.jobs)
+
+    print()
+    print(f"⏱️  {time.perf_counter() - started:.1f}s")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())